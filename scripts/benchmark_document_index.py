@@ -0,0 +1,125 @@
+"""Benchmark the local document full-text index on a synthetic corpus.
+
+Generates `--files` synthetic markdown documents (random paragraphs over a
+fixed vocabulary, spread over nested directories), then reports
+
+- full index build time
+- a no-change incremental update (mtime/size scan only)
+- an incremental update after modifying, adding and deleting a few files
+- query latency percentiles over `--queries` random 2-4 term queries
+
+The corpus goes to a temporary directory unless `--dir` is given; the index
+is written next to it (`--memory` keeps it in memory).
+
+Usage:
+    python scripts/benchmark_document_index.py --files 10000 --queries 200
+    python scripts/benchmark_document_index.py --files 2000 --memory
+"""
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parents[1]
+src = repo_root / "src"
+if str(src) not in sys.path:
+    sys.path.insert(0, str(src))
+
+os.environ.setdefault("OPENAI_API_KEY", "offline-benchmark")
+
+from deep_research_from_scratch.document_index import DocumentIndex
+from deep_research_from_scratch.instrumentation import PERCENTILES, percentile
+from research_agent_framework.config import get_console
+
+TOPICS = ["coffee", "solar", "battery", "transit", "housing", "water", "wind", "grid", "climate", "tariff",
+          "zoning", "bakery", "roaster", "espresso", "subsidy", "storage", "rail", "bicycle", "harbor", "permit"]
+WORDS = ["the", "city", "report", "growth", "market", "price", "year", "local", "new", "policy", "study", "data",
+         "capacity", "demand", "supply", "district", "survey", "estimate", "council", "budget", "project", "plan",
+         "cost", "share", "rate", "average", "million", "public", "private", "network"]
+
+
+def generate_corpus(root: Path, files: int, seed: int = 0) -> None:
+    """Write `files` synthetic markdown notes under `root`."""
+    rng = random.Random(seed)
+    vocabulary = WORDS + TOPICS
+    for i in range(files):
+        directory = root / f"section_{i % 50:02d}" / f"part_{i % 7}"
+        directory.mkdir(parents=True, exist_ok=True)
+        topic = rng.choice(TOPICS)
+        paragraphs = []
+        for _ in range(rng.randint(3, 12)):
+            sentence_count = rng.randint(2, 6)
+            sentences = [" ".join(rng.choice(vocabulary) for _ in range(rng.randint(8, 18))).capitalize() + "." for _ in range(sentence_count)]
+            paragraphs.append(" ".join(sentences).replace("the", topic, 1))
+        (directory / f"doc_{i:05d}.md").write_text(f"# {topic.title()} note {i}\n\n" + "\n\n".join(paragraphs) + "\n", encoding="utf-8")
+
+
+def random_queries(count: int, seed: int = 1):
+    """Return `count` random 2-4 word queries over the corpus vocabulary."""
+    rng = random.Random(seed)
+    return [" ".join(rng.sample(TOPICS + WORDS, rng.randint(2, 4))) for _ in range(count)]
+
+
+def timed(operation):
+    """Run `operation` and return (result, elapsed seconds)."""
+    start = time.perf_counter()
+    result = operation()
+    return result, time.perf_counter() - start
+
+
+def main():
+    """Build the corpus, index it, and report indexing and query latencies."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=10000, help="synthetic documents to generate")
+    parser.add_argument("--queries", type=int, default=200, help="queries to time")
+    parser.add_argument("--chunk-lines", type=int, default=40, help="lines per indexed passage")
+    parser.add_argument("--dir", type=Path, default=None, help="corpus directory (default: a temporary directory)")
+    parser.add_argument("--memory", action="store_true", help="keep the index in memory instead of a SQLite file")
+    args = parser.parse_args()
+
+    console = get_console()
+    workdir = args.dir or Path(tempfile.mkdtemp(prefix="document-index-bench-"))
+    corpus = workdir / "files"
+    try:
+        if not corpus.exists():
+            _, seconds = timed(lambda: generate_corpus(corpus, args.files))
+            console.print(f"Generated {args.files} files in {seconds:.2f}s under {corpus}")
+
+        index = DocumentIndex(corpus, path=None if args.memory else workdir / "index.sqlite", chunk_lines=args.chunk_lines)
+        counts, build_s = timed(index.update)
+        stats = index.stats()
+        console.print(f"Full build:          {build_s:8.2f}s  ({counts['added']} files, {stats['passages']} passages, {counts['added'] / build_s:,.0f} files/s)")
+
+        counts, noop_s = timed(index.update)
+        console.print(f"No-change update:    {noop_s * 1000:8.1f} ms ({counts['unchanged']} unchanged)")
+
+        changed = sorted(corpus.rglob("*.md"))[:30]
+        for path in changed[:20]:
+            path.write_text(path.read_text(encoding="utf-8") + "\nAddendum about espresso tariffs.\n", encoding="utf-8")
+        for path in changed[20:]:
+            path.unlink()
+        for i in range(10):
+            (corpus / f"added_{i}.md").write_text(f"# Added {i}\n\nFresh notes on harbor permits.\n", encoding="utf-8")
+        counts, incremental_s = timed(index.update)
+        console.print(f"Incremental update:  {incremental_s * 1000:8.1f} ms ({counts})")
+
+        latencies = []
+        hits = 0
+        for query in random_queries(args.queries):
+            results, seconds = timed(lambda: index.search(query, limit=8))
+            latencies.append(seconds * 1000)
+            hits += bool(results)
+        summary = "  ".join(f"p{p} {percentile(latencies, p):6.2f} ms" for p in PERCENTILES)
+        console.print(f"Query latency:       {summary}  mean {sum(latencies) / len(latencies):6.2f} ms  ({hits}/{args.queries} with hits)")
+        index.close()
+    finally:
+        if args.dir is None:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Benchmark per-turn MCP tool overhead with and without the tool catalog cache.
+
+Every turn of the MCP researcher lists the server's tools and binds them to
+the model in `llm_call`, then lists them again in `tool_node`. This script
+times that per-turn overhead (no model or tool calls) for
+
+- uncached: `get_tools()` + `bind_tools()` in llm_call and `get_tools()` in tool_node
+- cached: `ToolCatalog.bound_model()` + `ToolCatalog.tools_by_name()`
+
+By default the MCP server is simulated: listing tools costs `--ipc-ms`
+milliseconds (a stdio session start plus tools/list round-trip) and returns
+`--tools` tools. With `--real`, the filesystem server from
+`research_agent_mcp.mcp_config` is started through npx for every listing.
+
+Usage:
+    python scripts/benchmark_mcp_tool_catalog.py --turns 20 --ipc-ms 150
+    python scripts/benchmark_mcp_tool_catalog.py --turns 5 --real
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parents[1]
+src = repo_root / "src"
+if str(src) not in sys.path:
+    sys.path.insert(0, str(src))
+
+os.environ.setdefault("OPENAI_API_KEY", "offline-benchmark")
+
+from langchain.chat_models import init_chat_model
+from langchain_core.tools import StructuredTool
+from pydantic import BaseModel, Field
+
+from deep_research_from_scratch.mcp_catalog import ToolCatalog
+from deep_research_from_scratch.utils import think_tool
+from research_agent_framework.config import get_console
+
+
+class PathArgs(BaseModel):
+    """Arguments of the simulated filesystem tools."""
+    path: str = Field(description="Path of the file or directory")
+    head: int = Field(default=0, description="Only return the first N lines")
+
+
+def simulated_loader(tool_count: int, ipc_s: float):
+    """Return a tool loader that sleeps `ipc_s` per listing, like an MCP round-trip."""
+    def make_tool(i: int):
+        async def call(path: str, head: int = 0) -> str:
+            return path
+        return StructuredTool.from_function(coroutine=call, name=f"fs_tool_{i}", description=f"Filesystem operation {i}.", args_schema=PathArgs)
+
+    tools = [make_tool(i) for i in range(tool_count)]
+
+    async def load(server_name=None):
+        await asyncio.sleep(ipc_s)
+        return list(tools)
+
+    return load
+
+
+def real_loader():
+    """Return a tool loader listing the configured MCP servers' tools."""
+    from langchain_mcp_adapters.client import MultiServerMCPClient
+
+    from deep_research_from_scratch.research_agent_mcp import mcp_config
+    client = MultiServerMCPClient(mcp_config)
+
+    async def load(server_name=None):
+        return await client.get_tools(server_name=server_name)
+
+    return load
+
+
+async def uncached_turn(load, model):
+    """Simulate one researcher turn without the catalog (two listings and a bind)."""
+    # llm_call: list + bind; tool_node: list again
+    tools = await load() + [think_tool]
+    model.bind_tools(tools)
+    tools = await load() + [think_tool]
+    return {tool.name: tool for tool in tools}
+
+
+async def cached_turn(catalog, model):
+    """Simulate one researcher turn served by `catalog`."""
+    await catalog.bound_model(model)
+    return await catalog.tools_by_name()
+
+
+async def measure(turn, turns: int):
+    """Run `turn` `turns` times and return the per-turn durations."""
+    timings = []
+    for _ in range(turns):
+        start = time.perf_counter()
+        await turn()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+async def run(args):
+    """Time uncached and cached turns; return both timings and the catalog."""
+    load = real_loader() if args.real else simulated_loader(args.tools, args.ipc_ms / 1000)
+    model = init_chat_model(model="openai:gpt-4.1")
+
+    uncached = await measure(lambda: uncached_turn(load, model), args.turns)
+    catalog = ToolCatalog(["filesystem"], load, extra_tools=[think_tool])
+    cached = await measure(lambda: cached_turn(catalog, model), args.turns)
+    return uncached, cached, catalog
+
+
+def main():
+    """Parse arguments, run the benchmark and print the latency comparison."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=20, help="researcher turns to simulate")
+    parser.add_argument("--tools", type=int, default=11, help="tools exposed by the simulated server")
+    parser.add_argument("--ipc-ms", type=float, default=150.0, help="simulated cost of one tool listing in milliseconds")
+    parser.add_argument("--real", action="store_true", help="list tools from the real filesystem MCP server (needs npx and network access)")
+    args = parser.parse_args()
+
+    uncached, cached, catalog = asyncio.run(run(args))
+    console = get_console()
+    source = "filesystem server via npx" if args.real else f"simulated server ({args.tools} tools, {args.ipc_ms:.0f} ms per listing)"
+    console.print(f"Per-turn MCP tool overhead over {args.turns} turns, {source}")
+    for label, timings in (("uncached", uncached), ("cached", cached)):
+        console.print(
+            f"  {label:<9} total {sum(timings):8.3f}s  mean {statistics.mean(timings) * 1000:8.2f} ms"
+            f"  median {statistics.median(timings) * 1000:8.2f} ms  first {timings[0] * 1000:8.2f} ms"
+        )
+    console.print(f"  catalog loads {catalog.loads}, cache hits {catalog.hits}")
+    if sum(cached):
+        console.print(f"  speedup {sum(uncached) / sum(cached):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
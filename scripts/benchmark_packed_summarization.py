@@ -0,0 +1,128 @@
+"""Benchmark packed (multi-document) vs per-page webpage summarization.
+
+Summarizes the same set of pages twice with a simulated summarization model,
+once one request per page and once with `summarize_webpages_packed_async`,
+and reports the number of requests, the requests saved and the wall-clock
+latency of both modes. The simulated model charges a fixed per-request
+overhead plus a per-token cost, which is what packing amortizes.
+
+Usage:
+    python scripts/benchmark_packed_summarization.py --pages 24 --overhead 0.2
+"""
+import argparse
+import asyncio
+import os
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parents[1]
+src = repo_root / "src"
+if str(src) not in sys.path:
+    sys.path.insert(0, str(src))
+
+os.environ.setdefault("OPENAI_API_KEY", "offline-benchmark")
+
+from deep_research_from_scratch import utils
+from deep_research_from_scratch.chunking import count_tokens
+from deep_research_from_scratch.state_research import (
+    DocumentSummary,
+    MultiDocumentSummary,
+    Summary,
+)
+from research_agent_framework.config import get_console, get_settings
+
+
+class SimulatedStructuredModel:
+    """Structured-output model whose latency grows with the prompt size."""
+    def __init__(self, owner, schema):
+        """Answer with `schema` on behalf of `owner`, which holds the latency model."""
+        self.owner = owner
+        self.schema = schema
+
+    async def ainvoke(self, messages):
+        """Sleep for the simulated latency and return a placeholder `schema` response."""
+        prompt = messages[0].content
+        self.owner.requests += 1
+        await asyncio.sleep(self.owner.overhead + count_tokens(prompt) * self.owner.seconds_per_token)
+        if self.schema is Summary:
+            return Summary(summary="summary", key_excerpts="excerpt")
+        ids = [int(i) for i in re.findall(r'<document id="(\d+)">', prompt)]
+        return MultiDocumentSummary(summaries=[DocumentSummary(document_id=i, summary="summary", key_excerpts="excerpt") for i in ids])
+
+
+class SimulatedSummarizationModel:
+    """Stand-in summarization model counting the requests made to it."""
+    def __init__(self, overhead: float, seconds_per_token: float):
+        """Simulate `overhead` seconds per request plus `seconds_per_token` per prompt token."""
+        self.overhead = overhead
+        self.seconds_per_token = seconds_per_token
+        self.requests = 0
+
+    def with_structured_output(self, schema):
+        """Return a simulated model answering with `schema`."""
+        return SimulatedStructuredModel(self, schema)
+
+
+def sample_pages(count: int, seed: int = 0) -> dict:
+    """Pages of varied size, mostly small/medium with an occasional large one."""
+    rng = random.Random(seed)
+    words = "coffee roast espresso district price owner menu review open hours latte bean".split()
+    pages = {}
+    for i in range(count):
+        size = rng.choice([150, 300, 600, 1200]) if i % 8 else 6000
+        pages[f"https://example.com/page-{i}"] = " ".join(rng.choice(words) for _ in range(size))
+    return pages
+
+
+async def run(pages: dict, model: SimulatedSummarizationModel, concurrency: int) -> None:
+    """Summarize `pages` unpacked, then packed, and print the comparison."""
+    console = get_console()
+    utils.summarization_model = model
+    utils.get_summary_cache = lambda: None
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def single(content: str) -> str:
+        async with semaphore:
+            return await utils.summarize_webpage_content_async(content)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(single(content) for content in pages.values()))
+    unpacked_s = time.perf_counter() - start
+    unpacked_requests = model.requests
+
+    model.requests = 0
+    _, report = await utils.summarize_webpages_packed_async(pages, max_concurrency=concurrency)
+
+    console.print(f"pages={len(pages)} concurrency={concurrency}")
+    console.print(f"unpacked: {unpacked_requests} requests in {unpacked_s:.2f}s")
+    console.print(
+        f"packed:   {report.requests} requests ({report.packed_requests} packed, {report.single_requests} single) "
+        f"in {report.elapsed_s:.2f}s"
+    )
+    console.print(
+        f"requests saved: {report.requests_saved} ({report.requests_saved / max(report.unpacked_requests, 1):.0%}), "
+        f"latency ratio {report.elapsed_s / max(unpacked_s, 1e-9):.2f}x"
+    )
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=24)
+    parser.add_argument("--overhead", type=float, default=0.2, help="Simulated fixed latency per request (s)")
+    parser.add_argument("--seconds-per-token", type=float, default=0.00002)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    settings = get_settings()
+    settings.summary_packing_enabled = True
+    model = SimulatedSummarizationModel(args.overhead, args.seconds_per_token)
+    asyncio.run(run(sample_pages(args.pages), model, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark the BM25 relevance pre-filter applied before webpage summarization.
+
+Reports, per sample page, the size before and after `filter_relevant_passages`,
+the reduction ratio (in characters and estimated tokens) and the filter time.
+By default sample pages are synthesized from the bundled research file wrapped
+in typical webpage boilerplate; pass `--pages DIR` to use your own .md/.txt files.
+
+Usage:
+    python scripts/benchmark_relevance_filter.py --query "best coffee shops in SOMA" --budget 4000
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parents[1]
+src = repo_root / "src"
+if str(src) not in sys.path:
+    sys.path.insert(0, str(src))
+
+from deep_research_from_scratch.chunking import count_tokens
+from deep_research_from_scratch.relevance import filter_relevant_passages
+from research_agent_framework.config import get_console
+
+BOILERPLATE = [
+    "Home | About | Blog | Careers | Contact | Press | Sitemap",
+    "We use cookies to improve your experience. By continuing to browse you accept our cookie policy.",
+    "Subscribe to our newsletter for weekly deals, exclusive offers and partner promotions.",
+    "Related articles: Ten gadgets for your kitchen. Our favourite hiking trails this autumn.",
+    "Copyright 2025 Example Media Group. All rights reserved. Terms of service. Privacy policy.",
+    "Advertisement: refinance your mortgage today with rates starting from 5.9 percent APR.",
+    "Share this page on social media. Follow us for updates and giveaways.",
+]
+
+
+def synthetic_pages(seed: int = 0) -> dict:
+    """Wrap the bundled research file in increasing amounts of boilerplate."""
+    rng = random.Random(seed)
+    article = (src / "deep_research_from_scratch" / "files" / "coffee_shops_sf.md").read_text(encoding="utf-8")
+    pages = {}
+    for noise in (10, 50, 200):
+        before = "\n\n".join(rng.choice(BOILERPLATE) for _ in range(noise))
+        after = "\n\n".join(rng.choice(BOILERPLATE) for _ in range(noise))
+        pages[f"synthetic-noise-{noise}"] = f"{before}\n\n{article}\n\n{after}"
+    return pages
+
+
+def main() -> None:
+    """Parse arguments and report how much pre-filtering shrinks each page."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--query", default="best coffee shops in San Francisco SOMA roasters")
+    parser.add_argument("--budget", type=int, default=4000, help="Character budget passed to the filter")
+    parser.add_argument("--pages", type=Path, default=None, help="Directory of .md/.txt sample pages")
+    args = parser.parse_args()
+
+    if args.pages:
+        pages = {p.name: p.read_text(encoding="utf-8") for p in sorted(args.pages.iterdir()) if p.suffix in (".md", ".txt")}
+    else:
+        pages = synthetic_pages()
+
+    console = get_console()
+    console.print(f"query={args.query!r} budget={args.budget} chars")
+    total_before = total_after = 0
+    for name, text in pages.items():
+        start = time.perf_counter()
+        filtered = filter_relevant_passages(text, args.query, args.budget)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        before_tokens, after_tokens = count_tokens(text), count_tokens(filtered)
+        total_before += before_tokens
+        total_after += after_tokens
+        console.print(
+            f"{name}: {len(text)} -> {len(filtered)} chars, ~{before_tokens} -> ~{after_tokens} tokens "
+            f"(reduction {1 - after_tokens / max(before_tokens, 1):.1%}, {elapsed_ms:.2f} ms)"
+        )
+    console.print(f"overall token reduction: {1 - total_after / max(total_before, 1):.1%}")
+
+
+if __name__ == "__main__":
+    main()
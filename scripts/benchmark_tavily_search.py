@@ -0,0 +1,60 @@
+"""Offline benchmark: sequential vs concurrent multi-query Tavily search.
+
+Uses the mock Tavily clients (fixed per-request latency, no network) to compare
+`tavily_search_multiple` with `tavily_search_multiple_async`.
+
+Usage:
+    python scripts/benchmark_tavily_search.py --queries 5 --latency 0.2 --concurrency 5
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parents[1]
+src = repo_root / "src"
+if str(src) not in sys.path:
+    sys.path.insert(0, str(src))
+
+# Module import constructs (but never calls) the summarization model
+os.environ.setdefault("OPENAI_API_KEY", "offline-benchmark")
+
+from deep_research_from_scratch import utils
+from research_agent_framework.adapters.search.mock_tavily_client import (
+    MockAsyncTavilyClient,
+    MockTavilyClient,
+)
+from research_agent_framework.config import get_console
+
+
+def main() -> None:
+    """Parse arguments and time sequential against concurrent searches."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--queries", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.2, help="Simulated seconds per search request")
+    parser.add_argument("--concurrency", type=int, default=utils.max_search_concurrency)
+    args = parser.parse_args()
+
+    queries = [f"benchmark query {i}" for i in range(args.queries)]
+
+    utils.tavily_client = MockTavilyClient(latency=args.latency)
+    start = time.perf_counter()
+    utils.tavily_search_multiple(queries)
+    sequential_s = time.perf_counter() - start
+
+    client = MockAsyncTavilyClient(latency=args.latency)
+    start = time.perf_counter()
+    asyncio.run(utils.tavily_search_multiple_async(queries, max_concurrency=args.concurrency, client=client))
+    concurrent_s = time.perf_counter() - start
+
+    console = get_console()
+    console.print(f"queries={args.queries} latency={args.latency}s concurrency={args.concurrency}")
+    console.print(f"sequential: {sequential_s:.3f}s")
+    console.print(f"concurrent: {concurrent_s:.3f}s (peak in-flight {client.max_in_flight})")
+    console.print(f"speedup:    {sequential_s / concurrent_s:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
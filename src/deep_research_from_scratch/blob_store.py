@@ -0,0 +1,300 @@
+"""Content-Addressed Blob Store for Large Notes.
+
+Researchers produce multi-megabyte `raw_notes` that would otherwise be
+copied through every `operator.add` state merge and checkpoint. This module
+keeps such text out of line: the state carries a short reference
+(``blob:<sha256>``) and the text lives in a shared store, in memory with an
+optional spill directory on disk. References are resolved only when
+something actually reads the notes (see `resolve_notes`).
+
+The store is off by default (`Settings.blob_store_enabled`): anything that
+reads `raw_notes` must resolve the references first. Blobs are owned by
+the supervisor run that stored them (`blob_run_scope`) and dropped from
+memory when it ends (`release_run_blobs`). Without a spill directory the
+memory tier never grows past `max_memory_bytes`; notes that don't fit
+simply stay inline.
+
+Several notes can be referenced at once with a compound reference
+(``blob:<sha256>+<sha256>+...``), which resolves to the texts joined by
+newlines, so concatenating notes never forces them to be loaded.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Union
+
+BLOB_PREFIX = "blob:"
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+def is_blob_ref(value: object) -> bool:
+    """Whether `value` is a (possibly compound) blob reference."""
+    if not isinstance(value, str) or not value.startswith(BLOB_PREFIX):
+        return False
+    digests = value[len(BLOB_PREFIX):].split("+")
+    return all(len(digest) == 64 and set(digest) <= _HEX_DIGITS for digest in digests)
+
+class BlobStore:
+    """Content-addressed text store with an LRU memory tier and optional disk spill.
+
+    Every blob is held on behalf of owners (supervisor run ids, or None for
+    blobs stored outside any run); `release` drops a run's blobs from memory
+    once no other owner holds them.
+
+    Args:
+        max_memory_bytes: Size of the in-memory tier; least recently used
+            blobs beyond it are written to `spill_dir` (without a spill
+            directory, `try_put` refuses blobs that would not fit)
+        spill_dir: Optional directory receiving spilled blobs
+        write_through: Also write every new blob to `spill_dir` right away,
+            so references stay resolvable after a crash (used with checkpointing)
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int = 256 * 1024 * 1024,
+        spill_dir: Optional[Union[str, Path]] = None,
+        write_through: bool = False,
+    ):
+        """Create an empty store, creating `spill_dir` if given."""
+        self.max_memory_bytes = max_memory_bytes
+        self.spill_dir = Path(spill_dir) if spill_dir is not None else None
+        self.write_through = write_through
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_bytes = 0
+        self._owned: Dict[Optional[str], Set[str]] = {}
+        self._owner_counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        if self.spill_dir is not None:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+
+    def __contains__(self, ref: str) -> bool:
+        """Return whether the blob of `ref` is in memory or spilled to disk."""
+        digest = self._digest(ref)
+        with self._lock:
+            return digest in self._memory or self._on_disk(digest)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Return the size of the blobs currently held in memory."""
+        return self._memory_bytes
+
+    def try_put(self, text: str, owner: Optional[str] = None) -> Optional[str]:
+        """Store `text` for `owner` and return its reference (idempotent for equal text).
+
+        Returns:
+            The reference, or None when the memory tier is full and there is
+            no spill directory to make room in
+        """
+        data = text.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            if digest in self._memory:
+                self._memory.move_to_end(digest)
+            elif not self._on_disk(digest):
+                if self.spill_dir is None and self._memory_bytes + len(data) > self.max_memory_bytes:
+                    return None
+                self._memory[digest] = data
+                self._memory_bytes += len(data)
+                if self.write_through:
+                    self._write(digest, data)
+                self._spill_over_budget()
+            owned = self._owned.setdefault(owner, set())
+            if digest not in owned:
+                owned.add(digest)
+                self._owner_counts[digest] = self._owner_counts.get(digest, 0) + 1
+        return BLOB_PREFIX + digest
+
+    def put(self, text: str, owner: Optional[str] = None) -> str:
+        """Store `text` for `owner` and return its reference (see `try_put`).
+
+        Raises:
+            MemoryError: If the memory tier is full and there is no spill directory
+        """
+        ref = self.try_put(text, owner)
+        if ref is None:
+            raise MemoryError(f"Blob store is full ({self.max_memory_bytes} bytes) and has no spill directory")
+        return ref
+
+    def release(self, owner: str) -> int:
+        """Drop the in-memory blobs only `owner` holds (spilled files are kept).
+
+        Returns:
+            Number of blobs dropped from memory
+        """
+        dropped = 0
+        with self._lock:
+            for digest in self._owned.pop(owner, ()):
+                remaining = self._owner_counts.pop(digest) - 1
+                if remaining:
+                    self._owner_counts[digest] = remaining
+                    continue
+                data = self._memory.pop(digest, None)
+                if data is not None:
+                    self._memory_bytes -= len(data)
+                    dropped += 1
+        return dropped
+
+    def get(self, ref: str) -> str:
+        """Return the text of a (possibly compound) reference.
+
+        Raises:
+            KeyError: If a referenced blob is not in the store
+        """
+        if not is_blob_ref(ref):
+            raise KeyError(f"Not a blob reference: {ref[:80]!r}")
+        return "\n".join(self._get_one(digest) for digest in ref[len(BLOB_PREFIX):].split("+"))
+
+    def flush(self) -> None:
+        """Write every in-memory blob to the spill directory (no-op without one)."""
+        if self.spill_dir is None:
+            return
+        with self._lock:
+            for digest, data in self._memory.items():
+                self._write(digest, data)
+
+    def clear(self) -> None:
+        """Drop all in-memory blobs and owners (spilled files are kept)."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            self._owned.clear()
+            self._owner_counts.clear()
+
+    def _get_one(self, digest: str) -> str:
+        with self._lock:
+            data = self._memory.get(digest)
+            if data is not None:
+                self._memory.move_to_end(digest)
+                return data.decode("utf-8")
+        path = self._spill_path(digest)
+        if path is not None and path.exists():
+            return path.read_bytes().decode("utf-8")
+        raise KeyError(f"Blob not found: {BLOB_PREFIX}{digest}")
+
+    @staticmethod
+    def _digest(ref: str) -> str:
+        return ref[len(BLOB_PREFIX):] if ref.startswith(BLOB_PREFIX) else ref
+
+    def _spill_path(self, digest: str) -> Optional[Path]:
+        return self.spill_dir / digest[:2] / digest if self.spill_dir is not None else None
+
+    def _on_disk(self, digest: str) -> bool:
+        path = self._spill_path(digest)
+        return path is not None and path.exists()
+
+    def _write(self, digest: str, data: bytes) -> None:
+        path = self._spill_path(digest)
+        if path is None or path.exists():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+
+    def _spill_over_budget(self) -> None:
+        """Move least recently used blobs to the spill directory until memory fits the budget."""
+        if self.spill_dir is None:
+            return
+        while self._memory_bytes > self.max_memory_bytes and len(self._memory) > 1:
+            digest, data = self._memory.popitem(last=False)
+            self._write(digest, data)
+            self._memory_bytes -= len(data)
+
+# ===== SHARED STORE =====
+
+_blob_store: Optional[BlobStore] = None
+_blob_store_lock = threading.Lock()
+
+# Supervisor run on whose behalf notes are stored in the current context
+_current_run: ContextVar[Optional[str]] = ContextVar("blob_store_run", default=None)
+
+def get_blob_store() -> Optional[BlobStore]:
+    """Return the shared blob store, or None when `Settings.blob_store_enabled` is off.
+
+    With `Settings.checkpoint_enabled`, blobs are written through to disk
+    (next to the checkpoint database unless `blob_store_spill_dir` is set) so
+    checkpointed references survive a crash.
+    """
+    global _blob_store
+    from research_agent_framework.config import get_settings
+    settings = get_settings()
+    if not settings.blob_store_enabled:
+        return None
+    with _blob_store_lock:
+        if _blob_store is None:
+            spill_dir = settings.blob_store_spill_dir
+            if settings.checkpoint_enabled and spill_dir is None:
+                spill_dir = Path(settings.checkpoint_path).parent / "blobs"
+            _blob_store = BlobStore(
+                max_memory_bytes=settings.blob_store_max_memory_bytes,
+                spill_dir=spill_dir,
+                write_through=settings.checkpoint_enabled,
+            )
+        return _blob_store
+
+@contextmanager
+def blob_run_scope(run_id: Optional[str]) -> Iterator[None]:
+    """Store notes created inside the block (and tasks spawned) on behalf of run `run_id`."""
+    token = _current_run.set(run_id)
+    try:
+        yield
+    finally:
+        _current_run.reset(token)
+
+def release_run_blobs(run_id: str) -> int:
+    """Drop the blobs of a finished supervisor run from the shared store's memory.
+
+    Returns:
+        Number of blobs dropped
+    """
+    store = _blob_store
+    return store.release(run_id) if store is not None else 0
+
+def store_note(text: str) -> str:
+    """Return a reference for a note of at least `Settings.blob_store_min_bytes`, else the note itself.
+
+    The note also stays inline when the store's memory tier is full.
+    """
+    store = get_blob_store()
+    if store is None:
+        return text
+    from research_agent_framework.config import get_settings
+    if len(text) < get_settings().blob_store_min_bytes:
+        return text
+    ref = store.try_put(text, _current_run.get())
+    return ref if ref is not None else text
+
+def join_notes(notes: Iterable[str]) -> str:
+    """Join notes with newlines without loading referenced blobs.
+
+    If any note is a blob reference, the result is a compound reference
+    (inline notes are stored first); otherwise it is the plain joined text.
+    If the store has no room for the inline notes, the referenced notes are
+    loaded and joined as plain text instead.
+    """
+    notes = list(notes)
+    store = get_blob_store()
+    if store is None or not any(is_blob_ref(note) for note in notes):
+        return "\n".join(notes)
+    owner = _current_run.get()
+    refs = [note if is_blob_ref(note) else store.try_put(note, owner) for note in notes]
+    if any(ref is None for ref in refs):
+        return "\n".join(resolve_notes(notes, store))
+    return BLOB_PREFIX + "+".join(ref[len(BLOB_PREFIX):] for ref in refs)
+
+def resolve_note(note: str, store: Optional[BlobStore] = None) -> str:
+    """Return the text of `note`, loading it from the blob store if it is a reference."""
+    if not is_blob_ref(note):
+        return note
+    store = store or get_blob_store() or _blob_store
+    if store is None:
+        raise KeyError(f"Blob store is disabled; cannot resolve {note[:80]!r}")
+    return store.get(note)
+
+def resolve_notes(notes: Iterable[str], store: Optional[BlobStore] = None) -> List[str]:
+    """Resolve every note of a `raw_notes` list (see `resolve_note`)."""
+    return [resolve_note(note, store) for note in notes]
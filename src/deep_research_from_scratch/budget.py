@@ -0,0 +1,101 @@
+"""Per-Researcher Budget Controller.
+
+This module bounds how much one researcher may spend before it must stop
+searching and compress its findings: tool-call iterations, cumulative input
+and output tokens of its model calls, and elapsed wall-clock time.
+
+Limits default to `Settings.researcher_max_*` and can be overridden per run
+through the LangGraph config, e.g.::
+
+    await researcher_agent.ainvoke(
+        state,
+        config={"configurable": {"research_budget": {"max_tool_call_iterations": 3}}},
+    )
+
+A limit of None is unlimited.
+"""
+
+import time
+from dataclasses import asdict, dataclass, fields, replace
+from typing import Any, Mapping, Optional
+
+# Usage counters tracked in ResearcherState, checked against the limit of the same suffix
+_USAGE_LIMITS = (
+    ("tool_call_iterations", "max_tool_call_iterations"),
+    ("input_tokens", "max_input_tokens"),
+    ("output_tokens", "max_output_tokens"),
+    ("elapsed_s", "max_elapsed_s"),
+)
+
+@dataclass(frozen=True)
+class ResearchBudget:
+    """Limits for one researcher run (None means unlimited)."""
+    max_tool_call_iterations: Optional[int] = None
+    max_input_tokens: Optional[int] = None
+    max_output_tokens: Optional[int] = None
+    max_elapsed_s: Optional[float] = None
+
+    @classmethod
+    def from_settings(cls) -> "ResearchBudget":
+        """Build the default budget from `Settings.researcher_max_*`."""
+        from research_agent_framework.config import get_settings
+        settings = get_settings()
+        return cls(
+            max_tool_call_iterations=settings.researcher_max_tool_call_iterations,
+            max_input_tokens=settings.researcher_max_input_tokens,
+            max_output_tokens=settings.researcher_max_output_tokens,
+            max_elapsed_s=settings.researcher_max_elapsed_s,
+        )
+
+    @classmethod
+    def from_config(cls, config: Optional[Mapping[str, Any]]) -> "ResearchBudget":
+        """Resolve the budget of a run: settings defaults overridden by `configurable.research_budget`.
+
+        Args:
+            config: LangGraph/LangChain run config (may be None)
+
+        Returns:
+            The effective budget
+        """
+        budget = cls.from_settings()
+        overrides = ((config or {}).get("configurable") or {}).get("research_budget")
+        if isinstance(overrides, ResearchBudget):
+            return overrides
+        if overrides:
+            known = {f.name for f in fields(cls)}
+            unknown = set(overrides) - known
+            if unknown:
+                raise ValueError(f"Unknown research_budget keys: {sorted(unknown)}")
+            budget = replace(budget, **overrides)
+        return budget
+
+    def exceeded(self, usage: Mapping[str, float]) -> Optional[str]:
+        """Return the name of the first usage counter at or over its limit, or None.
+
+        Args:
+            usage: Mapping with `tool_call_iterations`, `input_tokens`,
+                `output_tokens` and `elapsed_s`
+        """
+        for counter, limit_name in _USAGE_LIMITS:
+            limit = getattr(self, limit_name)
+            if limit is not None and usage.get(counter, 0) >= limit:
+                return counter
+        return None
+
+def usage_from_state(state: Mapping[str, Any], now: Optional[float] = None) -> dict:
+    """Collect the usage counters of a researcher state."""
+    started_at = state.get("research_started_at") or (now or time.time())
+    return {
+        "tool_call_iterations": state.get("tool_call_iterations", 0),
+        "input_tokens": state.get("input_tokens", 0),
+        "output_tokens": state.get("output_tokens", 0),
+        "elapsed_s": (now or time.time()) - started_at,
+    }
+
+def budget_report(budget: ResearchBudget, state: Mapping[str, Any]) -> dict:
+    """Summarize limits, usage and the stop reason for `ResearcherOutputState.budget_report`."""
+    return {
+        "limits": asdict(budget),
+        "usage": usage_from_state(state),
+        "stopped_by": state.get("budget_stop_reason") or None,
+    }
@@ -0,0 +1,225 @@
+"""SQLite Checkpointing and Resume for the Research Graphs.
+
+With `Settings.checkpoint_enabled` on, the researcher, supervisor and full
+research graphs are compiled with a SQLite-backed checkpointer, so every
+completed node is persisted under the run's `thread_id`. A run that crashed
+or was interrupted is resumed from its last completed node with
+`resume_run`::
+
+    config = thread_config("report-42")
+    await agent.ainvoke({"messages": [...]}, config=config)
+    # ... process dies ...
+    await resume_run(agent, "report-42")
+
+Researchers run in parallel inside a single supervisor step, so that step
+only completes once all of them have. Each researcher therefore checkpoints
+under its own thread (`researcher_thread_id`): when the supervisor step is
+replayed, researchers that had finished return their saved result and
+interrupted ones continue from their last completed node
+(`run_checkpointed`).
+
+SQLite checkpointing needs the optional `langgraph-checkpoint-sqlite`
+package (``pip install deep_research_from_scratch[checkpoint]``).
+"""
+
+import asyncio
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Sequence, Tuple, Union
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+)
+
+
+def checkpointing_enabled() -> bool:
+    """Whether `Settings.checkpoint_enabled` is on."""
+    from research_agent_framework.config import get_settings
+    return bool(get_settings().checkpoint_enabled)
+
+def thread_config(thread_id: str, config: Optional[RunnableConfig] = None) -> RunnableConfig:
+    """Return `config` with `configurable.thread_id` set to `thread_id`."""
+    config = dict(config or {})
+    config["configurable"] = {**(config.get("configurable") or {}), "thread_id": thread_id}
+    return config
+
+def researcher_thread_id(run_id: str, tool_call_id: str) -> str:
+    """Thread id of the researcher launched by supervisor tool call `tool_call_id` in run `run_id`."""
+    return f"{run_id}:research:{tool_call_id}"
+
+# ===== CHECKPOINTER =====
+
+class SqliteCheckpointer(BaseCheckpointSaver):
+    """SQLite checkpointer usable from sync and async graphs.
+
+    Wraps LangGraph's `SqliteSaver` and runs its blocking calls in worker
+    threads for the async API, so one instance can be created at import
+    time (when the graphs are compiled) and shared by any event loop.
+
+    Args:
+        path: SQLite database file (parent directories are created)
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """Open (or create) the checkpoint database at `path`."""
+        super().__init__()
+        try:
+            from langgraph.checkpoint.sqlite import SqliteSaver
+        except ImportError as e:
+            raise ImportError(
+                "SQLite checkpointing requires 'langgraph-checkpoint-sqlite'; "
+                "install it with `pip install langgraph-checkpoint-sqlite`"
+            ) from e
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._saver = SqliteSaver(sqlite3.connect(str(self.path), check_same_thread=False), serde=self.serde)
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """Return the checkpoint tuple for `config` (latest of its thread unless it names one)."""
+        return self._saver.get_tuple(config)
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        """List checkpoints matching `config` and `filter`, newest first."""
+        return self._saver.list(config, filter=filter, before=before, limit=limit)
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Store a checkpoint and return the config pointing at it."""
+        return self._saver.put(config, checkpoint, metadata, new_versions)
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Store the pending writes of task `task_id` for the checkpoint in `config`."""
+        self._saver.put_writes(config, writes, task_id, task_path)
+
+    def delete_thread(self, thread_id: str) -> None:
+        """Delete every checkpoint and write of `thread_id`."""
+        self._saver.delete_thread(thread_id)
+
+    def get_next_version(self, current: Optional[str], channel: None) -> str:
+        """Return the channel version following `current` (same scheme as `SqliteSaver`)."""
+        return self._saver.get_next_version(current, channel)
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """Async `get_tuple`, run in a worker thread."""
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        """Async `list`; the matching checkpoints are read in a worker thread."""
+        items = await asyncio.to_thread(lambda: list(self.list(config, filter=filter, before=before, limit=limit)))
+        for item in items:
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Async `put`, run in a worker thread."""
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Async `put_writes`, run in a worker thread."""
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        """Async `delete_thread`, run in a worker thread."""
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+# ===== SHARED INSTANCE =====
+
+_checkpointer: Optional[SqliteCheckpointer] = None
+_checkpointer_lock = threading.Lock()
+
+def get_checkpointer() -> Optional[SqliteCheckpointer]:
+    """Return the shared checkpointer, or None when checkpointing is disabled."""
+    global _checkpointer
+    if not checkpointing_enabled():
+        return None
+    from research_agent_framework.config import get_settings
+    with _checkpointer_lock:
+        if _checkpointer is None:
+            _checkpointer = SqliteCheckpointer(get_settings().checkpoint_path)
+        return _checkpointer
+
+# ===== RESUME =====
+
+async def resume_run(graph: Any, thread_id: str, config: Optional[RunnableConfig] = None) -> Dict[str, Any]:
+    """Resume a checkpointed run from its last completed node.
+
+    Args:
+        graph: Graph compiled with a checkpointer (e.g. `agent` or `supervisor_agent`)
+        thread_id: Thread id the run was started with
+        config: Optional extra run config
+
+    Returns:
+        Final state of the run (returned as-is if the run had already finished)
+
+    Raises:
+        ValueError: If no checkpoint exists for `thread_id`
+    """
+    config = thread_config(thread_id, config)
+    snapshot = await graph.aget_state(config)
+    if not snapshot.values and not snapshot.next:
+        raise ValueError(f"No checkpoint found for thread {thread_id!r}")
+    if not snapshot.next:
+        return snapshot.values
+    try:
+        from research_agent_framework.config import get_logger
+        get_logger().info(f"Resuming thread {thread_id} at {', '.join(snapshot.next)}")
+    except Exception:
+        pass
+    return await graph.ainvoke(None, config=config)
+
+async def run_checkpointed(graph: Any, payload: Any, thread_id: str, config: Optional[RunnableConfig] = None) -> Dict[str, Any]:
+    """Run `graph` on `payload` under `thread_id`, reusing or resuming an earlier attempt.
+
+    Returns the saved final state if the thread already finished, continues
+    it from its last completed node if it was interrupted, and starts it
+    from `payload` otherwise.
+    """
+    config = thread_config(thread_id, config)
+    snapshot = await graph.aget_state(config)
+    if snapshot.next:
+        return await graph.ainvoke(None, config=config)
+    if snapshot.values:
+        return snapshot.values
+    return await graph.ainvoke(payload, config=config)
@@ -0,0 +1,70 @@
+"""Token-Budgeted Text Chunking.
+
+This module provides token counting and overlap-aware chunking used to
+summarize webpages that are too large for a single summarization prompt.
+
+Token counts use `tiktoken` when it is installed and its encoding can be
+loaded; otherwise they fall back to a conservative characters-per-token
+estimate so chunking still works offline.
+"""
+
+from functools import lru_cache
+from typing import Any, List, Optional
+
+# Characters per token used when no tokenizer is available
+CHARS_PER_TOKEN = 4
+
+@lru_cache(maxsize=1)
+def _get_encoding() -> Optional[Any]:
+    """Return the tiktoken encoding, or None if it cannot be loaded."""
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        return None
+
+def count_tokens(text: str) -> int:
+    """Count (or estimate) the number of tokens in `text`."""
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+def split_into_chunks(
+    text: str,
+    chunk_tokens: int,
+    overlap_tokens: int = 0,
+    max_chunks: Optional[int] = None,
+) -> List[str]:
+    """Split `text` into windows of at most `chunk_tokens` tokens.
+
+    Consecutive chunks share `overlap_tokens` tokens so facts straddling a
+    boundary survive in at least one chunk.
+
+    Args:
+        text: Text to split
+        chunk_tokens: Maximum tokens per chunk
+        overlap_tokens: Tokens repeated at the start of each following chunk
+        max_chunks: Keep at most this many leading chunks (None keeps all)
+
+    Returns:
+        List of chunk strings (a single element when `text` already fits)
+    """
+    if chunk_tokens <= 0:
+        raise ValueError("chunk_tokens must be positive")
+    overlap_tokens = max(0, min(overlap_tokens, chunk_tokens - 1))
+    step = chunk_tokens - overlap_tokens
+
+    encoding = _get_encoding()
+    if encoding is not None:
+        tokens = encoding.encode(text, disallowed_special=())
+        windows = [tokens[start:start + chunk_tokens] for start in range(0, max(len(tokens) - overlap_tokens, 1), step)]
+        chunks = [encoding.decode(window) for window in windows]
+    else:
+        size, stride = chunk_tokens * CHARS_PER_TOKEN, step * CHARS_PER_TOKEN
+        overlap = overlap_tokens * CHARS_PER_TOKEN
+        chunks = [text[start:start + size] for start in range(0, max(len(text) - overlap, 1), stride)]
+
+    if max_chunks is not None:
+        chunks = chunks[:max_chunks]
+    return chunks
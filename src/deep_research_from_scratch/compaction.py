@@ -0,0 +1,62 @@
+"""Rolling Compaction of Researcher Message History.
+
+This module keeps a researcher's prompt bounded as its history grows. Once
+the history crosses a token threshold, tool outputs older than the most
+recent tool rounds are folded into a running digest (written by a cheap
+model) and their message contents are replaced by a short placeholder. The
+tool messages themselves stay in place so every tool call keeps its result,
+which chat APIs require. The original outputs are preserved in `raw_notes`.
+"""
+
+from typing import List, Sequence, Tuple
+
+from langchain_core.messages import BaseMessage, ToolMessage
+
+from deep_research_from_scratch.chunking import count_tokens
+
+COMPACTED_PLACEHOLDER = "[Output folded into the research digest]"
+
+def message_tokens(messages: Sequence[BaseMessage]) -> int:
+    """Estimate the prompt tokens of `messages` (content only)."""
+    return sum(count_tokens(str(message.content)) for message in messages)
+
+def is_compacted(message: BaseMessage) -> bool:
+    """Whether `message` is a tool message already folded into the digest."""
+    return isinstance(message, ToolMessage) and message.content == COMPACTED_PLACEHOLDER
+
+def compaction_candidates(messages: Sequence[BaseMessage], keep_recent_rounds: int) -> List[ToolMessage]:
+    """Tool messages old enough to be folded into the digest.
+
+    Tool outputs answering the last `keep_recent_rounds` tool-calling AI
+    messages stay verbatim so the model still sees its freshest results.
+    """
+    rounds = [i for i, message in enumerate(messages) if getattr(message, "tool_calls", None)]
+    if len(rounds) <= keep_recent_rounds:
+        return []
+    cutoff = rounds[-keep_recent_rounds] if keep_recent_rounds > 0 else len(messages)
+    return [
+        message for message in messages[:cutoff]
+        if isinstance(message, ToolMessage) and not is_compacted(message)
+    ]
+
+def render_findings(messages: Sequence[ToolMessage]) -> str:
+    """Render tool outputs as the `new_findings` section of the digest prompt."""
+    return "\n\n".join(f"<{message.name or 'tool'}_output>\n{message.content}\n</{message.name or 'tool'}_output>" for message in messages)
+
+def compacted_replacements(messages: Sequence[ToolMessage]) -> Tuple[List[ToolMessage], str]:
+    """Build placeholder messages (same ids) for `messages` and the raw note preserving them."""
+    replacements = [
+        ToolMessage(content=COMPACTED_PLACEHOLDER, name=message.name, tool_call_id=message.tool_call_id, id=message.id)
+        for message in messages
+    ]
+    raw_note = "\n".join(str(message.content) for message in messages)
+    return replacements, raw_note
+
+def digest_section(digest: str) -> str:
+    """Render the running research digest for a system prompt ("" when empty)."""
+    if not digest:
+        return ""
+    return (
+        "Earlier tool outputs have been condensed into the following digest of findings so far:\n"
+        f"<research_digest>\n{digest}\n</research_digest>"
+    )
@@ -0,0 +1,272 @@
+"""Incremental Full-Text Index over the Local Research Files.
+
+The MCP researcher finds relevant passages by reading whole files, which
+does not scale past a handful of documents. `DocumentIndex` keeps a SQLite
+FTS5 index of the research files directory instead:
+
+- files are split into passages of `chunk_lines` lines, each indexed with
+  its file and line range
+- `update()` re-indexes only files whose mtime or size changed, and drops
+  deleted files
+- `search()` returns BM25-ranked passages with their absolute file path, a
+  highlighted snippet, the passage's line range and its line with the most
+  query matches
+
+`search_local_documents` exposes the index as a tool; it refreshes the index
+at most every `Settings.local_index_refresh_interval_s` seconds.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from langchain_core.tools import tool
+
+# File types indexed by default
+TEXT_EXTENSIONS = (".md", ".markdown", ".txt", ".rst", ".html", ".htm", ".csv", ".json", ".xml", ".yaml", ".yml")
+
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+@dataclass
+class DocumentHit:
+    """One ranked passage of a local document."""
+    path: str  # absolute, so file tools (e.g. the MCP filesystem server) can open it
+    start_line: int
+    end_line: int
+    line: int  # passage line with the most query matches
+    snippet: str
+    score: float
+
+def to_match_query(query: str) -> Optional[str]:
+    """FTS5 MATCH expression of a free-text query (any term, ranked by BM25); None if it has no terms."""
+    terms = list(dict.fromkeys(term.lower() for term in _TERM_RE.findall(query)))
+    return " OR ".join(f'"{term}"' for term in terms) if terms else None
+
+# Markers around matched terms in highlight() output
+_MATCH_START, _MATCH_END = "\x02", "\x03"
+
+def _best_line(highlighted: str) -> int:
+    """Offset of the passage line with the most matched terms (the first of equals)."""
+    counts = [line.count(_MATCH_START) for line in highlighted.split("\n")]
+    return counts.index(max(counts)) if counts else 0
+
+class DocumentIndex:
+    """SQLite FTS5 index of the text files under `root`.
+
+    Args:
+        root: Directory of the research files
+        path: SQLite database file; None keeps the index in memory
+        chunk_lines: Lines per indexed passage
+        extensions: File suffixes to index (case-insensitive)
+        max_file_bytes: Larger files are skipped
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        path: Optional[Union[str, Path]] = None,
+        chunk_lines: int = 40,
+        extensions: Sequence[str] = TEXT_EXTENSIONS,
+        max_file_bytes: int = 8 * 1024 * 1024,
+    ):
+        """Open (or create) the index database; files are indexed by `update`."""
+        self.root = Path(root).resolve()
+        self.chunk_lines = max(1, chunk_lines)
+        self.extensions = tuple(extension.lower() for extension in extensions)
+        self.max_file_bytes = max_file_bytes
+        self.last_update = 0.0
+        self._lock = threading.Lock()
+        if path is not None:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(path) if path is not None else ":memory:", check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL)")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS chunks ("
+            " id INTEGER PRIMARY KEY,"
+            " path TEXT NOT NULL,"
+            " start_line INTEGER NOT NULL,"
+            " end_line INTEGER NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS chunks_path ON chunks(path)")
+        self._db.execute("CREATE VIRTUAL TABLE IF NOT EXISTS passages USING fts5(content, tokenize='porter unicode61')")
+        self._db.commit()
+
+    # ===== INDEXING =====
+
+    def _scan(self) -> Iterator[Tuple[str, int, int]]:
+        """Yield (relative path, mtime_ns, size) of the indexable files under the root."""
+        stack = [self.root]
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(Path(entry.path))
+                elif entry.is_file(follow_symlinks=False) and entry.name.lower().endswith(self.extensions):
+                    info = entry.stat(follow_symlinks=False)
+                    if info.st_size <= self.max_file_bytes:
+                        yield Path(entry.path).relative_to(self.root).as_posix(), info.st_mtime_ns, info.st_size
+
+    def _passages(self, relative: str) -> Iterator[Tuple[int, int, str]]:
+        """Yield (start_line, end_line, text) passages of a file (1-based, inclusive lines)."""
+        with open(self.root / relative, encoding="utf-8", errors="replace") as f:
+            text = f.read()
+        lines = (text[:-1] if text.endswith("\n") else text).split("\n")
+        for start in range(0, len(lines), self.chunk_lines):
+            window = lines[start:start + self.chunk_lines]
+            if any(line.strip() for line in window):
+                yield start + 1, start + len(window), "\n".join(window)
+
+    def _remove(self, relative: str) -> None:
+        self._db.execute("DELETE FROM passages WHERE rowid IN (SELECT id FROM chunks WHERE path = ?)", (relative,))
+        self._db.execute("DELETE FROM chunks WHERE path = ?", (relative,))
+        self._db.execute("DELETE FROM files WHERE path = ?", (relative,))
+
+    def _add(self, relative: str, mtime_ns: int, size: int) -> None:
+        try:
+            passages = list(self._passages(relative))
+        except OSError:
+            return
+        for start_line, end_line, text in passages:
+            cursor = self._db.execute("INSERT INTO chunks (path, start_line, end_line) VALUES (?, ?, ?)", (relative, start_line, end_line))
+            self._db.execute("INSERT INTO passages (rowid, content) VALUES (?, ?)", (cursor.lastrowid, text))
+        self._db.execute("INSERT INTO files (path, mtime_ns, size) VALUES (?, ?, ?)", (relative, mtime_ns, size))
+
+    def update(self) -> Dict[str, int]:
+        """Bring the index in line with the files on disk.
+
+        Returns:
+            Counts of `added`, `updated`, `removed` and `unchanged` files
+        """
+        with self._lock:
+            indexed = {path: (mtime_ns, size) for path, mtime_ns, size in self._db.execute("SELECT path, mtime_ns, size FROM files")}
+            counts = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+            seen = set()
+            with self._db:
+                for relative, mtime_ns, size in self._scan():
+                    seen.add(relative)
+                    previous = indexed.get(relative)
+                    if previous == (mtime_ns, size):
+                        counts["unchanged"] += 1
+                        continue
+                    if previous is not None:
+                        self._remove(relative)
+                    self._add(relative, mtime_ns, size)
+                    counts["updated" if previous is not None else "added"] += 1
+                for relative in indexed.keys() - seen:
+                    self._remove(relative)
+                    counts["removed"] += 1
+            self.last_update = time.monotonic()
+        if counts["added"] or counts["updated"] or counts["removed"]:
+            try:
+                from research_agent_framework.config import get_logger
+                get_logger().info(f"Local document index updated: {counts}")
+            except Exception:
+                pass
+        return counts
+
+    def refresh(self, max_age_s: float) -> None:
+        """Update the index if the last update is older than `max_age_s` seconds."""
+        if not self.last_update or time.monotonic() - self.last_update >= max_age_s:
+            self.update()
+
+    # ===== SEARCH =====
+
+    def search(self, query: str, limit: int = 8) -> List[DocumentHit]:
+        """Return the passages best matching `query`, best first."""
+        match = to_match_query(query)
+        if match is None:
+            return []
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT c.path, c.start_line, c.end_line, snippet(passages, 0, '**', '**', '...', 16), bm25(passages),"
+                " highlight(passages, 0, ?, ?)"
+                " FROM passages JOIN chunks c ON c.id = passages.rowid"
+                " WHERE passages MATCH ? ORDER BY bm25(passages) LIMIT ?",
+                (_MATCH_START, _MATCH_END, match, limit),
+            ).fetchall()
+        return [
+            DocumentHit(
+                path=str(self.root / path),
+                start_line=start_line,
+                end_line=end_line,
+                line=start_line + _best_line(highlighted),
+                snippet=" ".join(snippet.split()),
+                score=round(-score, 4),
+            )
+            for path, start_line, end_line, snippet, score, highlighted in rows
+        ]
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of indexed files and passages."""
+        with self._lock:
+            files = self._db.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+            passages = self._db.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+        return {"files": files, "passages": passages}
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            self._db.close()
+
+def format_hits(hits: Sequence[DocumentHit]) -> str:
+    """Render search hits for the model, with file and line offsets."""
+    if not hits:
+        return "No matching passages found."
+    return "\n\n".join(
+        f"{rank}. {hit.path}:{hit.start_line}-{hit.end_line} (best match at line {hit.line}, score {hit.score})\n   {hit.snippet}"
+        for rank, hit in enumerate(hits, start=1)
+    )
+
+# ===== TOOL =====
+
+# Shared index of the MCP research files, created lazily from Settings by `get_document_index`
+_document_index: Optional[DocumentIndex] = None
+_document_index_lock = threading.Lock()
+
+def get_document_index() -> DocumentIndex:
+    """Return the shared index of the research files directory (see `Settings.local_index_*`)."""
+    global _document_index
+    with _document_index_lock:
+        if _document_index is None:
+            from deep_research_from_scratch.utils import get_current_dir
+            from research_agent_framework.config import get_settings
+            settings = get_settings()
+            _document_index = DocumentIndex(
+                get_current_dir() / "files",
+                path=settings.local_index_path,
+                chunk_lines=settings.local_index_chunk_lines,
+            )
+        return _document_index
+
+@tool(parse_docstring=True)
+def search_local_documents(query: str, max_results: int = 8) -> str:
+    """Full-text search over the local research files.
+
+    Returns the best matching passages, ranked by relevance, each with its
+    absolute file path, line range and a snippet with the matching terms in bold.
+    Read the surrounding lines of a promising passage instead of whole files.
+
+    Args:
+        query: Keywords or a natural-language question
+        max_results: Maximum number of passages to return
+
+    Returns:
+        Ranked passages with file and line offsets
+    """
+    from research_agent_framework.config import get_settings
+    index = get_document_index()
+    index.refresh(get_settings().local_index_refresh_interval_s)
+    return format_hits(index.search(query, limit=max(1, min(max_results, 50))))
@@ -0,0 +1,297 @@
+"""Per-Node Latency, Token and Cost Instrumentation.
+
+`InstrumentationHandler` is a LangChain callback handler that records one
+span per graph node, model call and tool call of a run: wall time, queue
+time, model, input/output tokens and estimated cost. It works with any of
+the research graphs (researcher, MCP researcher, supervisor, full agent),
+including researchers launched by the supervisor, since callbacks propagate
+to nested runs::
+
+    handler = InstrumentationHandler()
+    await researcher_agent.ainvoke(state, config={"callbacks": [handler]})
+    handler.to_jsonl("spans.jsonl")
+    handler.summary()  # per-span-name percentiles
+
+Queue time is the delay between a span becoming ready and starting: for
+model and tool calls, the time since their enclosing run started (e.g. a
+summarization call waiting for a concurrency slot); for graph nodes, the
+time since the previous node of the same graph finished.
+
+Costs use `DEFAULT_MODEL_PRICES` (USD per million tokens, matched by model
+name prefix), overridable via `Settings.model_prices`.
+"""
+
+import json
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+# USD per million (input, output) tokens, matched by longest model name prefix
+DEFAULT_MODEL_PRICES: Dict[str, Dict[str, float]] = {
+    "gpt-4.1-nano": {"input": 0.10, "output": 0.40},
+    "gpt-4.1-mini": {"input": 0.40, "output": 1.60},
+    "gpt-4.1": {"input": 2.00, "output": 8.00},
+    "gpt-4o-mini": {"input": 0.15, "output": 0.60},
+    "gpt-4o": {"input": 2.50, "output": 10.00},
+    "claude-3-5-haiku": {"input": 0.80, "output": 4.00},
+    "claude-sonnet-4": {"input": 3.00, "output": 15.00},
+    "claude-opus-4": {"input": 15.00, "output": 75.00},
+}
+
+PERCENTILES = (50, 90, 99)
+
+@dataclass
+class Span:
+    """One instrumented node, model call or tool call.
+
+    Attributes:
+        trace_id: Id of the top-level run the span belongs to
+        span_id: Id of the run itself
+        parent_id: Id of the enclosing run
+        kind: "node", "llm" or "tool"
+        name: Node, model or tool name
+        node: Graph node the span ran in (the node itself for node spans)
+        model: Model name (model spans only)
+        started_at: Start time (Unix seconds)
+        wall_s: Wall time in seconds
+        queue_s: Delay before the span started (see module docstring)
+        input_tokens: Prompt tokens (model spans only)
+        output_tokens: Completion tokens (model spans only)
+        cost_usd: Estimated cost (model spans only)
+        error: Error message if the run failed
+    """
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    kind: str
+    name: str
+    node: Optional[str] = None
+    model: Optional[str] = None
+    started_at: float = 0.0
+    wall_s: float = 0.0
+    queue_s: float = 0.0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: float = 0.0
+    error: Optional[str] = None
+
+def model_price(model: Optional[str]) -> Optional[Dict[str, float]]:
+    """Return the per-million-token prices of `model`, or None if unknown."""
+    if not model:
+        return None
+    from research_agent_framework.config import get_settings
+    prices = {**DEFAULT_MODEL_PRICES, **(get_settings().model_prices or {})}
+    name = model.split(":", 1)[-1]
+    matches = [prefix for prefix in prices if name.startswith(prefix)]
+    return prices[max(matches, key=len)] if matches else None
+
+def estimate_cost(model: Optional[str], input_tokens: int, output_tokens: int) -> float:
+    """Estimate the USD cost of a model call (0.0 for unknown models)."""
+    price = model_price(model)
+    if price is None:
+        return 0.0
+    return (input_tokens * price.get("input", 0.0) + output_tokens * price.get("output", 0.0)) / 1_000_000
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of `values` (0.0 when empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+class InstrumentationHandler(BaseCallbackHandler):
+    """Callback handler collecting `Span`s for graph nodes, model calls and tool calls."""
+
+    # Record timestamps on the calling task instead of a worker thread
+    run_inline = True
+
+    def __init__(self) -> None:
+        """Start with no spans recorded."""
+        self.spans: List[Span] = []
+        self._open: Dict[UUID, Dict[str, Any]] = {}
+        self._roots: Dict[UUID, UUID] = {}
+        self._last_node_end: Dict[Optional[UUID], float] = {}
+        self._lock = threading.Lock()
+
+    # ----- callback hooks -----
+
+    def on_chain_start(self, serialized: Optional[Dict[str, Any]], inputs: Any, *, run_id: UUID,
+                       parent_run_id: Optional[UUID] = None, metadata: Optional[Dict[str, Any]] = None,
+                       **kwargs: Any) -> None:
+        """Open a span when a graph node starts (other runnables are tracked only as parents)."""
+        name = kwargs.get("name") or (serialized or {}).get("name") or ""
+        node = (metadata or {}).get("langgraph_node")
+        # Only the node runnables themselves, not the runnables they wrap
+        kind = "node" if node and name == node else None
+        self._start(run_id, parent_run_id, kind, name, node=node)
+
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        """Close the span of a finished node."""
+        self._end(run_id)
+
+    def on_chain_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        """Close the span of a failed node, recording the error."""
+        self._end(run_id, error=error)
+
+    def on_chat_model_start(self, serialized: Optional[Dict[str, Any]], messages: Any, *, run_id: UUID,
+                            parent_run_id: Optional[UUID] = None, metadata: Optional[Dict[str, Any]] = None,
+                            **kwargs: Any) -> None:
+        """Open a model-call span for a chat model."""
+        self._start_llm(serialized, run_id, parent_run_id, metadata, kwargs)
+
+    def on_llm_start(self, serialized: Optional[Dict[str, Any]], prompts: Any, *, run_id: UUID,
+                     parent_run_id: Optional[UUID] = None, metadata: Optional[Dict[str, Any]] = None,
+                     **kwargs: Any) -> None:
+        """Open a model-call span for a completion model."""
+        self._start_llm(serialized, run_id, parent_run_id, metadata, kwargs)
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        """Close a model-call span with the model name and token usage of the response."""
+        input_tokens = output_tokens = 0
+        model = None
+        for generations in response.generations:
+            for generation in generations:
+                message = getattr(generation, "message", None)
+                usage = getattr(message, "usage_metadata", None) or {}
+                input_tokens += usage.get("input_tokens", 0) or 0
+                output_tokens += usage.get("output_tokens", 0) or 0
+                metadata = getattr(message, "response_metadata", None) or {}
+                model = model or metadata.get("model_name") or metadata.get("model")
+        if not (input_tokens or output_tokens):
+            token_usage = (response.llm_output or {}).get("token_usage") or {}
+            input_tokens = token_usage.get("prompt_tokens", 0) or 0
+            output_tokens = token_usage.get("completion_tokens", 0) or 0
+        self._end(run_id, model=model, input_tokens=input_tokens, output_tokens=output_tokens)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        """Close the span of a failed model call, recording the error."""
+        self._end(run_id, error=error)
+
+    def on_tool_start(self, serialized: Optional[Dict[str, Any]], input_str: str, *, run_id: UUID,
+                      parent_run_id: Optional[UUID] = None, metadata: Optional[Dict[str, Any]] = None,
+                      **kwargs: Any) -> None:
+        """Open a tool-call span."""
+        name = kwargs.get("name") or (serialized or {}).get("name") or "tool"
+        self._start(run_id, parent_run_id, "tool", name, node=(metadata or {}).get("langgraph_node"))
+
+    def on_tool_end(self, output: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        """Close the span of a finished tool call."""
+        self._end(run_id)
+
+    def on_tool_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        """Close the span of a failed tool call, recording the error."""
+        self._end(run_id, error=error)
+
+    # ----- span bookkeeping -----
+
+    def _start_llm(self, serialized: Optional[Dict[str, Any]], run_id: UUID, parent_run_id: Optional[UUID],
+                   metadata: Optional[Dict[str, Any]], kwargs: Mapping[str, Any]) -> None:
+        metadata = metadata or {}
+        params = kwargs.get("invocation_params") or {}
+        model = metadata.get("ls_model_name") or params.get("model") or params.get("model_name")
+        name = kwargs.get("name") or (serialized or {}).get("name") or "llm"
+        self._start(run_id, parent_run_id, "llm", name, node=metadata.get("langgraph_node"), model=model)
+
+    def _start(self, run_id: UUID, parent_run_id: Optional[UUID], kind: Optional[str], name: str, **fields: Any) -> None:
+        now = time.perf_counter()
+        with self._lock:
+            root = self._roots.get(parent_run_id, parent_run_id) if parent_run_id else run_id
+            self._roots[run_id] = root
+            parent = self._open.get(parent_run_id) if parent_run_id else None
+            if kind == "node":
+                ready = self._last_node_end.get(parent_run_id, parent["t0"] if parent else now)
+            else:
+                ready = parent["t0"] if parent else now
+            self._open[run_id] = {
+                "t0": now,
+                "span": None if kind is None else Span(
+                    trace_id=str(root),
+                    span_id=str(run_id),
+                    parent_id=str(parent_run_id) if parent_run_id else None,
+                    kind=kind,
+                    name=name,
+                    started_at=time.time(),
+                    queue_s=max(0.0, now - ready),
+                    **fields,
+                ),
+                "parent": parent_run_id,
+            }
+
+    def _end(self, run_id: UUID, error: Optional[BaseException] = None, **fields: Any) -> None:
+        now = time.perf_counter()
+        with self._lock:
+            entry = self._open.pop(run_id, None)
+            if entry is None:
+                return
+            span = entry["span"]
+            if span is not None and span.kind == "node":
+                self._last_node_end[entry["parent"]] = now
+            self._roots.pop(run_id, None)
+            self._last_node_end.pop(run_id, None)
+            if span is None:
+                return
+            span.wall_s = now - entry["t0"]
+            if error is not None:
+                span.error = f"{type(error).__name__}: {error}"
+            for key, value in fields.items():
+                if value:
+                    setattr(span, key, value)
+            if span.kind == "llm":
+                span.cost_usd = estimate_cost(span.model, span.input_tokens, span.output_tokens)
+            self.spans.append(span)
+
+    # ----- export -----
+
+    def records(self, trace_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Return the finished spans as dicts, optionally only those of one run."""
+        with self._lock:
+            spans = list(self.spans)
+        return [asdict(span) for span in spans if trace_id is None or span.trace_id == trace_id]
+
+    def to_jsonl(self, path: Union[str, Path], trace_id: Optional[str] = None) -> int:
+        """Append the spans to `path` as JSON lines; return how many were written."""
+        records = self.records(trace_id)
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+        return len(records)
+
+    def summary(self, trace_id: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Summarize spans per "kind:name": count, wall/queue percentiles, tokens and cost."""
+        return summarize_spans(self.records(trace_id))
+
+def summarize_spans(records: Sequence[Mapping[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Per "kind:name" summary of span records (as returned by `records` or read from JSON lines)."""
+    groups: Dict[str, List[Mapping[str, Any]]] = {}
+    for record in records:
+        groups.setdefault(f"{record['kind']}:{record['name']}", []).append(record)
+
+    summary = {}
+    for key, group in sorted(groups.items()):
+        walls = [r["wall_s"] for r in group]
+        queues = [r["queue_s"] for r in group]
+        summary[key] = {
+            "count": len(group),
+            "errors": sum(1 for r in group if r.get("error")),
+            "wall_s_total": sum(walls),
+            **{f"wall_s_p{p}": percentile(walls, p) for p in PERCENTILES},
+            **{f"queue_s_p{p}": percentile(queues, p) for p in PERCENTILES},
+            "input_tokens": sum(r.get("input_tokens", 0) for r in group),
+            "output_tokens": sum(r.get("output_tokens", 0) for r in group),
+            "cost_usd": sum(r.get("cost_usd", 0.0) for r in group),
+        }
+    return summary
+
+def read_jsonl(path: Union[str, Path]) -> List[Dict[str, Any]]:
+    """Read span records written by `InstrumentationHandler.to_jsonl`."""
+    with Path(path).open(encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
@@ -0,0 +1,156 @@
+"""Cached MCP Tool Catalog and Tool-Bound Model.
+
+Listing an MCP server's tools is an IPC round-trip (for a stdio server, a
+whole session). `ToolCatalog` loads each server's tools once and keeps them,
+together with the model bound to them, until
+
+- a server reports that its tool list changed (`notifications/tools/list_changed`,
+  delivered to `handle_message`, which can be installed as the sessions'
+  message handler with `with_message_handler`), or
+- the optional TTL expires.
+
+Every tool is tagged with the server it came from (`server_of`), so callers
+can apply per-server policies such as concurrency limits.
+"""
+
+import asyncio
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from langchain_core.tools import BaseTool
+
+# Loads the tools of one server by name
+ServerToolLoader = Callable[[str], Awaitable[List[BaseTool]]]
+
+def is_tool_list_changed(message: Any) -> bool:
+    """Whether an MCP session message is a tool-list-changed notification."""
+    root = getattr(message, "root", message)
+    return getattr(root, "method", None) == "notifications/tools/list_changed"
+
+def with_message_handler(connections: Mapping[str, Mapping[str, Any]], handler: Callable[[Any], Awaitable[None]]) -> Dict[str, Dict[str, Any]]:
+    """Return a copy of MCP connection configs whose sessions pass server messages to `handler`."""
+    updated = {}
+    for name, connection in connections.items():
+        connection = dict(connection)
+        connection["session_kwargs"] = {**(connection.get("session_kwargs") or {}), "message_handler": handler}
+        updated[name] = connection
+    return updated
+
+class ToolCatalog:
+    """Tool list of a set of MCP servers, cached until invalidated or expired.
+
+    Args:
+        servers: Names of the MCP servers to load tools from
+        load_server_tools: Coroutine function loading one server's tools
+        extra_tools: Local tools appended to the MCP tools (e.g. `think_tool`)
+        ttl_s: Seconds a loaded tool list stays valid (None = until invalidated)
+        clock: Monotonic time source (overridable for tests)
+    """
+
+    def __init__(
+        self,
+        servers: Sequence[str],
+        load_server_tools: ServerToolLoader,
+        extra_tools: Sequence[BaseTool] = (),
+        ttl_s: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Create an empty catalog; tools load on first use."""
+        self.servers = list(servers)
+        self.load_server_tools = load_server_tools
+        self.extra_tools = list(extra_tools)
+        self.ttl_s = ttl_s
+        self.clock = clock
+        self.version = 0
+        self.loads = 0
+        self.hits = 0
+        self._tools: Dict[str, List[BaseTool]] = {}
+        self._loaded_at: Dict[str, float] = {}
+        self._bound: Dict[int, Tuple[Any, int, Any]] = {}
+        # Serializes reloads; asyncio locks are bound to one event loop, so it is per running loop
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _reload_lock(self) -> asyncio.Lock:
+        """Lock serializing reloads in the running event loop (recreated when the loop changes)."""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    def _fresh(self, server: str) -> bool:
+        if server not in self._tools:
+            return False
+        return self.ttl_s is None or self.clock() - self._loaded_at[server] < self.ttl_s
+
+    async def _ensure_loaded(self) -> None:
+        stale = [server for server in self.servers if not self._fresh(server)]
+        if not stale:
+            self.hits += 1
+            return
+        async with self._reload_lock():
+            # Another caller may have reloaded them while we waited
+            stale = [server for server in self.servers if not self._fresh(server)]
+            if not stale:
+                self.hits += 1
+                return
+            loaded = await asyncio.gather(*(self.load_server_tools(server) for server in stale))
+            now = self.clock()
+            for server, tools in zip(stale, loaded):
+                self._tools[server] = list(tools)
+                self._loaded_at[server] = now
+            self.loads += len(stale)
+            self.version += 1
+
+    async def tools(self) -> List[BaseTool]:
+        """Return the MCP tools of all servers followed by the extra tools."""
+        await self._ensure_loaded()
+        return [tool for server in self.servers for tool in self._tools[server]] + self.extra_tools
+
+    async def tools_by_name(self) -> Dict[str, BaseTool]:
+        """Return the catalog's tools keyed by name."""
+        return {tool.name: tool for tool in await self.tools()}
+
+    def server_of(self, tool_name: str) -> Optional[str]:
+        """Return the server a loaded tool belongs to (None for extra tools)."""
+        for server, tools in self._tools.items():
+            if any(tool.name == tool_name for tool in tools):
+                return server
+        return None
+
+    async def bound_model(self, model: Any) -> Any:
+        """Return `model` bound to the catalog's tools, rebinding only when the tool list changed."""
+        tools = await self.tools()
+        cached = self._bound.get(id(model))
+        if cached is not None and cached[0] is model and cached[1] == self.version:
+            return cached[2]
+        bound = model.bind_tools(tools)
+        self._bound[id(model)] = (model, self.version, bound)
+        return bound
+
+    def invalidate(self, server: Optional[str] = None) -> None:
+        """Drop the cached tools of `server` (all servers if None); they reload on next use."""
+        for name in [server] if server is not None else list(self._tools):
+            self._tools.pop(name, None)
+            self._loaded_at.pop(name, None)
+        try:
+            from research_agent_framework.config import get_logger
+            get_logger().info(f"MCP tool catalog invalidated ({server or 'all servers'})")
+        except Exception:
+            pass
+
+    async def handle_message(self, message: Any) -> None:
+        """MCP session message handler invalidating the catalog when a tool list changes."""
+        if is_tool_list_changed(message):
+            self.invalidate()
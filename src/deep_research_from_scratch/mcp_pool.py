@@ -0,0 +1,337 @@
+"""Warm MCP Session Pool.
+
+Without a session, `langchain_mcp_adapters` starts a new MCP session for
+every tool listing and every tool call; for the stdio filesystem server that
+means spawning `npx` and Node each time. `MCPSessionPool` keeps long-lived
+sessions per server instead:
+
+- `start()` opens `min_sessions` per server up front (graph startup)
+- calls borrow an idle session, opening more up to `max_sessions` and
+  waiting beyond that
+- a background health check pings idle sessions every
+  `health_check_interval_s`, replaces dead ones and tops servers back up
+  to `min_sessions`
+- a call failing on a dead session is retried once on a fresh session
+- `close()` stops the health check and exits every session
+
+Each session is opened and closed by its own owner task, as the stdio and
+HTTP transports are anyio context managers that must exit in the task that
+entered them. `proxy(server)` returns a session-like object whose
+`list_tools` / `call_tool` go through the pool, so the adapter's tool
+conversion (`load_mcp_tools`) works unchanged on top of it.
+"""
+
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Set,
+)
+
+from langchain_core.tools import BaseTool
+
+# Opens a session for a connection config (default: langchain_mcp_adapters.sessions.create_session)
+SessionFactory = Callable[[Mapping[str, Any]], AsyncContextManager[Any]]
+
+class _Slot:
+    """One pooled session and the task owning its context."""
+
+    def __init__(self, server: str):
+        self.server = server
+        self.session: Any = None
+        self.ready: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.stop = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+
+    @property
+    def alive(self) -> bool:
+        return self.task is not None and not self.task.done() and not self.stop.is_set()
+
+class _ServerSessions:
+    """Sessions of one server: idle ones, all open ones, and the open count (incl. opening)."""
+
+    def __init__(self):
+        self.idle: Deque[_Slot] = deque()
+        self.slots: Set[_Slot] = set()
+        self.count = 0
+        self.condition = asyncio.Condition()
+
+class PooledSession:
+    """Session-like proxy running `list_tools` / `call_tool` on a pooled session of `server`."""
+
+    def __init__(self, server: str, get_pool: Callable[[], Awaitable["MCPSessionPool"]]):
+        """Proxy `server`'s sessions of the pool returned by `get_pool` (looked up per call)."""
+        self.server = server
+        self.get_pool = get_pool
+
+    async def list_tools(self, cursor: Optional[str] = None, **kwargs: Any) -> Any:
+        """List the server's tools on a pooled session."""
+        pool = await self.get_pool()
+        return await pool.run(self.server, lambda session: session.list_tools(cursor=cursor, **kwargs))
+
+    async def call_tool(self, name: str, arguments: Optional[Dict[str, Any]] = None, **kwargs: Any) -> Any:
+        """Call tool `name` on a pooled session."""
+        pool = await self.get_pool()
+        return await pool.run(self.server, lambda session: session.call_tool(name, arguments, **kwargs))
+
+class MCPSessionPool:
+    """Long-lived MCP sessions per server, bound to the event loop that created the pool.
+
+    Args:
+        connections: MCP connection configs by server name
+        min_sessions: Sessions per server opened at start and kept open
+        max_sessions: Upper bound of concurrently open sessions per server
+        health_check_interval_s: Seconds between health checks of idle sessions (None = off)
+        health_check_timeout_s: Seconds a ping may take before the session counts as dead
+        session_factory: Opens a session for a connection config (overridable for tests)
+    """
+
+    def __init__(
+        self,
+        connections: Mapping[str, Mapping[str, Any]],
+        min_sessions: int = 1,
+        max_sessions: int = 4,
+        health_check_interval_s: Optional[float] = 30.0,
+        health_check_timeout_s: float = 5.0,
+        session_factory: Optional[SessionFactory] = None,
+    ):
+        """Configure the pool; sessions are opened by `start` or on first use."""
+        if not 0 <= min_sessions <= max_sessions or max_sessions < 1:
+            raise ValueError(f"Need 0 <= min_sessions <= max_sessions and max_sessions >= 1, got {min_sessions}/{max_sessions}")
+        if session_factory is None:
+            from langchain_mcp_adapters.sessions import create_session
+            session_factory = create_session
+        self.connections = dict(connections)
+        self.min_sessions = min_sessions
+        self.max_sessions = max_sessions
+        self.health_check_interval_s = health_check_interval_s
+        self.health_check_timeout_s = health_check_timeout_s
+        self.session_factory = session_factory
+        self.loop = asyncio.get_running_loop()
+        self.created = 0
+        self.replaced = 0
+        self._servers = {server: _ServerSessions() for server in self.connections}
+        self._started: Optional[asyncio.Task] = None
+        self._health_task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    # ===== LIFECYCLE =====
+
+    async def start(self) -> None:
+        """Warm `min_sessions` per server and start the health check (idempotent)."""
+        if self._started is None:
+            self._started = asyncio.ensure_future(self._warm())
+        await asyncio.shield(self._started)
+
+    async def _warm(self) -> None:
+        await asyncio.gather(*(self._top_up(server) for server in self._servers))
+        if self.health_check_interval_s:
+            self._health_task = asyncio.create_task(self._health_loop())
+
+    async def close(self) -> None:
+        """Stop the health check and close every session."""
+        self._closed = True
+        if self._health_task is not None:
+            self._health_task.cancel()
+            await asyncio.gather(self._health_task, return_exceptions=True)
+        slots = [slot for state in self._servers.values() for slot in state.slots]
+        for slot in slots:
+            slot.stop.set()
+        await asyncio.gather(*(slot.task for slot in slots if slot.task is not None), return_exceptions=True)
+        for state in self._servers.values():
+            state.idle.clear()
+            state.slots.clear()
+            state.count = 0
+            async with state.condition:
+                state.condition.notify_all()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Open and idle sessions per server."""
+        return {server: {"open": len(state.slots), "idle": len(state.idle)} for server, state in self._servers.items()}
+
+    # ===== SESSIONS =====
+
+    async def _own(self, slot: _Slot) -> None:
+        """Owner task: enter the session context, publish the session, exit on stop."""
+        try:
+            async with self.session_factory(self.connections[slot.server]) as session:
+                await session.initialize()
+                slot.session = session
+                slot.ready.set_result(session)
+                await slot.stop.wait()
+        except BaseException as e:
+            if not slot.ready.done():
+                slot.ready.set_exception(e if isinstance(e, Exception) else RuntimeError(f"MCP session for {slot.server!r} cancelled"))
+            elif not isinstance(e, asyncio.CancelledError):
+                try:
+                    from research_agent_framework.config import get_logger
+                    get_logger().warning(f"MCP session for {slot.server!r} ended: {e!r}")
+                except Exception:
+                    pass
+            if isinstance(e, asyncio.CancelledError):
+                raise
+
+    async def _open(self, server: str) -> _Slot:
+        """Open a session of `server`; the caller has already counted it."""
+        slot = _Slot(server)
+        slot.task = asyncio.create_task(self._own(slot))
+        try:
+            await slot.ready
+        except BaseException:
+            await self._forget(slot, counted=True)
+            raise
+        self._servers[server].slots.add(slot)
+        self.created += 1
+        return slot
+
+    async def _forget(self, slot: _Slot, counted: bool = True) -> None:
+        state = self._servers[slot.server]
+        slot.stop.set()
+        async with state.condition:
+            state.slots.discard(slot)
+            if counted:
+                state.count -= 1
+            state.condition.notify()
+
+    async def _discard(self, slot: _Slot) -> None:
+        """Close a dead (or unwanted) session and free its place."""
+        await self._forget(slot)
+        self.replaced += 1
+
+    async def _top_up(self, server: str) -> None:
+        """Open sessions until `server` has `min_sessions`."""
+        state = self._servers[server]
+        async with state.condition:
+            missing = max(0, self.min_sessions - state.count)
+            state.count += missing
+        slots = await asyncio.gather(*(self._open(server) for _ in range(missing)), return_exceptions=True)
+        async with state.condition:
+            for slot in slots:
+                if isinstance(slot, _Slot):
+                    state.idle.append(slot)
+            state.condition.notify_all()
+        for error in (slot for slot in slots if isinstance(slot, BaseException)):
+            try:
+                from research_agent_framework.config import get_logger
+                get_logger().warning(f"Could not open MCP session for {server!r}: {error!r}")
+            except Exception:
+                pass
+
+    async def _acquire(self, server: str) -> _Slot:
+        if self._closed:
+            raise RuntimeError("MCP session pool is closed")
+        if server not in self._servers:
+            raise KeyError(f"Unknown MCP server {server!r}")
+        state = self._servers[server]
+        async with state.condition:
+            while True:
+                while state.idle:
+                    slot = state.idle.popleft()
+                    if slot.alive:
+                        return slot
+                    slot.stop.set()
+                    state.slots.discard(slot)
+                    state.count -= 1
+                    self.replaced += 1
+                if state.count < self.max_sessions:
+                    state.count += 1
+                    break
+                await state.condition.wait()
+        return await self._open(server)
+
+    async def _release(self, slot: _Slot) -> None:
+        if not slot.alive or self._closed:
+            await self._discard(slot)
+            return
+        state = self._servers[slot.server]
+        async with state.condition:
+            state.idle.append(slot)
+            state.condition.notify()
+
+    @asynccontextmanager
+    async def session(self, server: str) -> AsyncIterator[Any]:
+        """Borrow a session of `server` for the duration of the block."""
+        slot = await self._acquire(server)
+        try:
+            yield slot.session
+        finally:
+            await self._release(slot)
+
+    async def _healthy(self, slot: _Slot) -> bool:
+        if not slot.alive:
+            return False
+        try:
+            await asyncio.wait_for(slot.session.send_ping(), self.health_check_timeout_s)
+            return True
+        except Exception:
+            return False
+
+    async def run(self, server: str, operation: Callable[[Any], Awaitable[Any]]) -> Any:
+        """Run `operation(session)` on a pooled session, retrying once if the session turns out dead."""
+        for attempt in range(2):
+            slot = await self._acquire(server)
+            try:
+                result = await operation(slot.session)
+            except Exception:
+                if attempt == 0 and not await self._healthy(slot):
+                    await self._discard(slot)
+                    continue
+                await self._release(slot)
+                raise
+            except asyncio.CancelledError:
+                # E.g. a caller's timeout: the session stays usable, return it
+                await self._release(slot)
+                raise
+            await self._release(slot)
+            return result
+
+    # ===== HEALTH CHECK =====
+
+    async def check_health(self) -> None:
+        """Ping idle sessions, replace dead ones and top every server up to `min_sessions`."""
+        for server, state in self._servers.items():
+            async with state.condition:
+                idle = list(state.idle)
+                state.idle.clear()
+            healthy = await asyncio.gather(*(self._healthy(slot) for slot in idle))
+            for slot, ok in zip(idle, healthy):
+                if ok:
+                    await self._release(slot)
+                else:
+                    await self._discard(slot)
+            await self._top_up(server)
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_check_interval_s)
+            try:
+                await self.check_health()
+            except Exception as e:
+                try:
+                    from research_agent_framework.config import get_logger
+                    get_logger().warning(f"MCP session health check failed: {e!r}")
+                except Exception:
+                    pass
+
+    # ===== TOOLS =====
+
+    def proxy(self, server: str) -> PooledSession:
+        """Session-like object of `server` backed by this pool."""
+        async def get_pool():
+            return self
+        return PooledSession(server, get_pool)
+
+    async def load_tools(self, server: str) -> List[BaseTool]:
+        """LangChain tools of `server` whose listing and calls use pooled sessions."""
+        from langchain_mcp_adapters.tools import load_mcp_tools
+        return await load_mcp_tools(self.proxy(server), server_name=server)
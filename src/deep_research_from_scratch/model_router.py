@@ -0,0 +1,231 @@
+"""Adaptive Model Tiering for Researcher Nodes.
+
+The researcher nodes hard-wire one model each, whatever the size or
+difficulty of the call. With `Settings.model_routing_enabled`, every call of
+`llm_call`, `compact_history` and `compress_research`, and every webpage
+summary made by the search tools (node ``summarize_webpage``), first asks
+the router for a tier. Rules (`Settings.model_routing_rules`) are checked in order and
+the first match wins; if none matches, the node keeps its own model (the
+"default" tier). A rule may test:
+
+- ``node``: node name or list of node names
+- ``min_prompt_tokens`` / ``max_prompt_tokens``: estimated prompt size
+- ``after_think_only``: whether the previous turn only called `think_tool`
+
+For example, routing small prompts and post-reflection turns of the
+research loop to a cheaper model::
+
+    model_routing_rules = [
+        {"node": "llm_call", "after_think_only": True, "tier": "small"},
+        {"node": "llm_call", "max_prompt_tokens": 4000, "tier": "small"},
+    ]
+
+Tiers map to models in `Settings.model_tiers`, either as a model spec or as
+`init_chat_model` arguments, so a tier can carry the output limit its nodes
+need (`compress_research` writes long summaries)::
+
+    model_tiers = {"large": {"model": "anthropic:claude-sonnet-4-20250514", "max_tokens": 64000}}
+
+The tier of every call
+is recorded in the researcher's `model_tier_usage` (calls, tokens and model
+latency per tier, summed over researchers by the supervisor), so latency and
+cost savings can be measured. Calls made inside tools can't update graph
+state; `tool_node` collects them with `collect_tier_usage` instead. Webpage
+summaries count one call per page, without tokens (structured output does
+not report usage).
+"""
+
+import json
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+
+from deep_research_from_scratch.chunking import count_tokens
+
+DEFAULT_TIER = "default"
+_RULE_KEYS = {"node", "min_prompt_tokens", "max_prompt_tokens", "after_think_only", "tier"}
+
+@dataclass(frozen=True)
+class RoutingContext:
+    """What the router knows about a model call."""
+    node: str
+    prompt_tokens: int
+    after_think_only: bool = False
+
+def last_turn_think_only(messages: Sequence[BaseMessage]) -> bool:
+    """Whether the latest tool-calling AI message only called `think_tool`."""
+    for message in reversed(messages):
+        if isinstance(message, ToolMessage):
+            continue
+        tool_calls = getattr(message, "tool_calls", None) if isinstance(message, AIMessage) else None
+        return bool(tool_calls) and all(call["name"] == "think_tool" for call in tool_calls)
+    return False
+
+def routing_context(node: str, messages: Sequence[BaseMessage]) -> RoutingContext:
+    """Build the routing context of a call sending `messages` from `node`."""
+    return RoutingContext(
+        node=node,
+        prompt_tokens=sum(count_tokens(str(message.content)) for message in messages),
+        after_think_only=last_turn_think_only(messages),
+    )
+
+def _matches(rule: Mapping[str, Any], context: RoutingContext) -> bool:
+    nodes = rule.get("node")
+    if nodes is not None and context.node not in ([nodes] if isinstance(nodes, str) else nodes):
+        return False
+    if rule.get("min_prompt_tokens") is not None and context.prompt_tokens < rule["min_prompt_tokens"]:
+        return False
+    if rule.get("max_prompt_tokens") is not None and context.prompt_tokens > rule["max_prompt_tokens"]:
+        return False
+    if rule.get("after_think_only") is not None and context.after_think_only != rule["after_think_only"]:
+        return False
+    return True
+
+def select_tier(context: RoutingContext, rules: Optional[Sequence[Mapping[str, Any]]] = None) -> str:
+    """Return the tier of the first rule matching `context` (`DEFAULT_TIER` if none does).
+
+    Args:
+        context: The call to route
+        rules: Routing rules (defaults to `Settings.model_routing_rules`)
+
+    Raises:
+        ValueError: If a rule has unknown keys or no tier
+    """
+    if rules is None:
+        from research_agent_framework.config import get_settings
+        rules = get_settings().model_routing_rules
+    for rule in rules:
+        unknown = set(rule) - _RULE_KEYS
+        if unknown or "tier" not in rule:
+            raise ValueError(f"Invalid model routing rule {dict(rule)!r}: unknown keys {sorted(unknown)} or missing 'tier'")
+        if _matches(rule, context):
+            return rule["tier"]
+    return DEFAULT_TIER
+
+# ===== TIER MODELS =====
+
+_tier_models: Dict[Tuple[str, Tuple[str, ...]], Any] = {}
+_tier_models_lock = threading.Lock()
+
+def tier_model_kwargs(tier: str) -> Dict[str, Any]:
+    """Return the `init_chat_model` arguments of `tier` (at least `model`).
+
+    Raises:
+        ValueError: If `tier` is not configured in `Settings.model_tiers`, or
+            its entry has no model
+    """
+    from research_agent_framework.config import get_settings
+    spec = get_settings().model_tiers.get(tier)
+    kwargs = {"model": spec} if isinstance(spec, str) else dict(spec or {})
+    if not kwargs.get("model"):
+        raise ValueError(f"Unknown model tier {tier!r}; configure it in Settings.model_tiers")
+    return kwargs
+
+def tier_model(tier: str, tools: Optional[List[Any]] = None) -> Any:
+    """Return the (cached) chat model of `tier`, bound to `tools` if given.
+
+    Raises:
+        ValueError: If `tier` is not configured in `Settings.model_tiers`
+    """
+    kwargs = tier_model_kwargs(tier)
+    key = (json.dumps(kwargs, sort_keys=True, default=str), tuple(getattr(t, "name", str(t)) for t in tools or []))
+    with _tier_models_lock:
+        model = _tier_models.get(key)
+        if model is None:
+            from langchain.chat_models import init_chat_model
+            model = init_chat_model(**kwargs)
+            if tools:
+                model = model.bind_tools(tools)
+            _tier_models[key] = model
+        return model
+
+def route_model(node: str, messages: Sequence[BaseMessage], default_model: Any, tools: Optional[List[Any]] = None) -> Tuple[str, Any]:
+    """Pick the model for a call of `node`.
+
+    Args:
+        node: Graph node making the call
+        messages: Messages about to be sent
+        default_model: The node's own model, used for the default tier
+        tools: Tools to bind to a tier model (for tool-calling nodes)
+
+    Returns:
+        Tuple of (tier name, model to call)
+    """
+    from research_agent_framework.config import get_settings
+    if not get_settings().model_routing_enabled:
+        return DEFAULT_TIER, default_model
+    tier = select_tier(routing_context(node, messages))
+    if tier == DEFAULT_TIER:
+        return tier, default_model
+    return tier, tier_model(tier, tools)
+
+def _empty_usage() -> Dict[str, Any]:
+    return {"calls": 0, "input_tokens": 0, "output_tokens": 0, "elapsed_s": 0.0}
+
+def add_tier_usage(usage: Optional[Mapping[str, Any]], tier: str, response: Any, elapsed_s: float = 0.0) -> Dict[str, Any]:
+    """Return `usage` with one more call of `tier`, its tokens and its latency added."""
+    usage = {name: dict(counts) for name, counts in (usage or {}).items()}
+    tokens = getattr(response, "usage_metadata", None) or {}
+    counts = usage.setdefault(tier, _empty_usage())
+    counts["calls"] += 1
+    counts["input_tokens"] += tokens.get("input_tokens", 0) or 0
+    counts["output_tokens"] += tokens.get("output_tokens", 0) or 0
+    counts["elapsed_s"] += elapsed_s
+    return usage
+
+def merge_tier_usage(total: Optional[Mapping[str, Any]], usage: Optional[Mapping[str, Any]]) -> Dict[str, Any]:
+    """Return the per-tier sum of two `model_tier_usage` dicts."""
+    merged = {name: dict(counts) for name, counts in (total or {}).items()}
+    for name, counts in (usage or {}).items():
+        target = merged.setdefault(name, _empty_usage())
+        for key, value in counts.items():
+            target[key] = target.get(key, 0) + value
+    return merged
+
+# ===== USAGE OF CALLS OUTSIDE NODES =====
+
+class TierUsageCollector:
+    """Thread-safe `model_tier_usage` accumulator for model calls made inside tools."""
+
+    def __init__(self) -> None:
+        """Start with no usage recorded."""
+        self.usage: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def add(self, tier: str, response: Any = None, elapsed_s: float = 0.0) -> None:
+        """Record one call of `tier` (see `add_tier_usage`)."""
+        with self._lock:
+            self.usage = add_tier_usage(self.usage, tier, response, elapsed_s)
+
+    def merge(self, usage: Optional[Mapping[str, Any]]) -> None:
+        """Add usage collected elsewhere (see `merge_tier_usage`)."""
+        with self._lock:
+            self.usage = merge_tier_usage(self.usage, usage)
+
+_current_collector: ContextVar[Optional[TierUsageCollector]] = ContextVar("tier_usage_collector", default=None)
+
+@contextmanager
+def collect_tier_usage() -> Iterator[TierUsageCollector]:
+    """Collect the calls recorded with `record_tier_usage` inside the block (and tasks it starts)."""
+    collector = TierUsageCollector()
+    token = _current_collector.set(collector)
+    try:
+        yield collector
+    finally:
+        _current_collector.reset(token)
+
+def record_tier_usage(tier: str, response: Any = None, elapsed_s: float = 0.0) -> None:
+    """Record a call of `tier` with the active collector; a no-op outside `collect_tier_usage`."""
+    collector = _current_collector.get()
+    if collector is not None:
+        collector.add(tier, response, elapsed_s)
+
+def record_collected_usage(usage: Optional[Mapping[str, Any]]) -> None:
+    """Add usage collected elsewhere (e.g. by a speculative tool run) to the active collector."""
+    collector = _current_collector.get()
+    if collector is not None and usage:
+        collector.merge(usage)
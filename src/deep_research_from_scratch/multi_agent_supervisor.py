@@ -12,9 +12,11 @@ maintaining isolated context windows for each research topic.
 """
 
 import asyncio
+import uuid
+from contextlib import contextmanager
 
 from typing_extensions import Literal
-from typing import Sequence, cast
+from typing import Any, Awaitable, Iterator, Optional, Sequence, cast
 
 from langchain.chat_models import init_chat_model
 from langchain_core.messages import (
@@ -34,8 +36,19 @@ from deep_research_from_scratch.state_multi_agent_supervisor import (
     ConductResearch,
     ResearchComplete,
 )
-from deep_research_from_scratch.utils import get_today_str, think_tool
+from deep_research_from_scratch.utils import think_tool
 from deep_research_from_scratch.state_research import ResearcherState
+from deep_research_from_scratch.url_registry import (
+    UrlRegistry,
+    get_url_registry,
+    release_url_registry,
+    use_url_registry,
+)
+from deep_research_from_scratch.prompt_cache import add_cache_usage, cache_usage, cached_system_message
+from deep_research_from_scratch.blob_store import blob_run_scope, join_notes, release_run_blobs
+from deep_research_from_scratch.model_router import merge_tier_usage
+from deep_research_from_scratch.checkpointing import get_checkpointer, researcher_thread_id, run_checkpointed
+from deep_research_from_scratch.speculative import speculation_scope
 from research_agent_framework.config import get_logger, get_settings
 
 def get_notes_from_tool_calls(messages: Sequence[BaseMessage]) -> list[str]:
@@ -84,6 +97,23 @@ max_researcher_iterations = 6 # Calls to think_tool + ConductResearch
 # This is passed to the lead_researcher_prompt to limit parallel research tasks
 max_concurrent_researchers = 3
 
+# ===== RUN RESOURCES =====
+
+def _release_run(run_id: Optional[str]) -> None:
+    """Release what supervisor run `run_id` holds: its URL registry and its note blobs."""
+    if run_id:
+        release_url_registry(run_id)
+        release_run_blobs(run_id)
+
+@contextmanager
+def _release_run_on_error(run_id: Optional[str]) -> Iterator[None]:
+    """Release the resources of run `run_id` if the block raises or is cancelled."""
+    try:
+        yield
+    except BaseException:
+        _release_run(run_id)
+        raise
+
 # ===== SUPERVISOR NODES =====
 
 async def supervisor(state: SupervisorState) -> Command[Literal["supervisor_tools"]]:
@@ -102,25 +132,34 @@ async def supervisor(state: SupervisorState) -> Command[Literal["supervisor_tool
     """
     supervisor_messages = state.get("supervisor_messages", [])
 
-    # Prepare system message with current date and constraints
-    system_message = lead_researcher_prompt.format(
-        date=get_today_str(), 
+    # Prepare system message with constraints (cacheable static prefix) and the current date
+    system_message = cached_system_message(
+        lead_researcher_prompt,
+        supervisor_model_with_tools,
         max_concurrent_research_units=max_concurrent_researchers,
-        max_researcher_iterations=max_researcher_iterations
+        max_researcher_iterations=max_researcher_iterations,
     )
-    messages = [SystemMessage(content=system_message)] + list(supervisor_messages)
+    messages = [system_message] + list(supervisor_messages)
 
     # Make decision about next research steps
-    response = await supervisor_model_with_tools.ainvoke(messages)
+    with _release_run_on_error(state.get("run_id")):
+        response = await supervisor_model_with_tools.ainvoke(messages)
 
     return Command(
         goto="supervisor_tools",
         update={
             "supervisor_messages": [response],
-            "research_iterations": state.get("research_iterations", 0) + 1
+            "research_iterations": state.get("research_iterations", 0) + 1,
+            "run_id": state.get("run_id") or uuid.uuid4().hex,
+            "prompt_cache_usage": add_cache_usage(state.get("prompt_cache_usage", {}), cache_usage(response)),
         }
     )
 
+async def _in_speculation_scope(research: Awaitable[Any]) -> Any:
+    """Run one researcher with its own speculative tool calls, cancelling any left over."""
+    with speculation_scope():
+        return await research
+
 async def supervisor_tools(state: SupervisorState) -> Command[Literal["supervisor", "__end__"]]:
     """Execute supervisor decisions - either conduct research or end the process.
 
@@ -136,13 +175,22 @@ async def supervisor_tools(state: SupervisorState) -> Command[Literal["superviso
     Returns:
         Command to continue supervision, end process, or handle errors
     """
+    # The run's URL registry and note blobs are released when the run ends, and
+    # also when this step fails or is cancelled so an aborted run does not leak them
+    with _release_run_on_error(state.get("run_id")), blob_run_scope(state.get("run_id")):
+        return await _supervisor_tools(state)
+
+async def _supervisor_tools(state: SupervisorState) -> Command[Literal["supervisor", "__end__"]]:
+    """Body of `supervisor_tools`."""
     supervisor_messages = state.get("supervisor_messages", [])
     research_iterations = state.get("research_iterations", 0)
+    run_id = state.get("run_id")
     most_recent_message = supervisor_messages[-1] if supervisor_messages else SystemMessage(content="")
 
     # Initialize variables for single return pattern
     tool_messages = []
     all_raw_notes = []
+    cache_update = {}
     next_step = "supervisor"  # Default next step
     should_end = False
 
@@ -190,13 +238,29 @@ async def supervisor_tools(state: SupervisorState) -> Command[Literal["superviso
                         "compressed_research": "",
                         "raw_notes": [],
                     }
-                    research_coroutines.append(researcher_agent.ainvoke(cast(ResearcherState, payload)))
-
-                # Wait for all research to complete, allowing individual failures to be captured
-                tool_results = await asyncio.gather(*research_coroutines, return_exceptions=True)
+                    if getattr(researcher_agent, "checkpointer", None) and run_id:
+                        # Own thread per researcher: a replayed step reuses finished researchers
+                        # and resumes interrupted ones instead of starting them over
+                        research_coroutines.append(run_checkpointed(
+                            researcher_agent, cast(ResearcherState, payload), researcher_thread_id(run_id, tool_call["id"])
+                        ))
+                    else:
+                        research_coroutines.append(researcher_agent.ainvoke(cast(ResearcherState, payload)))
+
+                # Wait for all research to complete, allowing individual failures to be captured.
+                # Researchers of this run share one URL registry so overlapping pages are
+                # summarized once.
+                url_registry = get_url_registry(run_id) if run_id else UrlRegistry()
+                with use_url_registry(url_registry):
+                    tool_results = await asyncio.gather(
+                        *(_in_speculation_scope(research) for research in research_coroutines),
+                        return_exceptions=True,
+                    )
 
                 research_tool_messages = []
                 aggregated_raw_notes = []
+                prompt_cache_usage = state.get("prompt_cache_usage", {})
+                model_tier_usage = state.get("model_tier_usage", {})
                 # Iterate results and corresponding tool_calls
                 for result, tool_call in zip(tool_results, conduct_research_calls):
                     if isinstance(result, Exception):
@@ -224,6 +288,8 @@ async def supervisor_tools(state: SupervisorState) -> Command[Literal["superviso
                     if isinstance(result, dict):
                         content_str = result.get("compressed_research", "Error synthesizing research report")
                         raw_notes_list = result.get("raw_notes", [])
+                        prompt_cache_usage = add_cache_usage(prompt_cache_usage, result.get("prompt_cache_usage", {}))
+                        model_tier_usage = merge_tier_usage(model_tier_usage, result.get("model_tier_usage", {}))
                     else:
                         # Unexpected result shape: stringify
                         content_str = str(result)
@@ -237,10 +303,12 @@ async def supervisor_tools(state: SupervisorState) -> Command[Literal["superviso
                         )
                     )
 
-                    aggregated_raw_notes.append("\n".join(raw_notes_list))
+                    # Blob references are combined without loading the notes
+                    aggregated_raw_notes.append(join_notes(raw_notes_list))
 
                 tool_messages.extend(research_tool_messages)
                 all_raw_notes = aggregated_raw_notes
+                cache_update = {"prompt_cache_usage": prompt_cache_usage, "model_tier_usage": model_tier_usage}
 
         except Exception as e:
             # Use structured logging and consult supervisor error policy
@@ -273,6 +341,7 @@ async def supervisor_tools(state: SupervisorState) -> Command[Literal["superviso
 
     # Single return point with appropriate state updates
     if should_end:
+        _release_run(run_id)
         return Command(
             goto=cast(Literal["supervisor", "__end__"], next_step),
             update={
@@ -286,6 +355,7 @@ async def supervisor_tools(state: SupervisorState) -> Command[Literal["superviso
             update={
                 "supervisor_messages": tool_messages,
                 "raw_notes": all_raw_notes,
+                **cache_update,
             },
         )
 
@@ -296,7 +366,7 @@ supervisor_builder = StateGraph(SupervisorState)
 supervisor_builder.add_node("supervisor", supervisor)
 supervisor_builder.add_node("supervisor_tools", supervisor_tools)
 supervisor_builder.add_edge(START, "supervisor")
-supervisor_agent = supervisor_builder.compile()
+supervisor_agent = supervisor_builder.compile(checkpointer=get_checkpointer())
 
 # === Deterministic demo classes for educational notebook and tests ===
 from typing import Sequence
@@ -0,0 +1,95 @@
+"""Convergence-Based Early Stopping for Researchers.
+
+This module measures how much each round of `tavily_search` results adds to
+what a researcher has already seen. A round's novelty is the mean of
+
+- the share of result URLs (including near-duplicate aliases) not seen before, and
+- the share of content fingerprints (hashed sentence/line features of the
+  source summaries, see `fingerprint.features`) not seen before.
+
+When novelty stays below `Settings.novelty_threshold` for
+`Settings.novelty_patience` consecutive search rounds, the researcher has
+converged and goes straight to `compress_research`, saving further LLM turns
+and searches.
+
+The tracker state is a plain dict (lists of strings), so it can live in the
+graph state and survive checkpointing.
+"""
+
+import hashlib
+import re
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from deep_research_from_scratch.fingerprint import features
+
+# budget_stop_reason recorded when the loop ends on convergence
+NOVELTY_STOP_REASON = "novelty"
+# Tools whose outputs are scored
+SEARCH_TOOLS = ("tavily_search",)
+
+_SOURCE_RE = re.compile(
+    r"^URL: (?P<url>\S+)\n(?:ALSO AT: (?P<aliases>[^\n]*)\n)?\nSUMMARY:\n(?P<summary>.*?)(?=\n-{80}\n|\Z)",
+    re.MULTILINE | re.DOTALL,
+)
+
+def parse_search_output(output: str) -> List[Tuple[List[str], str]]:
+    """Extract the sources of a formatted `tavily_search` output.
+
+    Returns:
+        List of (urls, summary) per source; urls starts with the source URL
+        followed by its near-duplicate aliases
+    """
+    sources = []
+    for match in _SOURCE_RE.finditer(output):
+        urls = [match.group("url")]
+        if match.group("aliases"):
+            urls.extend(alias.strip() for alias in match.group("aliases").split(",") if alias.strip())
+        sources.append((urls, match.group("summary").strip()))
+    return sources
+
+def content_fingerprints(text: str) -> List[str]:
+    """Short hashes of the normalized sentence/line features of `text`."""
+    return [hashlib.blake2b(feature.encode("utf-8"), digest_size=8).hexdigest() for feature in features(text)]
+
+def _share_new(items: List[str], seen: set) -> Optional[float]:
+    return sum(1 for item in set(items) if item not in seen) / len(set(items)) if items else None
+
+def update_novelty(tracker: Optional[Mapping[str, Any]], outputs: Iterable[str]) -> Dict[str, Any]:
+    """Score one round of search outputs and fold them into the tracker.
+
+    Args:
+        tracker: Previous tracker state (None or {} for a fresh researcher)
+        outputs: Formatted search tool outputs of the round
+
+    Returns:
+        New tracker state with `urls`, `fingerprints`, `scores` (one per
+        round) and `low_rounds` (consecutive rounds below the threshold)
+    """
+    from research_agent_framework.config import get_settings
+    tracker = dict(tracker or {})
+    seen_urls = set(tracker.get("urls", []))
+    seen_fingerprints = set(tracker.get("fingerprints", []))
+
+    urls: List[str] = []
+    fingerprints: List[str] = []
+    for output in outputs:
+        for source_urls, summary in parse_search_output(output):
+            urls.extend(source_urls)
+            fingerprints.extend(content_fingerprints(summary))
+
+    shares = [share for share in (_share_new(urls, seen_urls), _share_new(fingerprints, seen_fingerprints)) if share is not None]
+    score = sum(shares) / len(shares) if shares else 0.0
+    low = score < get_settings().novelty_threshold
+
+    return {
+        "urls": tracker.get("urls", []) + sorted(set(urls) - seen_urls),
+        "fingerprints": tracker.get("fingerprints", []) + sorted(set(fingerprints) - seen_fingerprints),
+        "scores": tracker.get("scores", []) + [round(score, 4)],
+        "low_rounds": tracker.get("low_rounds", 0) + 1 if low else 0,
+    }
+
+def has_converged(tracker: Optional[Mapping[str, Any]]) -> bool:
+    """Whether novelty stayed below the threshold for `Settings.novelty_patience` rounds."""
+    from research_agent_framework.config import get_settings
+    settings = get_settings()
+    return settings.novelty_stop_enabled and (tracker or {}).get("low_rounds", 0) >= settings.novelty_patience
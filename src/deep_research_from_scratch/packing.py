@@ -0,0 +1,69 @@
+"""Token-Budgeted Packing of Documents into Shared Requests.
+
+This module plans multi-document summarization: small and medium pages are
+packed together so one structured-output request summarizes several of
+them, saving per-request overhead and rate-limit slots. Packing is greedy
+and order-preserving (each document goes into the first pack it fits), so
+packs stay predictable and results map straight back to their documents.
+Documents too large to share a request are left for per-page summarization.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+
+@dataclass
+class PackPlan:
+    """Outcome of `pack_documents`.
+
+    Attributes:
+        packs: Groups of document ids, each summarized by one shared request
+        singles: Document ids summarized on their own (oversized, or left
+            alone in a pack of one)
+    """
+    packs: List[List[str]] = field(default_factory=list)
+    singles: List[str] = field(default_factory=list)
+
+def pack_documents(
+    token_counts: Dict[str, int],
+    max_pack_tokens: int,
+    max_documents: int,
+    max_document_tokens: int,
+) -> PackPlan:
+    """Pack documents into shared requests within a token budget.
+
+    Args:
+        token_counts: Mapping of document id to its token count, in priority order
+        max_pack_tokens: Token budget for the documents of one pack
+        max_documents: Maximum number of documents per pack
+        max_document_tokens: Documents above this size are never packed
+
+    Returns:
+        PackPlan with the packs (each of at least two documents) and the
+        documents to summarize individually
+    """
+    if max_pack_tokens <= 0 or max_documents <= 0:
+        raise ValueError("max_pack_tokens and max_documents must be positive")
+
+    plan = PackPlan()
+    open_packs: List[List[str]] = []
+    pack_tokens: List[int] = []
+    for doc_id, tokens in token_counts.items():
+        if tokens > min(max_document_tokens, max_pack_tokens):
+            plan.singles.append(doc_id)
+            continue
+        for i, pack in enumerate(open_packs):
+            if len(pack) < max_documents and pack_tokens[i] + tokens <= max_pack_tokens:
+                pack.append(doc_id)
+                pack_tokens[i] += tokens
+                break
+        else:
+            open_packs.append([doc_id])
+            pack_tokens.append(tokens)
+
+    for pack in open_packs:
+        if len(pack) > 1:
+            plan.packs.append(pack)
+        else:
+            plan.singles.extend(pack)
+    return plan
@@ -0,0 +1,81 @@
+"""Provider Prompt-Prefix Caching for Static System Prompts.
+
+The researcher, supervisor and compression prompts are long and nearly
+static, and are resent on every turn of every researcher. This module builds
+their system messages so the static part forms a byte-identical prefix that
+providers can cache:
+
+- The date sentence is cut out of the template and sent after the prefix,
+  together with any other per-turn text (e.g. the research digest).
+- For Anthropic models the static block carries a `cache_control`
+  breakpoint. Other providers (e.g. OpenAI) cache long identical prefixes
+  automatically, so they receive a plain string with the static part first.
+
+Cache reads and writes reported in `usage_metadata` are extracted by
+`cache_usage` and accumulated into run metrics by the graphs.
+"""
+
+from typing import Any, Dict, Tuple
+
+from langchain_core.messages import SystemMessage
+
+from deep_research_from_scratch.utils import get_today_str
+
+DATE_SENTENCE = "For context, today's date is {date}."
+CACHE_CONTROL = {"type": "ephemeral"}
+
+def split_static_prefix(template: str) -> Tuple[str, str]:
+    """Split a prompt template into its static part and its date sentence.
+
+    Args:
+        template: Prompt template containing `DATE_SENTENCE`
+
+    Returns:
+        Tuple of (template without the date sentence, date sentence
+        template); the second element is empty if the template has none
+    """
+    if DATE_SENTENCE not in template:
+        return template, ""
+    return template.replace(" " + DATE_SENTENCE, "", 1).replace(DATE_SENTENCE, "", 1), DATE_SENTENCE
+
+def supports_cache_control(model: Any) -> bool:
+    """Whether `model` (possibly tool-bound) accepts Anthropic `cache_control` blocks."""
+    bound = getattr(model, "bound", model)
+    llm_type = getattr(bound, "_llm_type", "") or ""
+    return "anthropic" in llm_type or type(bound).__name__ == "ChatAnthropic"
+
+def cached_system_message(template: str, model: Any, dynamic: str = "", **static_kwargs: Any) -> SystemMessage:
+    """Build a system message whose static prefix is stable across turns.
+
+    Args:
+        template: Prompt template with a `DATE_SENTENCE` and optional static placeholders
+        model: Chat model the message is sent to (decides the cache marker format)
+        dynamic: Per-turn text appended after the date, outside the cached prefix
+        **static_kwargs: Values for the template's other placeholders; they
+            must not change between turns
+
+    Returns:
+        SystemMessage with the static prefix first
+    """
+    static_template, date_template = split_static_prefix(template)
+    static = static_template.format(**static_kwargs)
+    tail = "\n\n".join(part for part in (date_template.format(date=get_today_str()), dynamic) if part)
+
+    if supports_cache_control(model):
+        blocks = [{"type": "text", "text": static, "cache_control": CACHE_CONTROL}]
+        if tail:
+            blocks.append({"type": "text", "text": tail})
+        return SystemMessage(content=blocks)
+    return SystemMessage(content=f"{static}\n\n{tail}" if tail else static)
+
+def cache_usage(message: Any) -> Dict[str, int]:
+    """Return the prompt-cache read/write token counts reported for a model response."""
+    details = (getattr(message, "usage_metadata", None) or {}).get("input_token_details") or {}
+    return {
+        "cache_read_tokens": details.get("cache_read", 0) or 0,
+        "cache_write_tokens": details.get("cache_creation", 0) or 0,
+    }
+
+def add_cache_usage(total: Dict[str, int], usage: Dict[str, int]) -> Dict[str, int]:
+    """Return the sum of two cache usage dicts (missing counters count as 0)."""
+    return {key: (total or {}).get(key, 0) + (usage or {}).get(key, 0) for key in ("cache_read_tokens", "cache_write_tokens")}
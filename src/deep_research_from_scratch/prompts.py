@@ -192,6 +192,68 @@ Remember, your goal is to create a summary that can be easily understood and uti
 Today's date is {date}.
 """
 
+summarize_chunk_summaries_prompt = """You are tasked with merging partial summaries of one long webpage into a single summary. The page was too long to summarize at once, so it was split into consecutive sections and each section was summarized separately. This summary will be used by a downstream research agent, so it's crucial to keep the key details without losing essential information.
+
+Here are the section summaries, in page order:
+
+<section_summaries>
+{chunk_summaries}
+</section_summaries>
+
+Please follow these guidelines to create the merged summary:
+
+1. Identify the main topic or purpose of the whole page.
+2. Combine the sections into one coherent summary, removing repetition caused by overlapping sections.
+3. Retain key facts, statistics, dates, names and locations from every section.
+4. Maintain the chronological or logical order of the original page.
+5. Select the most important quotes and excerpts across all sections, up to a maximum of 5.
+
+Present your summary in the following format:
+
+```
+{{
+   "summary": "Your merged summary here, structured with appropriate paragraphs or bullet points as needed",
+   "key_excerpts": "First important quote or excerpt, Second important quote or excerpt, ...up to a maximum of 5"
+}}
+```
+
+Today's date is {date}.
+"""
+
+summarize_multiple_webpages_prompt = """You are tasked with summarizing the raw content of several webpages retrieved from a web search. Each webpage is given in its own <document> tag with a numeric id. Your goal is to create, for every document, a summary that preserves the most important information from that page. These summaries will be used by a downstream research agent, so it's crucial to maintain the key details without losing essential information.
+
+Here are the documents:
+
+<documents>
+{documents}
+</documents>
+
+Please follow these guidelines for each summary:
+
+1. Summarize every document separately; never mix information from different documents.
+2. Identify and preserve the main topic or purpose of the webpage.
+3. Retain key facts, statistics, and data points that are central to the content's message.
+4. Keep important quotes from credible sources or experts.
+5. Include relevant dates, names, and locations that are crucial to understanding the content.
+6. Aim for about 25-30 percent of the original length, unless the content is already concise.
+
+Return one entry per document, using the document's id as `document_id`:
+
+```
+{{
+   "summaries": [
+      {{
+         "document_id": 1,
+         "summary": "Your summary of document 1 here",
+         "key_excerpts": "First important quote or excerpt, Second important quote or excerpt, ...up to a maximum of 5"
+      }}
+   ]
+}}
+```
+
+Today's date is {date}.
+"""
+
 # Research agent prompt for MCP (Model Context Protocol) file access
 research_agent_prompt_with_mcp = """You are a research assistant conducting research on the user's input topic using local files. For context, today's date is {date}.
 
@@ -206,7 +268,7 @@ You have access to file system tools and thinking tools:
 - **list_directory**: List files in directories
 - **read_file**: Read individual files
 - **read_multiple_files**: Read multiple files at once
-- **search_files**: Find files containing specific content
+- **search_files**: Find files by name pattern
 - **think_tool**: For reflection and strategic planning during research
 
 **CRITICAL: Use think_tool after reading files to reflect on findings and plan next steps**
@@ -217,7 +279,7 @@ Think like a human researcher with access to a document library. Follow these st
 
 1. **Read the question carefully** - What specific information does the user need?
 2. **Explore available files** - Use list_allowed_directories and list_directory to understand what's available
-3. **Identify relevant files** - Use search_files if needed to find documents matching the topic
+3. **Identify relevant files** - Use search_files if needed to find documents by name
 4. **Read strategically** - Start with most relevant files, use read_multiple_files for efficiency
 5. **After reading, pause and assess** - Do I have enough to answer? What's still missing?
 6. **Stop when you can answer confidently** - Don't keep reading for perfection
@@ -244,6 +306,13 @@ After reading files, use think_tool to analyze what you found:
 - Always cite which files you used for your information
 </Show Your Thinking>"""
 
+# Lines of research_agent_prompt_with_mcp rewritten when search_local_documents is bound
+# (the template itself only takes {date}); see research_agent_mcp.research_prompt
+mcp_search_files_tool = "- **search_files**: Find files by name pattern"
+mcp_local_search_tool = "- **search_local_documents**: Full-text search across all files; returns ranked passages with file and line numbers"
+mcp_identify_step_without_local_search = "**Identify relevant files** - Use search_files if needed to find documents by name"
+mcp_identify_step_with_local_search = "**Identify relevant passages** - Use search_local_documents to find where the topic is covered, and search_files to find documents by name"
+
 lead_researcher_prompt = """You are a research supervisor. Your job is to conduct research by calling the "ConductResearch" tool. For context, today's date is {date}.
 
 <Task>
@@ -349,6 +418,34 @@ The report should be structured like this:
 Critical Reminder: It is extremely important that any information that is even remotely relevant to the user's research topic is preserved verbatim (e.g. don't rewrite it, don't summarize it, don't paraphrase it).
 """
 
+update_research_digest_prompt = """You are maintaining a running digest of the findings of a research assistant. Older tool outputs are removed from the assistant's context once they are folded into this digest, so anything you leave out is lost to the assistant.
+
+The research topic is:
+<research_topic>
+{research_topic}
+</research_topic>
+
+Here is the current digest (empty at first):
+<current_digest>
+{digest}
+</current_digest>
+
+Here are the tool outputs to fold in:
+<new_findings>
+{new_findings}
+</new_findings>
+
+Please follow these guidelines to update the digest:
+
+1. Keep every fact, statistic, date, name and location relevant to the research topic.
+2. Keep the source title and URL next to the facts they support.
+3. Merge repeated information instead of listing it twice.
+4. Drop navigation text, boilerplate and information unrelated to the topic.
+5. Keep the digest concise: bullet points grouped by sub-topic, at most about {max_words} words.
+
+Return only the updated digest.
+"""
+
 compress_research_human_message = """All above messages are about research conducted by an AI Researcher for the following research topic:
 
 RESEARCH TOPIC: {research_topic}
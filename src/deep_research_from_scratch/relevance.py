@@ -0,0 +1,114 @@
+"""Extractive Relevance Filtering for Webpage Content.
+
+This module trims raw webpage content down to the passages most relevant to
+the search query before it is sent for LLM summarization. Passages
+(paragraphs) are ranked with Okapi BM25 against the query and the best ones
+are kept, in their original order, up to a character budget. Everything runs
+locally on the CPU, so navigation menus, cookie banners and unrelated
+sections stop costing summarization tokens.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import List
+
+# BM25 parameters (standard Okapi defaults)
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+# Paragraphs longer than this are further split on line breaks
+MAX_PASSAGE_CHARS = 1500
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_PARAGRAPH_RE = re.compile(r"\n\s*\n")
+
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the this to was were will with "
+    "what which who how when where why best top".split()
+)
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens of `text` with common stopwords removed."""
+    return [token for token in _TOKEN_RE.findall(text.lower()) if token not in _STOPWORDS]
+
+def split_passages(text: str, max_passage_chars: int = MAX_PASSAGE_CHARS) -> List[str]:
+    """Split text into non-empty passages on blank lines (and on lines for long paragraphs)."""
+    passages: List[str] = []
+    for paragraph in _PARAGRAPH_RE.split(text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if len(paragraph) <= max_passage_chars:
+            passages.append(paragraph)
+        else:
+            passages.extend(line.strip() for line in paragraph.splitlines() if line.strip())
+    return passages
+
+def bm25_scores(query: str, passages: List[str], k1: float = BM25_K1, b: float = BM25_B) -> List[float]:
+    """Score each passage against `query` with Okapi BM25.
+
+    Args:
+        query: Search query
+        passages: Candidate passages
+        k1: Term-frequency saturation parameter
+        b: Length-normalization parameter
+
+    Returns:
+        One score per passage (0.0 when it shares no terms with the query)
+    """
+    query_terms = set(tokenize(query))
+    tokenized = [tokenize(passage) for passage in passages]
+    if not query_terms or not tokenized:
+        return [0.0] * len(passages)
+
+    n_docs = len(tokenized)
+    avg_len = sum(len(tokens) for tokens in tokenized) / n_docs or 1.0
+    doc_freq = Counter(term for tokens in tokenized for term in set(tokens) & query_terms)
+    idf = {term: math.log(1 + (n_docs - df + 0.5) / (df + 0.5)) for term, df in doc_freq.items()}
+
+    scores = []
+    for tokens in tokenized:
+        term_freq = Counter(token for token in tokens if token in idf)
+        norm = k1 * (1 - b + b * len(tokens) / avg_len)
+        scores.append(sum(idf[term] * tf * (k1 + 1) / (tf + norm) for term, tf in term_freq.items()))
+    return scores
+
+def filter_relevant_passages(text: str, query: str, max_chars: int) -> str:
+    """Keep the passages of `text` most relevant to `query`, within `max_chars`.
+
+    Passages are chosen by descending BM25 score (earlier passages win ties)
+    and re-assembled in page order. When any passage matches the query,
+    passages that share no terms with it are dropped even if budget remains.
+    Text already within budget is returned unchanged.
+
+    Args:
+        text: Raw webpage content
+        query: Search query the page was retrieved for
+        max_chars: Character budget for the filtered content
+
+    Returns:
+        Filtered content of at most `max_chars` characters
+    """
+    if len(text) <= max_chars:
+        return text
+
+    passages = split_passages(text)
+    scores = bm25_scores(query, passages)
+    ranked = sorted(range(len(passages)), key=lambda i: (-scores[i], i))
+    if scores and max(scores) > 0:
+        ranked = [i for i in ranked if scores[i] > 0]
+
+    selected: List[int] = []
+    used = 0
+    for i in ranked:
+        cost = len(passages[i]) + (2 if selected else 0)
+        if used + cost > max_chars:
+            continue
+        selected.append(i)
+        used += cost
+
+    if not selected and passages:
+        # Even the best passage exceeds the budget: keep its leading part
+        return passages[ranked[0]][:max_chars]
+    return "\n\n".join(passages[i] for i in sorted(selected))
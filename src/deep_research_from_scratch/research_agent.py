@@ -5,16 +5,40 @@ This module implements a research agent that can perform iterative web searches
 and synthesis to answer complex research questions.
 """
 
+import asyncio
+import time
+
 from pydantic import BaseModel, Field
 from typing_extensions import Literal
 
 from langgraph.graph import StateGraph, START, END
-from langchain_core.messages import SystemMessage, HumanMessage, ToolMessage, filter_messages
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage, filter_messages
+from langchain_core.runnables import RunnableConfig
 from langchain.chat_models import init_chat_model
 
 from deep_research_from_scratch.state_research import ResearcherState, ResearcherOutputState
-from deep_research_from_scratch.utils import tavily_search, get_today_str, think_tool
-from deep_research_from_scratch.prompts import research_agent_prompt, compress_research_system_prompt, compress_research_human_message
+from deep_research_from_scratch.budget import ResearchBudget, budget_report, usage_from_state
+from deep_research_from_scratch.blob_store import store_note
+from deep_research_from_scratch.checkpointing import get_checkpointer
+from deep_research_from_scratch.speculative import astream_with_speculation, cancel_speculative, run_tool_call
+from deep_research_from_scratch.model_router import add_tier_usage, collect_tier_usage, merge_tier_usage, route_model
+from deep_research_from_scratch.novelty import NOVELTY_STOP_REASON, SEARCH_TOOLS, has_converged, update_novelty
+from deep_research_from_scratch.utils import tavily_search, think_tool
+from deep_research_from_scratch.compaction import (
+    compacted_replacements,
+    compaction_candidates,
+    digest_section,
+    is_compacted,
+    message_tokens,
+    render_findings,
+)
+from deep_research_from_scratch.prompt_cache import add_cache_usage, cache_usage, cached_system_message
+from deep_research_from_scratch.prompts import (
+    research_agent_prompt,
+    compress_research_system_prompt,
+    compress_research_human_message,
+    update_research_digest_prompt,
+)
 
 # ===== CONFIGURATION =====
 
@@ -30,36 +54,68 @@ compress_model = init_chat_model(model="openai:gpt-4.1", max_tokens=32000) # mod
 
 # ===== AGENT NODES =====
 
-def llm_call(state: ResearcherState):
+async def llm_call(state: ResearcherState, config: RunnableConfig):
     """Analyze current state and decide on next actions.
 
     The model analyzes the current conversation state and decides whether to:
     1. Call search tools to gather more information
     2. Provide a final answer based on gathered information
 
+    Also accumulates the model's token usage and records which limit of the
+    run's `ResearchBudget`, if any, is now exhausted. With
+    `Settings.speculative_tool_execution_enabled` the response is streamed
+    and each tool call starts as soon as its arguments are complete. The
+    model tier is chosen by the model router (see `model_router`).
+
     Returns updated state with the model's response.
     """
-    return {
-        "researcher_messages": [
-            model_with_tools.invoke(
-                [SystemMessage(content=research_agent_prompt)] + state["researcher_messages"]
-            )
-        ]
+    started_at = state.get("research_started_at") or time.time()
+    digest = digest_section(state.get("research_digest", ""))
+    # Static prompt first (cacheable prefix), then the date and digest
+    system_message = cached_system_message(research_agent_prompt, model_with_tools, dynamic=digest)
+    messages = [system_message] + state["researcher_messages"]
+    tier, model = route_model("llm_call", messages, model_with_tools, tools=tools)
+    if model is not model_with_tools:
+        messages[0] = cached_system_message(research_agent_prompt, model, dynamic=digest)
+    from research_agent_framework.config import get_settings
+    call_started = time.perf_counter()
+    if get_settings().speculative_tool_execution_enabled:
+        response = await astream_with_speculation(model, messages, tools_by_name)
+    else:
+        response = await model.ainvoke(messages)
+    elapsed_s = time.perf_counter() - call_started
+
+    usage = getattr(response, "usage_metadata", None) or {}
+    update = {
+        "researcher_messages": [response],
+        "input_tokens": state.get("input_tokens", 0) + usage.get("input_tokens", 0),
+        "output_tokens": state.get("output_tokens", 0) + usage.get("output_tokens", 0),
+        "research_started_at": started_at,
+        "prompt_cache_usage": add_cache_usage(state.get("prompt_cache_usage", {}), cache_usage(response)),
+        "model_tier_usage": add_tier_usage(state.get("model_tier_usage"), tier, response, elapsed_s),
     }
+    stop_reason = ResearchBudget.from_config(config).exceeded(usage_from_state({**state, **update}))
+    update["budget_stop_reason"] = stop_reason or ""
+    return update
 
-def tool_node(state: ResearcherState):
+async def tool_node(state: ResearcherState):
     """Execute all tool calls from the previous LLM response.
 
-    Executes all tool calls from the previous LLM responses.
+    Tool calls from one AI message run concurrently; the resulting tool
+    messages keep the order of the calls. Calls already started
+    speculatively by `llm_call` are awaited instead of run again. Webpage
+    summaries made by the tools are added to `model_tier_usage`.
+    With `Settings.novelty_stop_enabled`, the round's search results are
+    scored for novelty, and the loop is marked as stopped once it has
+    converged.
     Returns updated state with tool execution results.
     """
     tool_calls = state["researcher_messages"][-1].tool_calls
 
-    # Execute all tool calls
-    observations = []
-    for tool_call in tool_calls:
-        tool = tools_by_name[tool_call["name"]]
-        observations.append(tool.invoke(tool_call["args"]))
+    # Execute all tool calls concurrently (gather preserves call order), collecting the
+    # model tiers of summaries made inside the tools
+    with collect_tier_usage() as collected:
+        observations = await asyncio.gather(*(run_tool_call(tool_call, tools_by_name) for tool_call in tool_calls))
 
     # Create tool message outputs
     tool_outputs = [
@@ -70,30 +126,119 @@ def tool_node(state: ResearcherState):
         ) for observation, tool_call in zip(observations, tool_calls)
     ]
 
-    return {"researcher_messages": tool_outputs}
+    update = {
+        "researcher_messages": tool_outputs,
+        "tool_call_iterations": state.get("tool_call_iterations", 0) + 1,
+    }
+    if collected.usage:
+        update["model_tier_usage"] = merge_tier_usage(state.get("model_tier_usage"), collected.usage)
+
+    from research_agent_framework.config import get_settings
+    search_outputs = [str(m.content) for m in tool_outputs if m.name in SEARCH_TOOLS]
+    if get_settings().novelty_stop_enabled and search_outputs:
+        update["novelty"] = update_novelty(state.get("novelty"), search_outputs)
+        if has_converged(update["novelty"]):
+            update["budget_stop_reason"] = NOVELTY_STOP_REASON
+    return update
+
+async def compact_history(state: ResearcherState) -> dict:
+    """Fold older tool outputs into the running research digest.
+
+    Runs after every tool round. When `Settings.history_compaction_enabled`
+    is set and the history exceeds `history_compaction_threshold_tokens`,
+    tool outputs older than the most recent rounds are summarized into
+    `research_digest` by the summarization model and replaced by a
+    placeholder, keeping per-turn prompts bounded. The original outputs move
+    to `raw_notes`. If the digest update fails, the history is left as is.
+    The digest model is subject to model routing (see `model_router`).
+    """
+    from research_agent_framework.config import get_settings
+    settings = get_settings()
+    messages = list(state.get("researcher_messages", []))
+    if not settings.history_compaction_enabled or message_tokens(messages) < settings.history_compaction_threshold_tokens:
+        return {}
+
+    candidates = compaction_candidates(messages, settings.history_compaction_keep_recent_rounds)
+    if not candidates:
+        return {}
+
+    research_topic = state.get("research_topic") or (str(messages[0].content) if messages else "")
+    prompt = update_research_digest_prompt.format(
+        research_topic=research_topic,
+        digest=state.get("research_digest", ""),
+        new_findings=render_findings(candidates),
+        max_words=settings.history_compaction_digest_max_words,
+    )
+    digest_messages = [HumanMessage(content=prompt)]
+    tier, model = route_model("compact_history", digest_messages, summarization_model)
+    call_started = time.perf_counter()
+    try:
+        response = await model.ainvoke(digest_messages)
+    except Exception as e:
+        try:
+            from research_agent_framework.config import get_logger
+            get_logger().warning(f"Failed to update research digest, keeping full history: {e}")
+        except Exception:
+            pass
+        return {}
+
+    replacements, raw_note = compacted_replacements(candidates)
+    return {
+        "researcher_messages": replacements,
+        "research_digest": str(response.content),
+        "raw_notes": [store_note(raw_note)],
+        "model_tier_usage": add_tier_usage(state.get("model_tier_usage"), tier, response, time.perf_counter() - call_started),
+    }
+
+def _drop_unanswered_tool_calls(messages: list) -> list:
+    """Strip tool calls left unexecuted when the budget stopped the loop.
 
-def compress_research(state: ResearcherState) -> dict:
+    Chat APIs reject an AI message whose tool calls have no tool results.
+    Speculative runs of those calls are cancelled.
+    """
+    if messages and getattr(messages[-1], "tool_calls", None):
+        last = messages[-1]
+        cancel_speculative(tool_call["id"] for tool_call in last.tool_calls)
+        return messages[:-1] + ([AIMessage(content=last.content)] if last.content else [])
+    return messages
+
+async def compress_research(state: ResearcherState, config: RunnableConfig) -> dict:
     """Compress research findings into a concise summary.
 
     Takes all the research messages and tool outputs and creates
-    a compressed summary suitable for the supervisor's decision-making.
+    a compressed summary suitable for the supervisor's decision-making,
+    together with a report of the run's budget usage. Large compressions
+    can be routed to another model tier (see `model_router`).
     """
 
-    system_message = compress_research_system_prompt.format(date=get_today_str())
-    messages = [SystemMessage(content=system_message)] + state.get("researcher_messages", []) + [HumanMessage(content=compress_research_human_message)]
-    response = compress_model.invoke(messages)
+    digest = digest_section(state.get("research_digest", ""))
+    system_message = cached_system_message(compress_research_system_prompt, compress_model, dynamic=digest)
+    researcher_messages = _drop_unanswered_tool_calls(list(state.get("researcher_messages", [])))
+    human_message = HumanMessage(content=compress_research_human_message.format(research_topic=state.get("research_topic", "")))
+    messages = [system_message] + researcher_messages + [human_message]
+    tier, model = route_model("compress_research", messages, compress_model)
+    if model is not compress_model:
+        messages[0] = cached_system_message(compress_research_system_prompt, model, dynamic=digest)
+    call_started = time.perf_counter()
+    response = await model.ainvoke(messages)
+    elapsed_s = time.perf_counter() - call_started
 
     # Extract raw notes from tool and AI messages
+    # (outputs folded into the digest were already moved to raw_notes by compact_history)
     raw_notes = [
         str(m.content) for m in filter_messages(
             state["researcher_messages"], 
             include_types=["tool", "ai"]
-        )
+        ) if not is_compacted(m)
     ]
 
     return {
         "compressed_research": str(response.content),
-        "raw_notes": ["\n".join(raw_notes)]
+        # Large notes are kept out of line; state carries a blob reference
+        "raw_notes": [store_note("\n".join(raw_notes))],
+        "budget_report": budget_report(ResearchBudget.from_config(config), state),
+        "prompt_cache_usage": add_cache_usage(state.get("prompt_cache_usage", {}), cache_usage(response)),
+        "model_tier_usage": add_tier_usage(state.get("model_tier_usage"), tier, response, elapsed_s),
     }
 
 # ===== ROUTING LOGIC =====
@@ -102,7 +247,8 @@ def should_continue(state: ResearcherState) -> Literal["tool_node", "compress_re
     """Determine whether to continue research or provide final answer.
 
     Determines whether the agent should continue the research loop or provide
-    a final answer based on whether the LLM made tool calls.
+    a final answer based on whether the LLM made tool calls and whether the
+    run's budget is exhausted.
 
     Returns:
         "tool_node": Continue to tool execution
@@ -111,12 +257,23 @@ def should_continue(state: ResearcherState) -> Literal["tool_node", "compress_re
     messages = state["researcher_messages"]
     last_message = messages[-1]
 
-    # If the LLM makes a tool call, continue to tool execution
-    if last_message.tool_calls:
+    # If the LLM makes a tool call within budget, continue to tool execution
+    if last_message.tool_calls and not state.get("budget_stop_reason"):
         return "tool_node"
     # Otherwise, we have a final answer
     return "compress_research"
 
+def after_tools(state: ResearcherState) -> Literal["compact_history", "compress_research"]:
+    """Go straight to compression once search results stopped adding anything new.
+
+    Returns:
+        "compress_research": The researcher converged (see `novelty`)
+        "compact_history": Continue the research loop
+    """
+    if state.get("budget_stop_reason") == NOVELTY_STOP_REASON:
+        return "compress_research"
+    return "compact_history"
+
 # ===== GRAPH CONSTRUCTION =====
 
 # Build the agent workflow
@@ -125,6 +282,7 @@ agent_builder = StateGraph(ResearcherState, output_schema=ResearcherOutputState)
 # Add nodes to the graph
 agent_builder.add_node("llm_call", llm_call)
 agent_builder.add_node("tool_node", tool_node)
+agent_builder.add_node("compact_history", compact_history)
 agent_builder.add_node("compress_research", compress_research)
 
 # Add edges to connect nodes
@@ -137,8 +295,16 @@ agent_builder.add_conditional_edges(
         "compress_research": "compress_research", # Provide final answer
     },
 )
-agent_builder.add_edge("tool_node", "llm_call") # Loop back for more research
+agent_builder.add_conditional_edges(
+    "tool_node",
+    after_tools,
+    {
+        "compact_history": "compact_history", # Fold old tool outputs into the digest if needed
+        "compress_research": "compress_research", # Converged: new results only repeat what was seen
+    },
+)
+agent_builder.add_edge("compact_history", "llm_call") # Loop back for more research
 agent_builder.add_edge("compress_research", END)
 
 # Compile the agent
-researcher_agent = agent_builder.compile()
+researcher_agent = agent_builder.compile(checkpointer=get_checkpointer())
@@ -20,6 +20,7 @@ from deep_research_from_scratch.prompts import final_report_generation_prompt
 from deep_research_from_scratch.state_scope import AgentState, AgentInputState
 from deep_research_from_scratch.research_agent_scope import clarify_with_user, write_research_brief
 from deep_research_from_scratch.multi_agent_supervisor import supervisor_agent
+from deep_research_from_scratch.checkpointing import get_checkpointer
 
 # ===== Config =====
 
@@ -70,5 +71,5 @@ deep_researcher_builder.add_edge("write_research_brief", "supervisor_subgraph")
 deep_researcher_builder.add_edge("supervisor_subgraph", "final_report_generation")
 deep_researcher_builder.add_edge("final_report_generation", END)
 
-# Compile the full workflow
-agent = deep_researcher_builder.compile()
+# Compile the full workflow (checkpointed when Settings.checkpoint_enabled; resume with checkpointing.resume_run)
+agent = deep_researcher_builder.compile(checkpointer=get_checkpointer())
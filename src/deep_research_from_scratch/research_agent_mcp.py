@@ -12,8 +12,14 @@ Key features:
 - Secure directory access with permission checking
 - Research compression for efficient processing
 - Lazy MCP client initialization for LangGraph Platform compatibility
+- Cached tool catalog and tool-bound model (reloaded on tools/list_changed or TTL)
+- Warm, health-checked MCP session pool instead of a server process per call, closed when the last active researcher finishes
+- Concurrent tool calls with a per-server in-flight cap and per-call timeout
+- Optional in-process filesystem backend (`Settings.mcp_file_backend = "native"`)
+- Ranked full-text search over the research files (`search_local_documents`)
 """
 
+import asyncio
 import os
 from typing import Dict, Optional
 
@@ -23,11 +29,25 @@ from langchain_mcp_adapters.sessions import Connection
 from langchain.chat_models import init_chat_model
 from langchain_core.messages import SystemMessage, HumanMessage, ToolMessage, filter_messages
 from langchain_mcp_adapters.client import MultiServerMCPClient
+from langchain_mcp_adapters.tools import load_mcp_tools
 from langgraph.graph import StateGraph, START, END
 
-from deep_research_from_scratch.prompts import research_agent_prompt_with_mcp, compress_research_system_prompt, compress_research_human_message
+from deep_research_from_scratch.prompts import (
+    compress_research_human_message,
+    compress_research_system_prompt,
+    mcp_identify_step_with_local_search,
+    mcp_identify_step_without_local_search,
+    mcp_local_search_tool,
+    mcp_search_files_tool,
+    research_agent_prompt_with_mcp,
+)
 from deep_research_from_scratch.state_research import ResearcherState, ResearcherOutputState
 from deep_research_from_scratch.utils import get_today_str, think_tool, get_current_dir
+from deep_research_from_scratch.blob_store import store_note
+from deep_research_from_scratch.document_index import search_local_documents
+from deep_research_from_scratch.mcp_catalog import ToolCatalog, with_message_handler
+from deep_research_from_scratch.mcp_pool import MCPSessionPool, PooledSession
+from research_agent_framework.mcp.file_tools import MCPFileTool
 
 # ===== CONFIGURATION =====
 
@@ -47,55 +67,206 @@ mcp_config: Dict[str, Connection] = {
     }
 }
 
-# Global client variable - will be initialized lazily
+# Server whose tools the native backend can serve in-process
+NATIVE_FILE_SERVER = "filesystem"
+
+# Global client and tool catalog - will be initialized lazily
 # Typed as Optional to help static analyzers
 _client: Optional[MultiServerMCPClient] = None
+_catalog: Optional[ToolCatalog] = None
+_pool: Optional[MCPSessionPool] = None
+# Per-server caps on in-flight tool calls, for the event loop they were created in
+_server_limits: Dict[str, asyncio.Semaphore] = {}
+_server_limits_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def _native_files() -> bool:
+    from research_agent_framework.config import get_settings
+    return get_settings().mcp_file_backend == "native"
+
+def _mcp_connections() -> Dict[str, Connection]:
+    """Servers reached over MCP (all but the natively served filesystem server, if enabled)."""
+    return {name: connection for name, connection in mcp_config.items() if not (_native_files() and name == NATIVE_FILE_SERVER)}
 
 def get_mcp_client():
-    """Get or initialize MCP client lazily to avoid issues with LangGraph Platform."""
+    """Get or initialize MCP client lazily to avoid issues with LangGraph Platform.
+
+    Sessions pass server messages to the tool catalog, so a
+    tools/list_changed notification invalidates the cached tool list.
+    """
     global _client
     if _client is None:
-        _client = MultiServerMCPClient(mcp_config)
+        _client = MultiServerMCPClient(with_message_handler(mcp_config, get_tool_catalog().handle_message))
     return _client
 
+def _close_foreign_pool(pool: MCPSessionPool) -> None:
+    """Close a pool that belongs to another event loop.
+
+    A pool whose loop is still running is closed on that loop. A finished
+    `asyncio.run` has already cancelled the pool's session tasks, which
+    closed the sessions and their server processes.
+    """
+    if pool.loop.is_running():
+        asyncio.run_coroutine_threadsafe(pool.close(), pool.loop)
+    elif not pool.loop.is_closed():
+        try:
+            from research_agent_framework.config import get_logger
+            get_logger().warning("Dropping an MCP session pool whose event loop is stopped; its sessions close with that loop")
+        except Exception:
+            pass
+
+async def get_session_pool() -> MCPSessionPool:
+    """Get the warm MCP session pool of the running event loop, starting it on first use.
+
+    A pool belongs to the event loop that created it and stays warm across
+    researcher runs on that loop (e.g. in a notebook kernel or a LangGraph
+    server). A new loop (e.g. a new `asyncio.run`) gets a new pool and the
+    previous one is closed; long-lived applications call
+    `close_session_pool` at shutdown.
+    """
+    global _pool
+    if _pool is None or _pool.loop is not asyncio.get_running_loop():
+        if _pool is not None:
+            _close_foreign_pool(_pool)
+        from research_agent_framework.config import get_settings
+        settings = get_settings()
+        _pool = MCPSessionPool(
+            with_message_handler(_mcp_connections(), get_tool_catalog().handle_message),
+            min_sessions=settings.mcp_pool_min_sessions,
+            max_sessions=settings.mcp_pool_max_sessions,
+            health_check_interval_s=settings.mcp_pool_health_check_interval_s,
+            health_check_timeout_s=settings.mcp_pool_health_check_timeout_s,
+        )
+    await _pool.start()
+    return _pool
+
+async def close_session_pool() -> None:
+    """Close the MCP session pool (and its server processes), if one is open.
+
+    Call at application shutdown; the next `get_session_pool` reopens it.
+    """
+    global _pool
+    if _pool is not None:
+        pool, _pool = _pool, None
+        await pool.close()
+
+def _pooling_enabled() -> bool:
+    from research_agent_framework.config import get_settings
+    return get_settings().mcp_session_pool_enabled
+
+async def _load_server_tools(server_name: str):
+    if _native_files() and server_name == NATIVE_FILE_SERVER:
+        from research_agent_framework.config import get_logger
+        return MCPFileTool(get_logger(), root=get_current_dir() / "files").as_langchain_tools()
+    if _pooling_enabled():
+        # Tools look the pool up per call, so they survive a change of event loop
+        return await load_mcp_tools(PooledSession(server_name, get_session_pool), server_name=server_name)
+    return await get_mcp_client().get_tools(server_name=server_name)
+
+def get_tool_catalog() -> ToolCatalog:
+    """Get or initialize the cached catalog of MCP tools (plus `think_tool` and `search_local_documents`)."""
+    global _catalog
+    if _catalog is None:
+        from research_agent_framework.config import get_settings
+        settings = get_settings()
+        _catalog = ToolCatalog(
+            list(mcp_config),
+            _load_server_tools,
+            extra_tools=[think_tool] + ([search_local_documents] if settings.local_index_enabled else []),
+            ttl_s=settings.mcp_tool_catalog_ttl_s,
+        )
+    return _catalog
+
 # Initialize models
 compress_model = init_chat_model(model="openai:gpt-4.1", max_tokens=32000)
 model = init_chat_model(model="anthropic:claude-sonnet-4-20250514")
 
 # ===== AGENT NODES =====
 
+def research_prompt(tools_by_name: dict) -> str:
+    """MCP research system prompt; `search_local_documents` is described only when it is bound."""
+    prompt = research_agent_prompt_with_mcp.format(date=get_today_str())
+    if search_local_documents.name not in tools_by_name:
+        return prompt
+    return prompt.replace(mcp_search_files_tool, f"{mcp_search_files_tool}\n{mcp_local_search_tool}").replace(
+        mcp_identify_step_without_local_search, mcp_identify_step_with_local_search
+    )
+
 async def llm_call(state: ResearcherState):
     """Analyze current state and decide on tool usage with MCP integration.
 
     This node:
-    1. Retrieves available tools from MCP server
-    2. Binds tools to the language model
+    1. Warms the MCP session pool and retrieves available tools from the (cached) MCP tool catalog
+    2. Reuses the model bound to those tools unless the tool list changed
     3. Processes user input and decides on tool usage
 
     Returns updated state with model response.
     """
-    # Get available tools from MCP server
-    client = get_mcp_client()
-    mcp_tools = await client.get_tools()
-
-    # Use MCP tools for local document access
-    tools = mcp_tools + [think_tool]
+    if _pooling_enabled() and _mcp_connections():
+        await get_session_pool()
 
-    # Initialize model with tool binding
-    model_with_tools = model.bind_tools(tools)
+    # MCP tools for local document access plus think_tool, bound once per tool list
+    catalog = get_tool_catalog()
+    model_with_tools = await catalog.bound_model(model)
 
     # Process user input with system prompt. Ensure we pass a concrete list
     # to the model invocation (state stores a Sequence[BaseMessage]).
-    messages = [SystemMessage(content=research_agent_prompt_with_mcp.format(date=get_today_str()))] + list(state.get("researcher_messages", []))
-    return {"researcher_messages": [model_with_tools.invoke(messages)]}
+    system_prompt = research_prompt(await catalog.tools_by_name())
+    messages = [SystemMessage(content=system_prompt)] + list(state.get("researcher_messages", []))
+    return {"researcher_messages": [await model_with_tools.ainvoke(messages)]}
+
+def _server_limit(server: str) -> asyncio.Semaphore:
+    """Semaphore capping in-flight tool calls to `server` (shared by concurrent researchers)."""
+    global _server_limits_loop
+    loop = asyncio.get_running_loop()
+    if _server_limits_loop is not loop:
+        _server_limits.clear()
+        _server_limits_loop = loop
+    if server not in _server_limits:
+        from research_agent_framework.config import get_settings
+        _server_limits[server] = asyncio.Semaphore(max(1, get_settings().mcp_tool_max_concurrency_per_server))
+    return _server_limits[server]
+
+async def execute_tool_call(tool_call: dict, tools_by_name: dict) -> ToolMessage:
+    """Execute one tool call and wrap the result (or the failure) in a ToolMessage.
+
+    MCP tools run under their server's in-flight cap and
+    `Settings.mcp_tool_call_timeout_s`. Unknown tools, tool errors and
+    timeouts produce an error ToolMessage instead of raising, so one failed
+    call does not abort the other calls of the turn.
+    """
+    from research_agent_framework.config import get_settings
+    name = tool_call["name"]
+    try:
+        tool = tools_by_name.get(name)
+        if tool is None:
+            raise KeyError(f"unknown tool {name!r}")
+        if name == "think_tool":
+            # think_tool is sync, use regular invoke
+            observation = tool.invoke(tool_call["args"])
+        else:
+            # MCP tools are async, use ainvoke
+            server = get_tool_catalog().server_of(name) or "local"
+            async with _server_limit(server):
+                observation = await asyncio.wait_for(tool.ainvoke(tool_call["args"]), get_settings().mcp_tool_call_timeout_s)
+    except Exception as e:
+        error = f"timed out after {get_settings().mcp_tool_call_timeout_s}s" if isinstance(e, asyncio.TimeoutError) else f"{type(e).__name__}: {e}"
+        try:
+            from research_agent_framework.config import get_logger
+            get_logger().warning(f"MCP tool call {name} failed: {error}")
+        except Exception:
+            pass
+        return ToolMessage(content=f"Error: {name} failed ({error})", name=name, tool_call_id=tool_call["id"], status="error")
+    return ToolMessage(content=observation, name=name, tool_call_id=tool_call["id"])
 
 async def tool_node(state: ResearcherState):
     """Execute tool calls using MCP tools.
 
     This node:
     1. Retrieves current tool calls from the last message
-    2. Executes all tool calls using async operations (required for MCP)
-    3. Returns formatted tool results
+    2. Executes all tool calls concurrently (at most
+       `Settings.mcp_tool_max_concurrency_per_server` in flight per server)
+    3. Returns tool results in the order of the calls; failed or timed out
+       calls become error tool messages
 
     Note: MCP requires async operations due to inter-process communication
     with the MCP server subprocess. This is unavoidable.
@@ -105,43 +276,15 @@ async def tool_node(state: ResearcherState):
     last_msg = list(state.get("researcher_messages", []))[-1]
     tool_calls = getattr(last_msg, "tool_calls", [])
 
-    async def execute_tools():
-        """Execute all tool calls. MCP tools require async execution."""
-        # Get fresh tool references from MCP server
-        client = get_mcp_client()
-        mcp_tools = await client.get_tools()
-        tools = mcp_tools + [think_tool]
-        tools_by_name = {tool.name: tool for tool in tools}
-
-        # Execute tool calls (sequentially for reliability)
-        observations = []
-        for tool_call in tool_calls:
-            tool = tools_by_name[tool_call["name"]]
-            if tool_call["name"] == "think_tool":
-                # think_tool is sync, use regular invoke
-                observation = tool.invoke(tool_call["args"])
-            else:
-                # MCP tools are async, use ainvoke
-                observation = await tool.ainvoke(tool_call["args"])
-            observations.append(observation)
-
-        # Format results as tool messages
-        tool_outputs = [
-            ToolMessage(
-                content=observation,
-                name=tool_call["name"],
-                tool_call_id=tool_call["id"],
-            )
-            for observation, tool_call in zip(observations, tool_calls)
-        ]
-
-        return tool_outputs
-
-    messages = await execute_tools()
-
-    return {"researcher_messages": messages}
-
-def compress_research(state: ResearcherState) -> dict:
+    # Tool references from the cached catalog
+    tools_by_name = await get_tool_catalog().tools_by_name()
+
+    # gather preserves call order
+    messages = await asyncio.gather(*(execute_tool_call(tool_call, tools_by_name) for tool_call in tool_calls))
+
+    return {"researcher_messages": list(messages)}
+
+async def compress_research(state: ResearcherState) -> dict:
     """Compress research findings into a concise summary.
 
     Takes all the research messages and tool outputs and creates
@@ -150,11 +293,10 @@ def compress_research(state: ResearcherState) -> dict:
     This function filters out think_tool calls and focuses on substantive
     file-based research content from MCP tools.
     """
-
     system_message = compress_research_system_prompt.format(date=get_today_str())
     messages = [SystemMessage(content=system_message)] + list(state.get("researcher_messages", [])) + [HumanMessage(content=compress_research_human_message)]
 
-    response = compress_model.invoke(messages)
+    response = await compress_model.ainvoke(messages)
 
     # Extract raw notes from tool and AI messages
     raw_notes = [
@@ -166,7 +308,7 @@ def compress_research(state: ResearcherState) -> dict:
 
     return {
         "compressed_research": str(response.content),
-        "raw_notes": ["\n".join(raw_notes)]
+        "raw_notes": [store_note("\n".join(raw_notes))]
     }
 
 # ===== ROUTING LOGIC =====
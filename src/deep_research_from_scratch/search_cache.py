@@ -0,0 +1,185 @@
+"""Query-Level Cache for the tavily_search Tool.
+
+This module caches complete `tavily_search` outcomes, both the deduplicated
+provider results and the final formatted tool output, keyed by the
+normalized query and the search parameters. Entries expire after a per-topic
+TTL: news goes stale within minutes, while general reference results stay
+useful for a day. The cache lives in memory and can optionally persist to
+SQLite so repeated queries are also served across runs.
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple, Union
+
+# Default time-to-live per Tavily topic, in seconds
+DEFAULT_TOPIC_TTLS: Dict[str, float] = {
+    "news": 15 * 60,
+    "finance": 60 * 60,
+    "general": 24 * 60 * 60,
+}
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s]", re.UNICODE)
+
+def normalize_query(query: str) -> str:
+    """Normalize a query so trivially different spellings share a cache entry.
+
+    Lowercases, drops punctuation and collapses whitespace, e.g.
+    ``"  Best Coffee, SF? "`` and ``"best coffee sf"`` normalize identically.
+    """
+    return " ".join(_PUNCTUATION_RE.sub(" ", query.lower()).split())
+
+# ===== CACHE =====
+
+@dataclass
+class SearchCacheEntry:
+    """Cached outcome of one `tavily_search` call."""
+    unique_results: dict
+    formatted_output: str
+    created_at: float
+
+@dataclass
+class SearchCacheStats:
+    """Hit/miss counters for a `SearchResultCache`."""
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    writes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> dict:
+        """Return the counters and hit rate as a plain dict."""
+        return {**asdict(self), "hit_rate": self.hit_rate}
+
+class SearchResultCache:
+    """TTL cache of `tavily_search` outcomes keyed by normalized query and parameters.
+
+    Args:
+        ttls: Per-topic time-to-live in seconds (merged over `DEFAULT_TOPIC_TTLS`)
+        max_entries: Capacity of the in-memory tier (least recently used entries are dropped)
+        path: Optional SQLite file persisting entries across runs
+        clock: Time source returning seconds since the epoch (overridable in tests)
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = 256,
+        path: Optional[Union[str, Path]] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Create the cache, opening (or creating) the SQLite file if `path` is given."""
+        self.ttls = {**DEFAULT_TOPIC_TTLS, **(ttls or {})}
+        self.max_entries = max_entries
+        self.clock = clock
+        self.stats = SearchCacheStats()
+        self._memory: OrderedDict[Tuple, SearchCacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if path is not None:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(path), check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS searches ("
+                " key TEXT PRIMARY KEY,"
+                " unique_results TEXT NOT NULL,"
+                " formatted_output TEXT NOT NULL,"
+                " created_at REAL NOT NULL)"
+            )
+            self._db.commit()
+
+    @staticmethod
+    def make_key(query: str, max_results: int, topic: str, include_raw_content: bool) -> Tuple:
+        """Build the cache key for one search request."""
+        return (normalize_query(query), max_results, topic, include_raw_content)
+
+    def ttl_for(self, topic: str) -> float:
+        """Return the TTL (seconds) applied to entries of `topic`."""
+        return self.ttls.get(topic, self.ttls["general"])
+
+    def get(self, query: str, max_results: int, topic: str, include_raw_content: bool) -> Optional[SearchCacheEntry]:
+        """Return the fresh cached entry for the request, or None."""
+        key = self.make_key(query, max_results, topic, include_raw_content)
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None and self._db is not None:
+                row = self._db.execute(
+                    "SELECT unique_results, formatted_output, created_at FROM searches WHERE key = ?",
+                    (json.dumps(key),),
+                ).fetchone()
+                if row is not None:
+                    entry = SearchCacheEntry(json.loads(row[0]), row[1], row[2])
+
+            if entry is not None and self.clock() - entry.created_at > self.ttl_for(topic):
+                self.stats.expired += 1
+                self._drop(key)
+                entry = None
+
+            if entry is None:
+                self.stats.misses += 1
+                return None
+
+            self._remember(key, entry)
+            self.stats.hits += 1
+            return entry
+
+    def put(
+        self,
+        query: str,
+        max_results: int,
+        topic: str,
+        include_raw_content: bool,
+        unique_results: dict,
+        formatted_output: str,
+    ) -> SearchCacheEntry:
+        """Store the outcome of a search request."""
+        key = self.make_key(query, max_results, topic, include_raw_content)
+        entry = SearchCacheEntry(unique_results, formatted_output, self.clock())
+        with self._lock:
+            self._remember(key, entry)
+            self.stats.writes += 1
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO searches (key, unique_results, formatted_output, created_at) VALUES (?, ?, ?, ?)",
+                    (json.dumps(key), json.dumps(unique_results, default=str), formatted_output, entry.created_at),
+                )
+                self._db.commit()
+        return entry
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM searches")
+                self._db.commit()
+
+    def close(self) -> None:
+        """Close the SQLite connection, if any."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _remember(self, key: Tuple, entry: SearchCacheEntry) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _drop(self, key: Tuple) -> None:
+        self._memory.pop(key, None)
+        if self._db is not None:
+            self._db.execute("DELETE FROM searches WHERE key = ?", (json.dumps(key),))
+            self._db.commit()
@@ -0,0 +1,187 @@
+"""Speculative Tool Execution from Streamed Tool-Call Deltas.
+
+Normally `tool_node` starts only after the model's whole response has
+arrived, although the arguments of each tool call usually finish streaming
+well before the response ends. In streaming mode, `llm_call` feeds the
+accumulated response to a `ToolCallSpeculator` after every chunk, which
+starts a tool as soon as its call has an id, a known name and arguments that
+parse as a complete JSON object (a JSON object cannot parse before its
+closing brace arrives). Search and summarization then overlap with the rest
+of the generation.
+
+Started calls are kept in a per-run table keyed by tool call id;
+`tool_node` collects them with `run_tool_call`, which falls back to a normal
+call when nothing was started (e.g. after resuming from a checkpoint) or when
+the final arguments differ from the speculated ones. Calls that are never
+executed (the budget stopped the loop) are cancelled with
+`cancel_speculative`.
+
+The supervisor runs each researcher inside `speculation_scope`, which gives
+the run its own table (found by the graph's nodes through a context
+variable, like the URL registry) and cancels whatever is still pending when
+the run ends, fails or is cancelled between `llm_call` and `tool_node`.
+Researchers run outside a scope share a process-wide table.
+"""
+
+import asyncio
+import json
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Tuple
+
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.messages.utils import message_chunk_to_message
+
+from deep_research_from_scratch.model_router import (
+    collect_tier_usage,
+    record_collected_usage,
+)
+
+# tool_call_id -> (arguments the tool was started with, task returning (output, model tier usage))
+PendingCalls = Dict[str, Tuple[Dict[str, Any], "asyncio.Task[Any]"]]
+
+# Table of runs outside a `speculation_scope`
+_pending: PendingCalls = {}
+
+_current_pending: ContextVar[Optional[PendingCalls]] = ContextVar("speculative_calls", default=None)
+
+def _pending_calls() -> PendingCalls:
+    """Return the table of speculative calls of the current run."""
+    table = _current_pending.get()
+    return _pending if table is None else table
+
+def _cancel_all(table: PendingCalls) -> int:
+    cancelled = 0
+    while table:
+        _, (_, task) = table.popitem()
+        task.cancel()
+        cancelled += 1
+    return cancelled
+
+@contextmanager
+def speculation_scope() -> Iterator[PendingCalls]:
+    """Give the run inside the block its own table of speculative calls.
+
+    Calls still pending when the block exits are cancelled, so a run that
+    fails or is cancelled between `llm_call` and `tool_node` doesn't leave
+    tool tasks behind.
+    """
+    table: PendingCalls = {}
+    token = _current_pending.set(table)
+    try:
+        yield table
+    finally:
+        _current_pending.reset(token)
+        orphaned = _cancel_all(table)
+        if orphaned:
+            try:
+                from research_agent_framework.config import get_logger
+                get_logger().debug(f"Cancelled {orphaned} speculative tool call(s) left by an interrupted run")
+            except Exception:
+                pass
+
+def _parse_complete_args(args: Any) -> Optional[Dict[str, Any]]:
+    """Return streamed tool-call arguments if they form a complete JSON object, else None."""
+    if isinstance(args, dict):
+        return args
+    if not isinstance(args, str) or not args.strip():
+        return None
+    try:
+        parsed = json.loads(args)
+    except ValueError:
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+async def _invoke_collecting_usage(tool: Any, args: Dict[str, Any]) -> Tuple[Any, Dict[str, Any]]:
+    """Run a tool, returning its output and the model tier usage of calls made inside it.
+
+    The task starts before `tool_node` opens its usage collector, so the
+    usage is handed over by `run_tool_call`.
+    """
+    with collect_tier_usage() as collector:
+        output = await tool.ainvoke(args)
+    return output, collector.usage
+
+class ToolCallSpeculator:
+    """Starts tool calls of a streaming response as soon as their arguments are complete.
+
+    Args:
+        tools_by_name: Tools the model may call, by name
+    """
+
+    def __init__(self, tools_by_name: Mapping[str, Any]):
+        """Start with no speculative calls."""
+        self.tools_by_name = tools_by_name
+        self.started: Dict[str, Dict[str, Any]] = {}
+
+    def observe(self, message: AIMessageChunk) -> None:
+        """Start every tool call of the accumulated `message` whose arguments just completed."""
+        for chunk in getattr(message, "tool_call_chunks", None) or []:
+            call_id, name = chunk.get("id"), chunk.get("name")
+            if not call_id or call_id in self.started or name not in self.tools_by_name:
+                continue
+            args = _parse_complete_args(chunk.get("args"))
+            if args is not None:
+                self._start(call_id, name, args)
+
+    def finish(self, message: AIMessage) -> None:
+        """Start the remaining tool calls of the final `message` (e.g. calls without arguments)."""
+        for tool_call in getattr(message, "tool_calls", None) or []:
+            if tool_call["id"] and tool_call["id"] not in self.started and tool_call["name"] in self.tools_by_name:
+                self._start(tool_call["id"], tool_call["name"], tool_call["args"])
+
+    def _start(self, call_id: str, name: str, args: Dict[str, Any]) -> None:
+        task = asyncio.ensure_future(_invoke_collecting_usage(self.tools_by_name[name], args))
+        # Errors are re-raised when tool_node awaits the task; don't report them as unretrieved
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        _pending_calls()[call_id] = (args, task)
+        self.started[call_id] = args
+
+async def astream_with_speculation(model: Any, messages: Any, tools_by_name: Mapping[str, Any]) -> AIMessage:
+    """Stream `model`'s response, starting tool calls as their arguments complete.
+
+    Args:
+        model: Tool-bound chat model
+        messages: Prompt messages
+        tools_by_name: Tools the model may call, by name
+
+    Returns:
+        The complete response as an AIMessage (same as `model.ainvoke`)
+    """
+    speculator = ToolCallSpeculator(tools_by_name)
+    response: Optional[AIMessageChunk] = None
+    try:
+        async for chunk in model.astream(messages):
+            response = chunk if response is None else response + chunk
+            speculator.observe(response)
+    except BaseException:
+        cancel_speculative(speculator.started)
+        raise
+    if response is None:
+        return AIMessage(content="")
+    message = message_chunk_to_message(response)
+    speculator.finish(message)
+    return message
+
+async def run_tool_call(tool_call: Mapping[str, Any], tools_by_name: Mapping[str, Any]) -> Any:
+    """Return the output of `tool_call`, awaiting its speculative run if one was started."""
+    pending = _pending_calls().pop(tool_call.get("id") or "", None)
+    if pending is not None:
+        args, task = pending
+        if args == tool_call["args"]:
+            output, usage = await task
+            record_collected_usage(usage)
+            return output
+        task.cancel()
+    return await tools_by_name[tool_call["name"]].ainvoke(tool_call["args"])
+
+def cancel_speculative(tool_call_ids: Iterable[str]) -> int:
+    """Cancel speculative runs of tool calls that will not be executed; return how many were pending."""
+    table = _pending_calls()
+    cancelled = 0
+    for call_id in tool_call_ids:
+        pending = table.pop(call_id, None)
+        if pending is not None:
+            pending[1].cancel()
+            cancelled += 1
+    return cancelled
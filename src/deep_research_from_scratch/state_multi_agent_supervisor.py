@@ -32,6 +32,12 @@ class SupervisorState(TypedDict):
     research_iterations: int = 0
     # Raw unprocessed research notes collected from sub-agent research
     raw_notes: Annotated[list[str], operator.add] = []
+    # Identifier of this supervisor run, used to scope resources shared by its researchers
+    run_id: str
+    # Provider prompt-cache read/write tokens of the supervisor and its researchers
+    prompt_cache_usage: dict
+    # Model calls, tokens and latency per routed model tier across the researchers
+    model_tier_usage: dict
 
 @tool
 class ConductResearch(BaseModel):
@@ -20,13 +20,27 @@ class ResearcherState(TypedDict):
 
     This state tracks the researcher's conversation, iteration count for limiting
     tool calls, the research topic being investigated, compressed findings,
-    and raw research notes for detailed analysis.
+    and raw research notes for detailed analysis. Token usage, start time and
+    the budget stop reason are tracked for the budget controller (see `budget`);
+    `research_digest` holds older tool outputs folded in by rolling compaction;
+    `prompt_cache_usage` accumulates provider prompt-cache reads and writes;
+    `novelty` tracks the URLs and content seen by search rounds (see `novelty`);
+    `model_tier_usage` counts calls and tokens per routed model tier.
     """
     researcher_messages: Annotated[Sequence[BaseMessage], add_messages]
     tool_call_iterations: int
     research_topic: str
     compressed_research: str
     raw_notes: Annotated[List[str], operator.add]
+    input_tokens: int
+    output_tokens: int
+    research_started_at: float
+    budget_stop_reason: str
+    budget_report: dict
+    research_digest: str
+    prompt_cache_usage: dict
+    novelty: dict
+    model_tier_usage: dict
 
 class ResearcherOutputState(TypedDict):
     """
@@ -38,6 +52,9 @@ class ResearcherOutputState(TypedDict):
     compressed_research: str
     raw_notes: Annotated[List[str], operator.add]
     researcher_messages: Annotated[Sequence[BaseMessage], add_messages]
+    budget_report: dict
+    prompt_cache_usage: dict
+    model_tier_usage: dict
 
 # ===== STRUCTURED OUTPUT SCHEMAS =====
 
@@ -63,3 +80,13 @@ class Summary(BaseModel):
     """Schema for webpage content summarization."""
     summary: str = Field(description="Concise summary of the webpage content")
     key_excerpts: str = Field(description="Important quotes and excerpts from the content")
+
+class DocumentSummary(BaseModel):
+    """Summary of one document in a multi-document summarization request."""
+    document_id: int = Field(description="The id attribute of the <document> being summarized")
+    summary: str = Field(description="Concise summary of the webpage content")
+    key_excerpts: str = Field(description="Important quotes and excerpts from the content")
+
+class MultiDocumentSummary(BaseModel):
+    """Schema for packed summarization of several webpages in one request."""
+    summaries: List[DocumentSummary] = Field(description="One summary per document, for every document")
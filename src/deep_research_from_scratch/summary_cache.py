@@ -0,0 +1,184 @@
+"""Content-Addressed Cache for Webpage Summaries.
+
+This module provides a two-tier cache for `summarize_webpage_content` results:
+an in-memory LRU tier for the current process and an optional SQLite tier that
+persists summaries across runs. Entries are keyed by a hash of the raw page
+content together with the prompt template and the summarization model identity,
+so a prompt or model change never serves stale summaries.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional, Union
+
+# ===== HELPERS =====
+
+def fingerprint(text: str) -> str:
+    """Return the SHA-256 hex digest of `text`."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+def make_cache_key(content: str, prompt: str, model_id: str) -> str:
+    """Build the cache key for summarizing `content` with `prompt` on `model_id`.
+
+    Args:
+        content: Raw webpage content to be summarized
+        prompt: Prompt template (unrendered) used for summarization
+        model_id: Identity of the summarization model
+
+    Returns:
+        Hex digest uniquely identifying the (content, prompt, model) triple
+    """
+    return fingerprint("\x1f".join((fingerprint(prompt), model_id, fingerprint(content))))
+
+# ===== CACHE =====
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a `SummaryCache`."""
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+
+    @property
+    def hits(self) -> int:
+        """Return the lookups served from either tier."""
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> dict:
+        """Return the counters, total hits and hit rate as a plain dict."""
+        return {**asdict(self), "hits": self.hits, "hit_rate": self.hit_rate}
+
+class SummaryCache:
+    """Two-tier (memory LRU + SQLite) cache of formatted webpage summaries.
+
+    Args:
+        path: SQLite database file for the persistent tier; None keeps the cache in memory only
+        max_memory_entries: Capacity of the in-memory LRU tier
+        max_disk_bytes: Size budget of stored summaries in the SQLite tier;
+            least recently used rows are evicted beyond it
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        max_memory_entries: int = 512,
+        max_disk_bytes: int = 64 * 1024 * 1024,
+    ):
+        """Create the cache, opening (or creating) the SQLite tier if `path` is given."""
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.stats = CacheStats()
+        self._memory: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if path is not None:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(path), check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS summaries ("
+                " key TEXT PRIMARY KEY,"
+                " prompt_hash TEXT NOT NULL,"
+                " value TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " last_access REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS summaries_last_access ON summaries(last_access)")
+            self._db.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached summary for `key`, or None on a miss."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.stats.memory_hits += 1
+                return self._memory[key]
+
+            if self._db is not None:
+                row = self._db.execute("SELECT value FROM summaries WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    self._db.execute("UPDATE summaries SET last_access = ? WHERE key = ?", (time.time(), key))
+                    self._db.commit()
+                    self._remember(key, row[0])
+                    self.stats.disk_hits += 1
+                    return row[0]
+
+            self.stats.misses += 1
+            return None
+
+    def put(self, key: str, value: str, prompt: str) -> None:
+        """Store `value` under `key`, tagging it with the prompt it was produced with."""
+        with self._lock:
+            self._remember(key, value)
+            self.stats.writes += 1
+            if self._db is not None:
+                size = len(value.encode("utf-8"))
+                self._db.execute(
+                    "INSERT OR REPLACE INTO summaries (key, prompt_hash, value, size, last_access) VALUES (?, ?, ?, ?, ?)",
+                    (key, fingerprint(prompt), value, size, time.time()),
+                )
+                self._evict_disk()
+                self._db.commit()
+
+    def invalidate_prompt(self, current_prompt: str) -> int:
+        """Drop every entry produced with a prompt other than `current_prompt`.
+
+        Stale entries can never be hit (the prompt is part of the key), so this
+        only reclaims space after `summarize_webpage_prompt` changes.
+
+        Returns:
+            Number of persistent rows removed
+        """
+        with self._lock:
+            # In-memory entries carry no prompt tag; they are cheap to rebuild
+            self._memory.clear()
+            if self._db is None:
+                return 0
+            cursor = self._db.execute("DELETE FROM summaries WHERE prompt_hash != ?", (fingerprint(current_prompt),))
+            self._db.commit()
+            return cursor.rowcount
+
+    def clear(self) -> None:
+        """Remove all entries from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM summaries")
+                self._db.commit()
+
+    def close(self) -> None:
+        """Close the SQLite connection, if any."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _remember(self, key: str, value: str) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _evict_disk(self) -> None:
+        assert self._db is not None
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM summaries").fetchone()[0]
+        while total > self.max_disk_bytes:
+            row = self._db.execute("SELECT key, size FROM summaries ORDER BY last_access ASC LIMIT 1").fetchone()
+            if row is None:
+                break
+            self._db.execute("DELETE FROM summaries WHERE key = ?", (row[0],))
+            total -= row[1]
+            self.stats.evictions += 1
@@ -0,0 +1,176 @@
+"""Run-Scoped URL Registry.
+
+This module lets parallel researchers launched by one supervisor run share
+the work of processing search results. The first researcher to see a URL
+claims it and summarizes the page; every other researcher reuses the
+finished result, or waits on the in-flight one, instead of paying for the
+same summarization again. Callers choose the key: the search pipeline
+uses the URL together with a digest of the (query-filtered) text it
+summarizes, so researchers with different queries don't share summaries.
+
+The supervisor activates a registry with `use_url_registry` around the
+researcher fan-out and releases it when the run ends, or as soon as one of
+its nodes fails or is cancelled (`release_url_registry_on_error`). Because asyncio tasks and LangChain's executor helpers
+copy the current context, researchers and their tools find it through
+`get_current_url_registry` without any extra plumbing.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, Tuple
+
+# ===== REGISTRY =====
+
+@dataclass
+class UrlRegistryStats:
+    """Counters describing how much work a `UrlRegistry` saved."""
+    processed: int = 0
+    reused: int = 0
+    awaited_in_flight: int = 0
+
+class UrlRegistry:
+    """Thread-safe map from URL to the (possibly pending) processed result.
+
+    Results are held in `concurrent.futures.Future` objects so both blocking
+    callers (sync tools running in worker threads) and coroutines can wait
+    on them.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty registry."""
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.stats = UrlRegistryStats()
+
+    def __contains__(self, url: str) -> bool:
+        """Return whether `url` was claimed (finished or in flight)."""
+        with self._lock:
+            return url in self._futures
+
+    def __len__(self) -> int:
+        """Return the number of claimed URLs."""
+        with self._lock:
+            return len(self._futures)
+
+    def claim(self, url: str) -> Tuple[Future, bool]:
+        """Return the future for `url` and whether the caller now owns it.
+
+        The owner must resolve the future with `complete` or `fail`.
+        """
+        with self._lock:
+            future = self._futures.get(url)
+            if future is not None:
+                if future.done():
+                    self.stats.reused += 1
+                else:
+                    self.stats.awaited_in_flight += 1
+                return future, False
+            future = Future()
+            self._futures[url] = future
+            self.stats.processed += 1
+            return future, True
+
+    def complete(self, url: str, result: Any) -> None:
+        """Publish the processed result for a claimed `url`."""
+        with self._lock:
+            future = self._futures[url]
+        future.set_result(result)
+
+    def fail(self, url: str, error: BaseException) -> None:
+        """Release a claimed `url` after its processing failed.
+
+        The entry is dropped so a later caller can retry, and current waiters
+        receive the error.
+        """
+        with self._lock:
+            future = self._futures.pop(url)
+        if not isinstance(error, Exception):
+            # Don't leak the owner's cancellation into waiters, which would look cancelled themselves
+            error = RuntimeError(f"processing of {url} was interrupted: {error!r}")
+        future.set_exception(error)
+
+    def get_or_process(self, url: str, process: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Return the result for `url`, calling `process` only if nobody else has.
+
+        Returns:
+            Tuple of (result, reused) where `reused` is True when the result
+            came from another caller
+        """
+        future, owner = self.claim(url)
+        if owner:
+            try:
+                result = process()
+            except BaseException as e:
+                self.fail(url, e)
+                raise
+            self.complete(url, result)
+            return result, False
+        try:
+            return future.result(), True
+        except Exception:
+            # The owner failed; process independently rather than propagating its error
+            return process(), False
+
+    async def aget_or_process(self, url: str, process: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """Async variant of `get_or_process`; waits on in-flight work without blocking the loop."""
+        future, owner = self.claim(url)
+        if owner:
+            try:
+                result = await process()
+            except BaseException as e:
+                self.fail(url, e)
+                raise
+            self.complete(url, result)
+            return result, False
+        try:
+            return await asyncio.wrap_future(future), True
+        except Exception:
+            return await process(), False
+
+# ===== RUN SCOPING =====
+
+_current_registry: ContextVar[Optional[UrlRegistry]] = ContextVar("url_registry", default=None)
+
+# Registries of supervisor runs still in progress, keyed by SupervisorState["run_id"]
+_run_registries: Dict[str, UrlRegistry] = {}
+_run_registries_lock = threading.Lock()
+
+def get_current_url_registry() -> Optional[UrlRegistry]:
+    """Return the registry active in the current context, if any."""
+    return _current_registry.get()
+
+@contextmanager
+def use_url_registry(registry: Optional[UrlRegistry]) -> Iterator[Optional[UrlRegistry]]:
+    """Activate `registry` for code (and tasks spawned) inside the block."""
+    token = _current_registry.set(registry)
+    try:
+        yield registry
+    finally:
+        _current_registry.reset(token)
+
+def get_url_registry(run_id: str) -> UrlRegistry:
+    """Return the registry for supervisor run `run_id`, creating it on first use."""
+    with _run_registries_lock:
+        registry = _run_registries.get(run_id)
+        if registry is None:
+            registry = _run_registries[run_id] = UrlRegistry()
+        return registry
+
+def release_url_registry(run_id: str) -> Optional[UrlRegistry]:
+    """Forget the registry of a finished supervisor run and return it."""
+    with _run_registries_lock:
+        return _run_registries.pop(run_id, None)
+
+@contextmanager
+def release_url_registry_on_error(run_id: Optional[str]) -> Iterator[None]:
+    """Release the registry of run `run_id` if the block raises or is cancelled."""
+    try:
+        yield
+    except BaseException:
+        if run_id:
+            release_url_registry(run_id)
+        raise
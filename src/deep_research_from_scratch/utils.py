@@ -5,22 +5,39 @@ This module provides search and content processing utilities for the research ag
 including web search capabilities and content summarization tools.
 """
 
+import asyncio
+import inspect
+import time
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from datetime import datetime
-from typing_extensions import Annotated, List, Literal
+from typing_extensions import Annotated, Any, AsyncIterator, Awaitable, Callable, Dict, List, Literal, Optional, Tuple
 
 from langchain.chat_models import init_chat_model 
 from langchain_core.messages import HumanMessage
 from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import tool, InjectedToolArg
 try:
-    from tavily import TavilyClient
+    from tavily import AsyncTavilyClient, TavilyClient
 except Exception:
     # Tavily (network) client not available in local/dev/test environments.
+    AsyncTavilyClient = None
     TavilyClient = None
 
-from deep_research_from_scratch.state_research import Summary
-from deep_research_from_scratch.prompts import summarize_webpage_prompt
+from deep_research_from_scratch.state_research import MultiDocumentSummary, Summary
+from deep_research_from_scratch.prompts import (
+    summarize_chunk_summaries_prompt,
+    summarize_multiple_webpages_prompt,
+    summarize_webpage_prompt,
+)
+from deep_research_from_scratch.chunking import CHARS_PER_TOKEN, count_tokens, split_into_chunks
+from deep_research_from_scratch.packing import PackPlan, pack_documents
+from deep_research_from_scratch.relevance import filter_relevant_passages
+from deep_research_from_scratch.fingerprint import group_near_duplicates
+from deep_research_from_scratch.summary_cache import SummaryCache, fingerprint, make_cache_key
+from deep_research_from_scratch.url_registry import get_current_url_registry
+from deep_research_from_scratch.model_router import record_tier_usage, route_model
+from deep_research_from_scratch.search_cache import SearchResultCache
 
 # ===== UTILITY FUNCTIONS =====
 
@@ -47,6 +64,66 @@ summarization_model = init_chat_model(model="openai:gpt-4.1-mini")
 # Defer creating real network clients until explicitly enabled in production.
 # Keeping `tavily_client` as None prevents accidental network calls during tests.
 tavily_client = None
+# Async counterpart used by `tavily_search_multiple_async`; same opt-in rule as above.
+async_tavily_client = None
+# Upper bound on concurrent Tavily requests issued by one `tavily_search_multiple_async` call
+max_search_concurrency = 5
+# Upper bound on concurrent webpage summarization calls in `process_search_results_async`
+max_summarization_concurrency = 4
+
+# Shared webpage summary cache, created lazily from Settings by `get_summary_cache`
+_summary_cache: Optional[SummaryCache] = None
+# Shared tavily_search result cache, created lazily from Settings by `get_search_cache`
+_search_cache: Optional[SearchResultCache] = None
+
+def get_summary_cache() -> Optional[SummaryCache]:
+    """Return the shared webpage summary cache, or None when caching is disabled.
+
+    The cache is built on first use from `Settings.summary_cache_*`. Entries
+    produced with an older `summarize_webpage_prompt` are purged from the
+    persistent tier at that point.
+    """
+    global _summary_cache
+    if _summary_cache is None:
+        from research_agent_framework.config import get_settings
+        settings = get_settings()
+        if not settings.summary_cache_enabled:
+            return None
+        _summary_cache = SummaryCache(
+            path=settings.summary_cache_path,
+            max_memory_entries=settings.summary_cache_max_entries,
+            max_disk_bytes=settings.summary_cache_max_bytes,
+        )
+        _summary_cache.invalidate_prompt(summarize_webpage_prompt)
+    return _summary_cache
+
+def get_search_cache() -> Optional[SearchResultCache]:
+    """Return the shared `tavily_search` result cache, or None when disabled.
+
+    Built on first use from `Settings.search_cache_*`; its `stats` expose
+    hit-rate metrics.
+    """
+    global _search_cache
+    if _search_cache is None:
+        from research_agent_framework.config import get_settings
+        settings = get_settings()
+        if not settings.search_cache_enabled:
+            return None
+        _search_cache = SearchResultCache(
+            ttls=settings.search_cache_ttls,
+            max_entries=settings.search_cache_max_entries,
+            path=settings.search_cache_path,
+        )
+    return _search_cache
+
+def _summary_cache_key(webpage_content: str, model: Any = None) -> str:
+    """Key a page by its content, the summarization prompt and the model identity.
+
+    `model` is the model summarizing the page (defaults to `summarization_model`).
+    """
+    model = summarization_model if model is None else model
+    model_id = getattr(model, "model_name", None) or getattr(model, "model", None) or type(model).__name__
+    return make_cache_key(webpage_content, summarize_webpage_prompt, str(model_id))
 
 # ===== SEARCH FUNCTIONS =====
 
@@ -68,7 +145,7 @@ def tavily_search_multiple(
         List of search result dictionaries
     """
 
-    # Execute searches sequentially. Note: yon can use AsyncTavilyClient to parallelize this step.
+    # Execute searches sequentially. See `tavily_search_multiple_async` for the concurrent variant.
     search_docs = []
     if tavily_client is None:
         raise NotImplementedError("Tavily client is disabled in this environment. Enable network adapters in config to use real searches.")
@@ -84,56 +161,493 @@ def tavily_search_multiple(
 
     return search_docs
 
+async def tavily_search_multiple_async(
+    search_queries: List[str],
+    max_results: int = 3,
+    topic: Literal["general", "news", "finance"] = "general",
+    include_raw_content: bool = True,
+    max_concurrency: Optional[int] = None,
+    client: Optional[Any] = None,
+) -> List[dict]:
+    """Perform Tavily searches for multiple queries concurrently.
+
+    Queries run in parallel, bounded by a semaphore, and the output keeps the
+    order of `search_queries`. A failing query does not abort the batch: its
+    slot holds an empty result set with the error message, so downstream
+    helpers such as `deduplicate_search_results` keep working.
+
+    Args:
+        search_queries: List of search queries to execute
+        max_results: Maximum number of results per query
+        topic: Topic filter for search results
+        include_raw_content: Whether to include raw webpage content
+        max_concurrency: Maximum number of in-flight requests (defaults to `max_search_concurrency`)
+        client: Search client to use instead of the module-level clients. Both
+            async clients (e.g. `AsyncTavilyClient`) and blocking ones (e.g.
+            `TavilyClient`, run in a worker thread) are accepted.
+
+    Returns:
+        List of search result dictionaries, one per query, in input order
+    """
+    search_client = client or async_tavily_client or tavily_client
+    if search_client is None:
+        raise NotImplementedError("Tavily client is disabled in this environment. Enable network adapters in config to use real searches.")
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency or max_search_concurrency))
+    is_async_client = inspect.iscoroutinefunction(search_client.search)
+
+    async def run_query(query: str) -> dict:
+        async with semaphore:
+            try:
+                kwargs = dict(max_results=max_results, include_raw_content=include_raw_content, topic=topic)
+                if is_async_client:
+                    return await search_client.search(query, **kwargs)
+                return await asyncio.to_thread(search_client.search, query, **kwargs)
+            except Exception as e:
+                try:
+                    from research_agent_framework.config import get_logger
+                    get_logger().error(f"Tavily search failed for query {query!r}: {e}")
+                except Exception:
+                    pass
+                return {"query": query, "results": [], "error": f"{type(e).__name__}: {e}"}
+
+    return list(await asyncio.gather(*(run_query(query) for query in search_queries)))
+
+def _summary_fields(summary: Any) -> tuple[str, str]:
+    """Return (summary, key_excerpts) from a structured `Summary` or equivalent dict."""
+    # The structured_model may return a BaseModel-like object or a plain dict
+    if isinstance(summary, dict):
+        return summary.get("summary", ""), summary.get("key_excerpts", "")
+    # BaseModel or object with attributes
+    return getattr(summary, "summary", ""), getattr(summary, "key_excerpts", "")
+
+def _format_summary(summary: Any) -> str:
+    """Render a structured `Summary` (or equivalent dict) as tagged text."""
+    summary_text, key_excerpts = _summary_fields(summary)
+
+    # Format summary with clear structure
+    return (
+        f"<summary>\n{summary_text}\n</summary>\n\n"
+        f"<key_excerpts>\n{key_excerpts}\n</key_excerpts>"
+    )
+
+class _FallbackContent(str):
+    """Truncated raw content standing in for a summary that failed.
+
+    Behaves like any summary string (including when shared through the URL
+    registry) but stays recognizable, so search outcomes containing it are
+    never cached.
+    """
+
+def _summary_fallback(webpage_content: str, error: Exception) -> str:
+    """Log a summarization failure and return the truncated raw content instead."""
+    try:
+        from research_agent_framework.config import get_logger
+        get_logger().error(f"Failed to summarize webpage: {error}")
+    except Exception:
+        # fallback to simple print if logger not available
+        try:
+            from rich.console import Console
+            Console().print(f"Failed to summarize webpage: {str(error)}")
+        except Exception:
+            print(f"Failed to summarize webpage: {str(error)}")
+    return _FallbackContent(webpage_content[:1000] + "..." if len(webpage_content) > 1000 else webpage_content)
+
+def _summarization_messages(webpage_content: str) -> List[HumanMessage]:
+    """Build the prompt messages for summarizing one webpage."""
+    return [
+        HumanMessage(content=summarize_webpage_prompt.format(
+            webpage_content=webpage_content,
+            date=get_today_str(),
+        ))
+    ]
+
+def split_webpage_content(
+    webpage_content: str,
+    chunk_tokens: Optional[int] = None,
+    overlap_tokens: Optional[int] = None,
+    max_chunks: Optional[int] = None,
+) -> List[str]:
+    """Split a page into summarization chunks by token budget.
+
+    Pages within `chunk_tokens` are returned whole as a single chunk. Unset
+    limits default to `Settings.summary_chunk_tokens`,
+    `Settings.summary_chunk_overlap_tokens` and `Settings.summary_max_chunks`.
+
+    Args:
+        webpage_content: Raw webpage content
+        chunk_tokens: Maximum tokens per chunk
+        overlap_tokens: Tokens shared between consecutive chunks
+        max_chunks: Maximum number of chunks; content beyond it is dropped
+
+    Returns:
+        List of chunks in page order
+    """
+    from research_agent_framework.config import get_settings
+    settings = get_settings()
+    chunk_tokens = chunk_tokens or settings.summary_chunk_tokens
+    if count_tokens(webpage_content) <= chunk_tokens:
+        return [webpage_content]
+    return split_into_chunks(
+        webpage_content,
+        chunk_tokens=chunk_tokens,
+        overlap_tokens=settings.summary_chunk_overlap_tokens if overlap_tokens is None else overlap_tokens,
+        max_chunks=max_chunks or settings.summary_max_chunks,
+    )
+
+def _reduce_messages(partials: List[Any]) -> List[HumanMessage]:
+    """Build the prompt messages merging per-chunk summaries into one."""
+    sections = []
+    for i, partial in enumerate(partials, 1):
+        summary_text, key_excerpts = _summary_fields(partial)
+        sections.append(f"<section_{i}>\nSummary: {summary_text}\nKey excerpts: {key_excerpts}\n</section_{i}>")
+    return [
+        HumanMessage(content=summarize_chunk_summaries_prompt.format(
+            chunk_summaries="\n\n".join(sections),
+            date=get_today_str(),
+        ))
+    ]
+
+def _merge_summaries(partials: List[Any]) -> Summary:
+    """Deterministically merge per-chunk summaries when the reduce call fails."""
+    fields = [_summary_fields(partial) for partial in partials]
+    return Summary(
+        summary="\n\n".join(summary_text for summary_text, _ in fields if summary_text),
+        key_excerpts=", ".join(key_excerpts for _, key_excerpts in fields if key_excerpts),
+    )
+
+def _successful_partials(partials: List[Any]) -> List[Any]:
+    """Drop failed chunk summaries, raising if none succeeded."""
+    succeeded = [partial for partial in partials if not isinstance(partial, Exception)]
+    if not succeeded:
+        raise RuntimeError(f"All {len(partials)} chunk summaries failed: {partials[0]}")
+    return succeeded
+
+def _reduce_failed(partials: List[Any], error: Exception) -> Summary:
+    """Log a failed reduce step and fall back to the deterministic merge."""
+    try:
+        from research_agent_framework.config import get_logger
+        get_logger().warning(f"Failed to merge {len(partials)} chunk summaries, concatenating instead: {error}")
+    except Exception:
+        pass
+    return _merge_summaries(partials)
+
+def _summarize_chunks(structured_model: Any, chunks: List[str]) -> Any:
+    """Summarize chunks in parallel (`batch`) and reduce them to one summary."""
+    if len(chunks) == 1:
+        return structured_model.invoke(_summarization_messages(chunks[0]))
+
+    partials = _successful_partials(
+        structured_model.batch([_summarization_messages(chunk) for chunk in chunks], return_exceptions=True)
+    )
+    if len(partials) == 1:
+        return partials[0]
+    try:
+        return structured_model.invoke(_reduce_messages(partials))
+    except Exception as e:
+        return _reduce_failed(partials, e)
+
+async def _asummarize_chunks(structured_model: Any, chunks: List[str]) -> Any:
+    """Async variant of `_summarize_chunks` fanning chunks out with `asyncio.gather`."""
+    if len(chunks) == 1:
+        return await structured_model.ainvoke(_summarization_messages(chunks[0]))
+
+    partials = _successful_partials(list(await asyncio.gather(
+        *(structured_model.ainvoke(_summarization_messages(chunk)) for chunk in chunks),
+        return_exceptions=True,
+    )))
+    if len(partials) == 1:
+        return partials[0]
+    try:
+        return await structured_model.ainvoke(_reduce_messages(partials))
+    except Exception as e:
+        return _reduce_failed(partials, e)
+
+def _route_summarization(webpage_content: str) -> Tuple[str, Any]:
+    """Pick the tier and model summarizing one page (node "summarize_webpage", see `model_router`)."""
+    return route_model("summarize_webpage", _summarization_messages(webpage_content), summarization_model)
+
 def summarize_webpage_content(webpage_content: str) -> str:
     """Summarize webpage content using the configured summarization model.
 
+    Pages larger than the chunk budget are split by `split_webpage_content`,
+    summarized chunk-by-chunk in parallel and merged back into a single
+    `Summary`. Successful summaries are read from and written to the shared
+    summary cache (see `get_summary_cache`); fallbacks are never cached.
+    The model is subject to model routing, and each page summarized is
+    recorded with the active tier usage collector (see `model_router`).
+
     Args:
         webpage_content: Raw webpage content to summarize
 
     Returns:
         Formatted summary with key excerpts
     """
+    tier, model = _route_summarization(webpage_content)
+    cache = get_summary_cache()
+    cache_key = _summary_cache_key(webpage_content, model) if cache else ""
+    if cache and (cached := cache.get(cache_key)) is not None:
+        return cached
+
     try:
         # Set up structured output model for summarization
-        structured_model = summarization_model.with_structured_output(Summary)
-
-        # Generate summary
-        summary = structured_model.invoke([
-            HumanMessage(content=summarize_webpage_prompt.format(
-                webpage_content=webpage_content,
-                date=get_today_str(),
-            ))
-        ])
-
-        # The structured_model may return a BaseModel-like object or a plain dict
-        if isinstance(summary, dict):
-            summary_text = summary.get("summary", "")
-            key_excerpts = summary.get("key_excerpts", "")
-        else:
-            # BaseModel or object with attributes
-            summary_text = getattr(summary, "summary", "")
-            key_excerpts = getattr(summary, "key_excerpts", "")
-
-        # Format summary with clear structure
-        formatted_summary = (
-            f"<summary>\n{summary_text}\n</summary>\n\n"
-            f"<key_excerpts>\n{key_excerpts}\n</key_excerpts>"
-        )
+        structured_model = model.with_structured_output(Summary)
+        started_at = time.perf_counter()
+        summary = _summarize_chunks(structured_model, split_webpage_content(webpage_content))
+        record_tier_usage(tier, elapsed_s=time.perf_counter() - started_at)
+        formatted_summary = _format_summary(summary)
+        if cache:
+            cache.put(cache_key, formatted_summary, summarize_webpage_prompt)
+        return formatted_summary
+
+    except Exception as e:
+        return _summary_fallback(webpage_content, e)
+
+async def summarize_webpage_content_async(webpage_content: str) -> str:
+    """Async variant of `summarize_webpage_content` using `ainvoke`.
+
+    Args:
+        webpage_content: Raw webpage content to summarize
 
+    Returns:
+        Formatted summary with key excerpts, or truncated content on failure
+    """
+    tier, model = _route_summarization(webpage_content)
+    cache = get_summary_cache()
+    cache_key = _summary_cache_key(webpage_content, model) if cache else ""
+    if cache and (cached := cache.get(cache_key)) is not None:
+        return cached
+
+    try:
+        structured_model = model.with_structured_output(Summary)
+        started_at = time.perf_counter()
+        summary = await _asummarize_chunks(structured_model, split_webpage_content(webpage_content))
+        record_tier_usage(tier, elapsed_s=time.perf_counter() - started_at)
+        formatted_summary = _format_summary(summary)
+        if cache:
+            cache.put(cache_key, formatted_summary, summarize_webpage_prompt)
         return formatted_summary
 
     except Exception as e:
+        return _summary_fallback(webpage_content, e)
+
+@dataclass
+class PackedSummarizationReport:
+    """What one packed summarization pass cost, compared with unpacked mode.
+
+    Unpacked mode issues one request per uncached page, so `requests_saved`
+    is the difference between that and the requests actually made.
+    """
+    documents: int = 0
+    cached: int = 0
+    packed_requests: int = 0
+    single_requests: int = 0
+    elapsed_s: float = 0.0
+
+    @property
+    def requests(self) -> int:
+        return self.packed_requests + self.single_requests
+
+    @property
+    def unpacked_requests(self) -> int:
+        return self.documents - self.cached
+
+    @property
+    def requests_saved(self) -> int:
+        return max(0, self.unpacked_requests - self.requests)
+
+    def as_dict(self) -> dict:
+        return {
+            **asdict(self),
+            "requests": self.requests,
+            "unpacked_requests": self.unpacked_requests,
+            "requests_saved": self.requests_saved,
+        }
+
+def packing_enabled() -> bool:
+    """Whether `Settings.summary_packing_enabled` is set."""
+    from research_agent_framework.config import get_settings
+    return get_settings().summary_packing_enabled
+
+def _packed_messages(webpage_contents: List[str]) -> List[HumanMessage]:
+    """Build the prompt messages for summarizing several webpages in one request."""
+    documents = "\n\n".join(
+        f'<document id="{i}">\n{content}\n</document>'
+        for i, content in enumerate(webpage_contents, 1)
+    )
+    return [
+        HumanMessage(content=summarize_multiple_webpages_prompt.format(
+            documents=documents,
+            date=get_today_str(),
+        ))
+    ]
+
+def _route_packed_summarization(messages: List[HumanMessage]) -> Tuple[str, Any]:
+    """Pick the tier and model for one packed request, like `_route_summarization` for one page."""
+    return route_model("summarize_webpage", messages, summarization_model)
+
+def _unpack_summaries(response: Any, pack: List[str]) -> Dict[str, str]:
+    """Map a `MultiDocumentSummary` back to the URLs of its pack.
+
+    Entries with unknown ids are ignored; documents the model skipped are
+    simply missing from the result.
+    """
+    entries = response.get("summaries", []) if isinstance(response, dict) else getattr(response, "summaries", [])
+    summaries = {}
+    for entry in entries:
+        document_id = entry.get("document_id") if isinstance(entry, dict) else getattr(entry, "document_id", None)
+        if isinstance(document_id, int) and 1 <= document_id <= len(pack):
+            summaries.setdefault(pack[document_id - 1], _format_summary(entry))
+    return summaries
+
+def _plan_packed_summaries(
+    webpages: Dict[str, str],
+    cache: Optional[SummaryCache],
+) -> Tuple[Dict[str, str], PackPlan, PackedSummarizationReport]:
+    """Serve cached pages and pack the rest according to `Settings.summary_pack_*`.
+
+    Pages are looked up under the model routing would pick to summarize
+    them on their own, the key `summarize_webpage_content` uses.
+    """
+    from research_agent_framework.config import get_settings
+    settings = get_settings()
+    report = PackedSummarizationReport(documents=len(webpages))
+    summaries: Dict[str, str] = {}
+    token_counts: Dict[str, int] = {}
+    for url, content in webpages.items():
+        if cache and (cached := cache.get(_summary_cache_key(content, _route_summarization(content)[1]))) is not None:
+            summaries[url] = cached
+            report.cached += 1
+        else:
+            token_counts[url] = count_tokens(content)
+
+    plan = pack_documents(
+        token_counts,
+        max_pack_tokens=settings.summary_pack_max_tokens,
+        max_documents=settings.summary_pack_max_documents,
+        max_document_tokens=settings.summary_pack_max_document_tokens,
+    )
+    return summaries, plan, report
+
+def _store_packed(
+    cache: Optional[SummaryCache],
+    webpages: Dict[str, str],
+    summaries: Dict[str, str],
+    model: Any,
+) -> None:
+    """Cache packed summaries under per-page keys naming the `model` that produced them."""
+    if cache:
+        for url, summary in summaries.items():
+            cache.put(_summary_cache_key(webpages[url], model), summary, summarize_webpage_prompt)
+
+def _pack_failed(pack: List[str], error: Exception) -> None:
+    """Log a failed packed request; its pages are then summarized one by one."""
+    try:
+        from research_agent_framework.config import get_logger
+        get_logger().warning(f"Failed to summarize {len(pack)} packed pages, summarizing them individually: {error}")
+    except Exception:
+        pass
+
+def _log_packing_report(report: PackedSummarizationReport) -> None:
+    try:
+        from research_agent_framework.config import get_logger
+        get_logger().info(
+            f"Packed summarization: {report.documents} pages in {report.requests} requests "
+            f"({report.requests_saved} saved vs unpacked) in {report.elapsed_s:.3f}s"
+        )
+    except Exception:
+        pass
+
+def summarize_webpages_packed(webpages: Dict[str, str]) -> Tuple[Dict[str, str], PackedSummarizationReport]:
+    """Summarize several webpages, packing small and medium ones into shared requests.
+
+    Pages are packed by `packing.pack_documents` under the
+    `Settings.summary_pack_*` budget and each pack is summarized with one
+    `MultiDocumentSummary` request. Oversized pages, lone pages, pages of a
+    failed pack and pages the model skipped go through
+    `summarize_webpage_content` instead. Summaries share the per-page cache.
+    Each packed request is subject to model routing (node
+    "summarize_webpage") and recorded with the active tier usage collector.
+
+    Args:
+        webpages: Mapping of URL to the content to summarize
+
+    Returns:
+        Tuple of (formatted summary per URL in input order, report)
+    """
+    started_at = time.perf_counter()
+    cache = get_summary_cache()
+    summaries, plan, report = _plan_packed_summaries(webpages, cache)
+
+    singles = list(plan.singles)
+    for pack in plan.packs:
+        report.packed_requests += 1
+        messages = _packed_messages([webpages[url] for url in pack])
+        tier, model = _route_packed_summarization(messages)
         try:
-            from research_agent_framework.config import get_logger
-            get_logger().error("Failed to summarize webpage: %s", str(e))
-        except Exception:
-            # fallback to simple print if logger not available
-            try:
-                from rich.console import Console
-                Console().print(f"Failed to summarize webpage: {str(e)}")
-            except Exception:
-                print(f"Failed to summarize webpage: {str(e)}")
-        return webpage_content[:1000] + "..." if len(webpage_content) > 1000 else webpage_content
+            pack_started_at = time.perf_counter()
+            response = model.with_structured_output(MultiDocumentSummary).invoke(messages)
+            record_tier_usage(tier, elapsed_s=time.perf_counter() - pack_started_at)
+            packed = _unpack_summaries(response, pack)
+        except Exception as e:
+            _pack_failed(pack, e)
+            packed = {}
+        _store_packed(cache, webpages, packed, model)
+        summaries.update(packed)
+        singles.extend(url for url in pack if url not in packed)
+
+    for url in singles:
+        report.single_requests += 1
+        summaries[url] = summarize_webpage_content(webpages[url])
+
+    report.elapsed_s = time.perf_counter() - started_at
+    _log_packing_report(report)
+    return {url: summaries[url] for url in webpages}, report
+
+async def summarize_webpages_packed_async(
+    webpages: Dict[str, str],
+    max_concurrency: Optional[int] = None,
+) -> Tuple[Dict[str, str], PackedSummarizationReport]:
+    """Async variant of `summarize_webpages_packed`.
+
+    Packed and per-page requests run concurrently, bounded by
+    `max_concurrency` (defaults to `max_summarization_concurrency`).
+    """
+    started_at = time.perf_counter()
+    cache = get_summary_cache()
+    summaries, plan, report = _plan_packed_summaries(webpages, cache)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency or max_summarization_concurrency))
+
+    async def summarize_single(url: str) -> None:
+        report.single_requests += 1
+        async with semaphore:
+            summaries[url] = await summarize_webpage_content_async(webpages[url])
+
+    async def summarize_pack(pack: List[str]) -> None:
+        report.packed_requests += 1
+        messages = _packed_messages([webpages[url] for url in pack])
+        tier, model = _route_packed_summarization(messages)
+        try:
+            async with semaphore:
+                pack_started_at = time.perf_counter()
+                response = await model.with_structured_output(MultiDocumentSummary).ainvoke(messages)
+                record_tier_usage(tier, elapsed_s=time.perf_counter() - pack_started_at)
+            packed = _unpack_summaries(response, pack)
+        except Exception as e:
+            _pack_failed(pack, e)
+            packed = {}
+        _store_packed(cache, webpages, packed, model)
+        summaries.update(packed)
+        await asyncio.gather(*(summarize_single(url) for url in pack if url not in packed))
+
+    await asyncio.gather(
+        *(summarize_pack(pack) for pack in plan.packs),
+        *(summarize_single(url) for url in plan.singles),
+    )
+
+    report.elapsed_s = time.perf_counter() - started_at
+    _log_packing_report(report)
+    return {url: summaries[url] for url in webpages}, report
 
 def deduplicate_search_results(search_results: List[dict]) -> dict:
     """Deduplicate search results by URL to avoid processing duplicate content.
@@ -154,16 +668,92 @@ def deduplicate_search_results(search_results: List[dict]) -> dict:
 
     return unique_results
 
-def process_search_results(unique_results: dict) -> dict:
+def collapse_near_duplicates(unique_results: dict) -> dict:
+    """Keep one representative per group of near-duplicate pages.
+
+    Syndicated copies, AMP pages and mirrors arrive under different URLs
+    with (almost) the same text. Pages are grouped by SimHash fingerprint of
+    their raw content (see `fingerprint`); the first page of each group is
+    kept and the other URLs are attached to it as `aliases`, so only the
+    representative is summarized. Controlled by
+    `Settings.near_duplicate_detection_enabled` / `near_duplicate_max_distance`.
+
+    Args:
+        unique_results: Dictionary of URL-deduplicated search results
+
+    Returns:
+        Dictionary of representative results, in the original order
+    """
+    from research_agent_framework.config import get_settings
+    settings = get_settings()
+    if not settings.near_duplicate_detection_enabled or len(unique_results) < 2:
+        return unique_results
+
+    documents = {
+        url: result.get("raw_content") or result.get("content") or ""
+        for url, result in unique_results.items()
+    }
+    groups = group_near_duplicates(documents, max_distance=settings.near_duplicate_max_distance)
+    return {
+        url: {**unique_results[url], "aliases": aliases} if aliases else unique_results[url]
+        for url, aliases in groups.items()
+    }
+
+def prefilter_raw_content(raw_content: str, query: Optional[str]) -> str:
+    """Reduce raw page content to the passages relevant to `query`.
+
+    Applies the local BM25 filter from `relevance` when a query is known and
+    `Settings.relevance_filter_enabled` is set; otherwise returns the content
+    unchanged. The filter runs before chunking: with the default
+    `relevance_filter_max_chars` a filtered page fits one summarization call,
+    and map-reduce summarization (`summary_chunk_tokens`) only handles pages
+    summarized without a query or with the filter disabled.
+
+    Args:
+        raw_content: Raw webpage content
+        query: Search query the page was retrieved for
+
+    Returns:
+        Content to summarize
+    """
+    if not query:
+        return raw_content
+    from research_agent_framework.config import get_settings
+    settings = get_settings()
+    if not settings.relevance_filter_enabled:
+        return raw_content
+    return filter_relevant_passages(raw_content, query, settings.relevance_filter_max_chars)
+
+def _registry_key(url: str, content: str) -> str:
+    """Key of a page in the run-scoped URL registry.
+
+    Pre-filtering makes the text that gets summarized depend on the query, so
+    the key covers the summarized text as well as the URL: researchers share
+    a page's summary only when they would summarize the same passages.
+    """
+    return f"{url}#{fingerprint(content)[:16]}"
+
+def process_search_results(unique_results: dict, query: Optional[str] = None) -> dict:
     """Process search results by summarizing content where available.
 
+    When a run-scoped URL registry is active (see `url_registry`), pages
+    already summarized or being summarized by another researcher are reused
+    instead of summarized again. With `Settings.summary_packing_enabled`,
+    pages are summarized several per request (see `summarize_webpages_packed`).
+
     Args:
         unique_results: Dictionary of unique search results
+        query: Search query; when given, raw content is pre-filtered to the
+            relevant passages before summarization
 
     Returns:
         Dictionary of processed results with summaries
     """
+    if packing_enabled():
+        return _process_search_results_packed(unique_results, query)
+
     summarized_results = {}
+    registry = get_current_url_registry()
 
     for url, result in unique_results.items():
         # Use existing content if no raw content for summarization
@@ -171,36 +761,435 @@ def process_search_results(unique_results: dict) -> dict:
             content = result['content']
         else:
             # Summarize raw content for better processing
-            content = summarize_webpage_content(result['raw_content'])
+            relevant = prefilter_raw_content(result['raw_content'], query)
+            if registry is not None:
+                content, _ = registry.get_or_process(_registry_key(url, relevant), lambda: summarize_webpage_content(relevant))
+            else:
+                content = summarize_webpage_content(relevant)
 
         summarized_results[url] = {
             'title': result['title'],
             'content': content
         }
+        if result.get('aliases'):
+            summarized_results[url]['aliases'] = result['aliases']
+
+    return summarized_results
+
+def _search_result_processor(max_concurrency: Optional[int], query: Optional[str]) -> Callable[[str, dict], Awaitable[dict]]:
+    """Build the per-URL coroutine used by `process_search_results_async`.
+
+    All calls of the returned coroutine share one summarization semaphore and
+    the run-scoped URL registry active at creation time.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency or max_summarization_concurrency))
+    registry = get_current_url_registry()
+
+    async def summarize(url: str, relevant: str) -> dict:
+        queued_at = time.perf_counter()
+        async with semaphore:
+            started_at = time.perf_counter()
+            content = await summarize_webpage_content_async(relevant)
+            finished_at = time.perf_counter()
+
+        timing = {'wait_s': started_at - queued_at, 'summarize_s': finished_at - started_at}
+        try:
+            from research_agent_framework.config import get_logger
+            get_logger().debug(f"Summarized {url} (wait {timing['wait_s']:.3f}s, summarize {timing['summarize_s']:.3f}s)")
+        except Exception:
+            pass
+        return {'content': content, 'timing': timing}
+
+    async def process_one(url: str, result: dict) -> dict:
+        # Use existing content if no raw content for summarization
+        if not result.get("raw_content"):
+            return {
+                'title': result['title'],
+                'content': result['content'],
+                'timing': {'wait_s': 0.0, 'summarize_s': 0.0},
+            }
+
+        relevant = prefilter_raw_content(result['raw_content'], query)
+        if registry is None:
+            return {'title': result['title'], **await summarize(url, relevant)}
+
+        # The registry holds the summary text only; timing stays with the caller that produced it
+        timing = {}
+
+        async def produce() -> str:
+            summarized = await summarize(url, relevant)
+            timing.update(summarized['timing'])
+            return summarized['content']
+
+        queued_at = time.perf_counter()
+        content, reused = await registry.aget_or_process(_registry_key(url, relevant), produce)
+        if not reused:
+            return {'title': result['title'], 'content': content, 'timing': timing}
+        return {
+            'title': result['title'],
+            'content': content,
+            'timing': {'wait_s': time.perf_counter() - queued_at, 'summarize_s': 0.0},
+            'reused': True,
+        }
+
+    async def process(url: str, result: dict) -> dict:
+        entry = await process_one(url, result)
+        if result.get('aliases'):
+            entry['aliases'] = result['aliases']
+        return entry
+
+    return process
+
+async def process_search_results_async(
+    unique_results: dict,
+    max_concurrency: Optional[int] = None,
+    query: Optional[str] = None,
+) -> dict:
+    """Summarize all unique search results concurrently.
+
+    Every result with `raw_content` is summarized in parallel, bounded by a
+    semaphore so the summarization provider's rate limits are respected. A
+    page that fails to summarize falls back to its truncated raw content
+    without affecting the others. Output order follows `unique_results`.
+
+    Each processed entry also carries a `timing` dict with `wait_s` (time
+    spent queued on the semaphore, or waiting for another researcher's
+    in-flight summary) and `summarize_s` (time in the model call). Pages
+    taken from the active run-scoped URL registry are marked `reused`. With
+    `Settings.summary_packing_enabled`, pages are summarized several per
+    request and `summarize_s` is the duration of the whole packed pass.
+
+    Args:
+        unique_results: Dictionary of unique search results
+        max_concurrency: Maximum number of in-flight summarization calls
+            (defaults to `max_summarization_concurrency`)
+        query: Search query; when given, raw content is pre-filtered to the
+            relevant passages before summarization
+
+    Returns:
+        Dictionary of processed results with summaries and per-URL timings
+    """
+    if packing_enabled():
+        return await _process_search_results_packed_async(unique_results, max_concurrency, query)
+
+    process = _search_result_processor(max_concurrency, query)
+    urls = list(unique_results)
+    processed = await asyncio.gather(*(process(url, unique_results[url]) for url in urls))
+    return dict(zip(urls, processed))
+
+def _claim_for_packing(unique_results: dict, query: Optional[str], registry: Any) -> Tuple[Dict[str, str], dict]:
+    """Split pages with raw content into those to summarize here and those owned elsewhere.
+
+    Returns:
+        Tuple of (URL to pre-filtered content for pages this caller
+        summarizes, URL to the registry future of pages another researcher
+        is summarizing)
+    """
+    owned: Dict[str, str] = {}
+    waiting = {}
+    for url, result in unique_results.items():
+        if not result.get("raw_content"):
+            continue
+        content = prefilter_raw_content(result['raw_content'], query)
+        if registry is None:
+            owned[url] = content
+            continue
+        future, owner = registry.claim(_registry_key(url, content))
+        if owner:
+            owned[url] = content
+        else:
+            waiting[url] = future
+    return owned, waiting
+
+def _release_claims(registry: Any, owned: Dict[str, str], error: BaseException) -> None:
+    if registry is not None:
+        for url, content in owned.items():
+            registry.fail(_registry_key(url, content), error)
+
+def _process_search_results_packed(unique_results: dict, query: Optional[str]) -> dict:
+    """`process_search_results` summarizing pages with `summarize_webpages_packed`."""
+    registry = get_current_url_registry()
+    owned, waiting = _claim_for_packing(unique_results, query, registry)
+    try:
+        summaries, _ = summarize_webpages_packed(owned)
+    except BaseException as e:
+        _release_claims(registry, owned, e)
+        raise
+    if registry is not None:
+        for url, content in owned.items():
+            registry.complete(_registry_key(url, content), summaries[url])
+
+    for url, future in waiting.items():
+        try:
+            summaries[url] = future.result()
+        except Exception:
+            # The owner failed; summarize independently rather than propagating its error
+            summaries[url] = summarize_webpage_content(prefilter_raw_content(unique_results[url]['raw_content'], query))
+
+    summarized_results = {}
+    for url, result in unique_results.items():
+        summarized_results[url] = {
+            'title': result['title'],
+            'content': summaries.get(url, result['content']),
+        }
+        if result.get('aliases'):
+            summarized_results[url]['aliases'] = result['aliases']
+    return summarized_results
+
+async def _process_search_results_packed_async(
+    unique_results: dict,
+    max_concurrency: Optional[int],
+    query: Optional[str],
+) -> dict:
+    """`process_search_results_async` summarizing pages with `summarize_webpages_packed_async`."""
+    registry = get_current_url_registry()
+    owned, waiting = _claim_for_packing(unique_results, query, registry)
+    queued_at = time.perf_counter()
+    try:
+        summaries, report = await summarize_webpages_packed_async(owned, max_concurrency)
+    except BaseException as e:
+        _release_claims(registry, owned, e)
+        raise
 
+    processed = {}
+    for url in owned:
+        processed[url] = {'content': summaries[url], 'timing': {'wait_s': 0.0, 'summarize_s': report.elapsed_s}}
+        if registry is not None:
+            registry.complete(_registry_key(url, owned[url]), summaries[url])
+
+    async def wait_for(url: str, future: Any) -> None:
+        try:
+            content = await asyncio.wrap_future(future)
+            processed[url] = {
+                'content': content,
+                'timing': {'wait_s': time.perf_counter() - queued_at, 'summarize_s': 0.0},
+                'reused': True,
+            }
+        except Exception:
+            started_at = time.perf_counter()
+            content = await summarize_webpage_content_async(prefilter_raw_content(unique_results[url]['raw_content'], query))
+            processed[url] = {
+                'content': content,
+                'timing': {'wait_s': started_at - queued_at, 'summarize_s': time.perf_counter() - started_at},
+            }
+
+    await asyncio.gather(*(wait_for(url, future) for url, future in waiting.items()))
+
+    summarized_results = {}
+    for url, result in unique_results.items():
+        summarized_results[url] = {
+            'title': result['title'],
+            **processed.get(url, {'content': result['content'], 'timing': {'wait_s': 0.0, 'summarize_s': 0.0}}),
+        }
+        if result.get('aliases'):
+            summarized_results[url]['aliases'] = result['aliases']
     return summarized_results
 
-def format_search_output(summarized_results: dict) -> str:
+async def iter_processed_results(
+    unique_results: dict,
+    max_concurrency: Optional[int] = None,
+    query: Optional[str] = None,
+) -> AsyncIterator[Tuple[int, str, dict]]:
+    """Process search results concurrently, yielding each as soon as it is ready.
+
+    Same processing as `process_search_results_async`, but results arrive in
+    completion order. With `Settings.summary_packing_enabled` all results
+    are yielded once the packed pass finishes.
+
+    Args:
+        unique_results: Dictionary of unique search results
+        max_concurrency: Maximum number of in-flight summarization calls
+        query: Search query used to pre-filter raw content
+
+    Yields:
+        Tuples of (rank, url, processed result) where rank is the 1-based
+        position of the result in `unique_results`
+    """
+    ranks = {url: rank for rank, url in enumerate(unique_results, 1)}
+    if packing_enabled():
+        processed = await _process_search_results_packed_async(unique_results, max_concurrency, query)
+        for url, entry in processed.items():
+            yield ranks[url], url, entry
+        return
+
+    process = _search_result_processor(max_concurrency, query)
+
+    async def ranked(url: str) -> Tuple[int, str, dict]:
+        return ranks[url], url, await process(url, unique_results[url])
+
+    tasks = [asyncio.ensure_future(ranked(url)) for url in unique_results]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # The consumer stopped early (or failed): don't leave summaries running
+        for task in tasks:
+            task.cancel()
+
+# ===== OUTPUT FORMATTING =====
+
+NO_SEARCH_RESULTS = "No valid search results found. Please try different search queries or use a different search API."
+SEARCH_OUTPUT_HEADER = "Search results: \n\n"
+
+def _format_source(rank: int, url: str, result: dict) -> str:
+    """Render one processed search result as a numbered source block."""
+    parts = [f"\n\n--- SOURCE {rank}: {result['title']} ---\n", f"URL: {url}\n"]
+    if result.get('aliases'):
+        parts.append(f"ALSO AT: {', '.join(result['aliases'])}\n")
+    parts.extend(["\n", f"SUMMARY:\n{result['content']}\n\n", "-" * 80 + "\n"])
+    return "".join(parts)
+
+def _omitted_note(count: int, ranked: bool = True) -> str:
+    """Note for sources left out of the output; `ranked` when the lowest-ranked ones were dropped."""
+    if not count:
+        return ""
+    sources = "lower-ranked source(s)" if ranked else "source(s)"
+    return f"\n[{count} {sources} omitted to fit the output budget]\n"
+
+class _OutputBudget:
+    """Running character/token budget for formatted search output (None = unlimited)."""
+
+    def __init__(self, max_tokens: Optional[int], max_chars: Optional[int]):
+        self.max_tokens = max_tokens
+        self.max_chars = max_chars
+        self.chars = 0
+        self.tokens = 0
+
+    @classmethod
+    def from_settings(cls, max_tokens: Optional[int], max_chars: Optional[int]) -> "_OutputBudget":
+        """Use the explicit limits, falling back to `Settings.search_output_max_*`."""
+        if max_tokens is None or max_chars is None:
+            from research_agent_framework.config import get_settings
+            settings = get_settings()
+            max_tokens = settings.search_output_max_tokens if max_tokens is None else max_tokens
+            max_chars = settings.search_output_max_chars if max_chars is None else max_chars
+        return cls(max_tokens, max_chars)
+
+    def measure(self, text: str) -> Tuple[int, int]:
+        return len(text), (count_tokens(text) if self.max_tokens is not None else 0)
+
+    def fits(self, *sizes: Tuple[int, int]) -> bool:
+        chars = self.chars + sum(size[0] for size in sizes)
+        tokens = self.tokens + sum(size[1] for size in sizes)
+        return (self.max_chars is None or chars <= self.max_chars) and (self.max_tokens is None or tokens <= self.max_tokens)
+
+    def spend(self, size: Tuple[int, int]) -> None:
+        self.chars += size[0]
+        self.tokens += size[1]
+
+    def truncate(self, text: str) -> str:
+        """Cut `text` to the remaining budget (tokens approximated by characters)."""
+        marker = "\n[truncated to fit the output budget]\n"
+        limits = []
+        if self.max_chars is not None:
+            limits.append(self.max_chars - self.chars)
+        if self.max_tokens is not None:
+            limits.append((self.max_tokens - self.tokens) * CHARS_PER_TOKEN)
+        keep = max(0, min(limits) - len(marker)) if limits else len(text)
+        while keep > 0 and not self.fits(self.measure(text[:keep] + marker)):
+            keep = keep * 3 // 4
+        return text[:keep] + marker if keep > 0 else ""
+
+def format_search_output(
+    summarized_results: dict,
+    max_tokens: Optional[int] = None,
+    max_chars: Optional[int] = None,
+) -> str:
     """Format search results into a well-structured string output.
 
+    Sources are numbered in rank order (the order of `summarized_results`).
+    When the output would exceed the budget, the lowest-ranked sources are
+    dropped first and a note records how many were omitted; if even the top
+    source does not fit, it is truncated.
+
     Args:
-        summarized_results: Dictionary of processed search results
+        summarized_results: Dictionary of processed search results, best first
+        max_tokens: Token budget for the whole output (defaults to
+            `Settings.search_output_max_tokens`)
+        max_chars: Character budget for the whole output (defaults to
+            `Settings.search_output_max_chars`)
 
     Returns:
         Formatted string of search results with clear source separation
     """
     if not summarized_results:
-        return "No valid search results found. Please try different search queries or use a different search API."
+        return NO_SEARCH_RESULTS
 
-    formatted_output = "Search results: \n\n"
+    budget = _OutputBudget.from_settings(max_tokens, max_chars)
+    budget.spend(budget.measure(SEARCH_OUTPUT_HEADER))
+    blocks = [_format_source(rank, url, result) for rank, (url, result) in enumerate(summarized_results.items(), 1)]
+    sizes = [budget.measure(block) for block in blocks]
 
-    for i, (url, result) in enumerate(summarized_results.items(), 1):
-        formatted_output += f"\n\n--- SOURCE {i}: {result['title']} ---\n"
-        formatted_output += f"URL: {url}\n\n"
-        formatted_output += f"SUMMARY:\n{result['content']}\n\n"
-        formatted_output += "-" * 80 + "\n"
+    # Keep the longest prefix of sources that fits together with the omission note
+    kept = len(blocks)
+    while kept > 0 and not budget.fits(*sizes[:kept], budget.measure(_omitted_note(len(blocks) - kept))):
+        kept -= 1
 
-    return formatted_output
+    parts = [SEARCH_OUTPUT_HEADER, *blocks[:kept]]
+    if kept == 0:
+        note_size = budget.measure(_omitted_note(len(blocks) - 1))
+        budget.spend(note_size)
+        parts.append(budget.truncate(blocks[0]))
+        kept = 1
+    parts.append(_omitted_note(len(blocks) - kept))
+    return "".join(parts)
+
+async def stream_search_output(
+    unique_results: dict,
+    query: Optional[str] = None,
+    max_concurrency: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+    max_chars: Optional[int] = None,
+) -> AsyncIterator[str]:
+    """Summarize search results and yield formatted sources as they become ready.
+
+    Yields the output header first, then one source block per result in
+    completion order (each keeps its rank number), then an omission note if
+    needed. Concatenating the chunks gives the complete tool output. Because
+    sources are emitted before later ones are known, the budget is applied
+    first come, first served: a source that no longer fits is skipped.
+
+    Args:
+        unique_results: Dictionary of unique search results, best first
+        query: Search query used to pre-filter raw content
+        max_concurrency: Maximum number of in-flight summarization calls
+        max_tokens: Token budget (defaults to `Settings.search_output_max_tokens`)
+        max_chars: Character budget (defaults to `Settings.search_output_max_chars`)
+
+    Yields:
+        Chunks of formatted output
+    """
+    if not unique_results:
+        yield NO_SEARCH_RESULTS
+        return
+
+    budget = _OutputBudget.from_settings(max_tokens, max_chars)
+    header_size = budget.measure(SEARCH_OUTPUT_HEADER)
+    budget.spend(header_size)
+    yield SEARCH_OUTPUT_HEADER
+
+    # Reserve room for the largest possible omission note so it always fits. Sources are
+    # skipped first come, first served rather than by rank, so the note doesn't claim a rank
+    note_size = budget.measure(_omitted_note(len(unique_results), ranked=False))
+    omitted = 0
+    emitted = 0
+    async for rank, url, result in iter_processed_results(unique_results, max_concurrency, query):
+        block = _format_source(rank, url, result)
+        size = budget.measure(block)
+        if budget.fits(size, note_size):
+            budget.spend(size)
+            emitted += 1
+            yield block
+        elif emitted == 0 and omitted == len(unique_results) - 1:
+            # Nothing fit at all: emit the last source truncated rather than nothing
+            budget.spend(note_size)
+            emitted += 1
+            yield budget.truncate(block)
+        else:
+            omitted += 1
+
+    if omitted:
+        yield _omitted_note(omitted, ranked=False)
 
 # ===== RESEARCH TOOLS =====
 
@@ -220,6 +1209,11 @@ def tavily_search(
     Returns:
         Formatted string of search results with summaries
     """
+    # Serve repeated (normalized) queries from the search cache
+    cache = get_search_cache()
+    if cache and (entry := cache.get(query, max_results, topic, True)) is not None:
+        return entry.formatted_output
+
     # Execute search for single query
     search_results = tavily_search_multiple(
         [query],  # Convert single query to list for the internal function
@@ -228,14 +1222,67 @@ def tavily_search(
         include_raw_content=True,
     )
 
-    # Deduplicate results by URL to avoid processing duplicate content
-    unique_results = deduplicate_search_results(search_results)
+    # Deduplicate results by URL, then collapse near-duplicate pages served under different URLs
+    unique_results = collapse_near_duplicates(deduplicate_search_results(search_results))
 
     # Process results with summarization
-    summarized_results = process_search_results(unique_results)
+    summarized_results = process_search_results(unique_results, query=query)
 
     # Format output for consumption
-    return format_search_output(summarized_results)
+    formatted_output = format_search_output(summarized_results)
+    _cache_search_outcome(cache, query, max_results, topic, search_results, unique_results, summarized_results, formatted_output)
+    return formatted_output
+
+def _cache_search_outcome(
+    cache: Optional[SearchResultCache],
+    query: str,
+    max_results: int,
+    topic: str,
+    search_results: List[dict],
+    unique_results: dict,
+    summarized_results: dict,
+    formatted_output: str,
+) -> None:
+    """Store a `tavily_search` outcome unless caching is off or the search failed.
+
+    Outcomes where any page fell back to truncated raw content (see
+    `_summary_fallback`) are not stored either, so a transient
+    summarization failure is retried on the next call.
+    """
+    if cache is None or any(response.get("error") for response in search_results):
+        return
+    if any(isinstance(result.get("content"), _FallbackContent) for result in summarized_results.values()):
+        return
+    cache.put(query, max_results, topic, True, unique_results, formatted_output)
+
+async def _tavily_search_async(
+    query: str,
+    max_results: int = 3,
+    topic: Literal["general", "news", "finance"] = "general",
+) -> str:
+    """Async implementation backing `tavily_search.ainvoke`.
+
+    Same pipeline as the sync tool, but the search and the per-page
+    summarization run concurrently instead of blocking the event loop.
+    """
+    cache = get_search_cache()
+    if cache and (entry := cache.get(query, max_results, topic, True)) is not None:
+        return entry.formatted_output
+
+    search_results = await tavily_search_multiple_async(
+        [query],
+        max_results=max_results,
+        topic=topic,
+        include_raw_content=True,
+    )
+    unique_results = collapse_near_duplicates(deduplicate_search_results(search_results))
+    summarized_results = await process_search_results_async(unique_results, query=query)
+    formatted_output = format_search_output(summarized_results)
+    _cache_search_outcome(cache, query, max_results, topic, search_results, unique_results, summarized_results, formatted_output)
+    return formatted_output
+
+# Route async invocations (e.g. from async graph nodes) to the concurrent pipeline
+tavily_search.coroutine = _tavily_search_async
 
 @tool(parse_docstring=True)
 def think_tool(reflection: str) -> str:
@@ -0,0 +1,96 @@
+"""Offline stand-ins for the `tavily` SDK clients.
+
+`MockTavilyClient` and `MockAsyncTavilyClient` mirror the subset of
+`tavily.TavilyClient` / `tavily.AsyncTavilyClient` used by
+`deep_research_from_scratch.utils` (the `search` method and its response
+shape). They sleep for a configurable latency instead of making a network
+call, so concurrency changes can be exercised and benchmarked offline.
+"""
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+
+
+def _mock_response(query: str, max_results: int, include_raw_content: bool, topic: str) -> Dict[str, Any]:
+    """Build a deterministic Tavily-shaped response for `query`."""
+    slug = "-".join(query.lower().split()) or "empty"
+    results: List[Dict[str, Any]] = []
+    for i in range(1, max_results + 1):
+        result: Dict[str, Any] = {
+            "title": f"Result {i} for {query}",
+            "url": f"https://mock.tavily.example/{topic}/{slug}/{i}",
+            "content": f"Snippet {i} about {query}.",
+            "score": round(1.0 / i, 3),
+        }
+        if include_raw_content:
+            result["raw_content"] = f"Full page {i} about {query}. " * 20
+        results.append(result)
+    return {"query": query, "results": results, "response_time": 0.0}
+
+
+class MockTavilyClient:
+    """Blocking stand-in for `tavily.TavilyClient`.
+
+    Args:
+        latency: Seconds each `search` call sleeps to simulate a round-trip.
+        fail_on: Queries for which `search` raises instead of returning.
+    """
+
+    def __init__(self, latency: float = 0.0, fail_on: Optional[List[str]] = None):
+        """Create a client with no recorded calls."""
+        self.latency = latency
+        self.fail_on = set(fail_on or [])
+        self.calls: List[str] = []
+
+    def search(
+        self,
+        query: str,
+        max_results: int = 5,
+        include_raw_content: bool = False,
+        topic: str = "general",
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Return a deterministic fake response for `query` (raises for `fail_on` queries)."""
+        self.calls.append(query)
+        if self.latency:
+            time.sleep(self.latency)
+        if query in self.fail_on:
+            raise RuntimeError(f"mock search failure for {query!r}")
+        return _mock_response(query, max_results, include_raw_content, topic)
+
+
+class MockAsyncTavilyClient:
+    """Async stand-in for `tavily.AsyncTavilyClient`.
+
+    Tracks the peak number of in-flight calls in `max_in_flight` so tests can
+    assert that a concurrency cap was honoured.
+    """
+
+    def __init__(self, latency: float = 0.0, fail_on: Optional[List[str]] = None):
+        """Create a client with no recorded calls."""
+        self.latency = latency
+        self.fail_on = set(fail_on or [])
+        self.calls: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def search(
+        self,
+        query: str,
+        max_results: int = 5,
+        include_raw_content: bool = False,
+        topic: str = "general",
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Async `MockTavilyClient.search`, tracking in-flight calls."""
+        self.calls.append(query)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            if query in self.fail_on:
+                raise RuntimeError(f"mock search failure for {query!r}")
+            return _mock_response(query, max_results, include_raw_content, topic)
+        finally:
+            self.in_flight -= 1
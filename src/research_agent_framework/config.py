@@ -4,7 +4,7 @@ Provides a Pydantic v2 `Settings` model (pydantic-settings) driven by environmen
 and thin helpers to access a shared `Console` and a configured logger via properties.
 """
 
-from typing import Optional, Literal
+from typing import Any, Dict, List, Optional, Literal, Union
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from rich.console import Console
@@ -90,6 +90,105 @@ class Settings(BaseSettings):
     # Supervisor error handling policy: 'record_and_continue' (default), 'fail_fast'
     supervisor_error_policy: str = "record_and_continue"
 
+    # Webpage summary cache: in-memory LRU tier, plus a SQLite tier when a path is set
+    summary_cache_enabled: bool = True
+    summary_cache_path: Optional[str] = None
+    summary_cache_max_entries: int = 512
+    summary_cache_max_bytes: int = 64 * 1024 * 1024
+
+    # Pages above summary_chunk_tokens are summarized chunk-by-chunk and merged (map-reduce).
+    # Applies to unfiltered text: search results with a query are cut to relevance_filter_max_chars first
+    summary_chunk_tokens: int = 16000
+    summary_chunk_overlap_tokens: int = 200
+    summary_max_chunks: int = 8
+
+    # BM25 pre-filter keeping the query-relevant passages of raw_content before summarization.
+    # The default cap (~3k tokens) stays below summary_chunk_tokens, so filtered pages take one summary call
+    relevance_filter_enabled: bool = True
+    relevance_filter_max_chars: int = 12000
+
+    # Query-level tavily_search cache; TTLs (seconds) override the per-topic defaults
+    search_cache_enabled: bool = True
+    search_cache_path: Optional[str] = None
+    search_cache_max_entries: int = 256
+    search_cache_ttls: Dict[str, float] = {}
+
+    # SimHash near-duplicate grouping of search results across different URLs (max_distance <= 15)
+    near_duplicate_detection_enabled: bool = True
+    near_duplicate_max_distance: int = 10
+
+    # Pack several small/medium pages into one multi-document summarization request
+    summary_packing_enabled: bool = False
+    summary_pack_max_tokens: int = 12000
+    summary_pack_max_documents: int = 8
+    summary_pack_max_document_tokens: int = 4000
+
+    # Budget for one formatted search tool output; lowest-ranked sources are trimmed first (None = unlimited)
+    search_output_max_tokens: Optional[int] = 16000
+    search_output_max_chars: Optional[int] = None
+
+    # Default per-researcher budget (None = unlimited); override per run via configurable.research_budget
+    researcher_max_tool_call_iterations: Optional[int] = 10
+    researcher_max_input_tokens: Optional[int] = None
+    researcher_max_output_tokens: Optional[int] = None
+    researcher_max_elapsed_s: Optional[float] = None
+
+    # Rolling compaction: once researcher history exceeds the threshold, older tool outputs are folded into a digest
+    history_compaction_enabled: bool = False
+    history_compaction_threshold_tokens: int = 24000
+    history_compaction_keep_recent_rounds: int = 1
+    history_compaction_digest_max_words: int = 1500
+
+    # Content-addressed store keeping large raw_notes out of graph state ('blob:<sha256>' refs in state);
+    # off by default because readers of raw_notes must resolve the refs (blob_store.resolve_notes)
+    blob_store_enabled: bool = False
+    blob_store_min_bytes: int = 4096
+    blob_store_max_memory_bytes: int = 256 * 1024 * 1024
+    blob_store_spill_dir: Optional[str] = None
+
+    # Stream researcher responses and start each tool call as soon as its arguments are complete
+    speculative_tool_execution_enabled: bool = False
+
+    # Early stopping: end a researcher after `patience` search rounds with novelty (new URLs/content share) below threshold
+    novelty_stop_enabled: bool = False
+    novelty_threshold: float = 0.2
+    novelty_patience: int = 2
+
+    # Per-call model tiering in researcher nodes: first matching rule picks a tier from model_tiers (see model_router).
+    # A tier is a model spec, or {"model": spec, **init_chat_model kwargs} (e.g. max_tokens)
+    model_routing_enabled: bool = False
+    model_tiers: Dict[str, Union[str, Dict[str, Any]]] = {
+        "small": {"model": "openai:gpt-4.1-mini", "max_tokens": 32000},
+        "large": {"model": "anthropic:claude-sonnet-4-20250514", "max_tokens": 64000},
+    }
+    model_routing_rules: List[Dict[str, Any]] = []
+
+    # MCP researcher: seconds a cached tool catalog (and bound model) stays valid; None = until a tools/list_changed notification
+    mcp_tool_catalog_ttl_s: Optional[float] = 300.0
+    # MCP researcher: long-lived session pool per server (min warmed at startup, max open at once, idle sessions pinged every interval)
+    mcp_session_pool_enabled: bool = True
+    mcp_pool_min_sessions: int = 1
+    mcp_pool_max_sessions: int = 4
+    mcp_pool_health_check_interval_s: Optional[float] = 30.0
+    mcp_pool_health_check_timeout_s: float = 5.0
+    # MCP researcher: tool calls of one turn run concurrently, at most this many in flight per server, each with a timeout
+    mcp_tool_max_concurrency_per_server: int = 4
+    mcp_tool_call_timeout_s: Optional[float] = 60.0
+    # MCP researcher: backend of the "filesystem" server tools; "native" serves them in-process (MCPFileTool), no Node subprocess
+    mcp_file_backend: Literal["mcp", "native"] = "mcp"
+    # SQLite FTS5 index of the MCP research files behind the search_local_documents tool (path None = in memory)
+    local_index_enabled: bool = True
+    local_index_path: Optional[str] = None
+    local_index_chunk_lines: int = 40
+    local_index_refresh_interval_s: float = 10.0
+
+    # USD per million tokens by model name prefix, e.g. {"gpt-4.1": {"input": 2.0, "output": 8.0}} (overrides instrumentation defaults)
+    model_prices: Dict[str, Dict[str, float]] = {}
+
+    # SQLite checkpointing of the research graphs (runs resume by thread_id; needs langgraph-checkpoint-sqlite)
+    checkpoint_enabled: bool = False
+    checkpoint_path: str = ".checkpoints/research.sqlite"
+
     # Internal, lazily created runtime instances
     _console: Optional[Console] = None
 
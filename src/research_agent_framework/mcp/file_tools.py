@@ -1,15 +1,28 @@
 """
 MCP File Tool: Read local docs via MCP tool, with logging and error handling.
 Supports deterministic mock fallback for educational notebook and tests.
+
+Besides `read_file`, the tool is a complete in-process backend for read-only
+local-document research (list, read, ranged read, stat, glob). With a `root`,
+every path is confined to that directory. `as_langchain_tools()` exposes the
+backend under the tool names and output formats of
+`@modelcontextprotocol/server-filesystem`, so an agent can use it in place of
+the MCP server without a subprocess or IPC.
 """
-from typing import Optional
+from datetime import datetime
+import fnmatch
+import functools
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
 import os
 from research_agent_framework.logging import LoggingProtocol
 
 class MCPFileTool:
-    def __init__(self, logger: LoggingProtocol, mock_mode: bool = False):
+    def __init__(self, logger: LoggingProtocol, mock_mode: bool = False, root: Optional[Union[str, Path]] = None):
         self.logger = logger
         self.mock_mode = mock_mode
+        self.root = Path(root).resolve() if root is not None else None
 
     def read_file(self, path: str) -> Optional[str]:
         self.logger.info(f"MCPFileTool.read_file called with path: {path}")
@@ -17,7 +30,7 @@ class MCPFileTool:
             self.logger.warning("[MOCK MODE] Returning deterministic content.")
             return f"[MOCK CONTENT] File: {os.path.basename(path)}"
         try:
-            with open(path, "r", encoding="utf-8") as f:
+            with open(self.resolve(path), "r", encoding="utf-8") as f:
                 content = f.read()
             self.logger.info(f"Successfully read file: {path}")
             return content
@@ -27,3 +40,168 @@ class MCPFileTool:
         except Exception as e:
             self.logger.error(f"[ERROR] Exception reading file {path}: {e}")
             return None
+
+    # ===== BACKEND OPERATIONS =====
+    # Unlike read_file, these raise on failure (FileNotFoundError, PermissionError, ValueError)
+
+    def resolve(self, path: Union[str, Path]) -> Path:
+        """Resolve `path` (relative paths against the root) and check it stays inside the root."""
+        candidate = Path(path).expanduser()
+        if self.root is not None and not candidate.is_absolute():
+            candidate = self.root / candidate
+        resolved = candidate.resolve()
+        if self.root is not None and resolved != self.root and self.root not in resolved.parents:
+            raise PermissionError(f"Access denied - path outside allowed directories: {path}")
+        return resolved
+
+    def read_text(self, path: str, head: Optional[int] = None, tail: Optional[int] = None) -> str:
+        """Read a text file, or only its first `head` / last `tail` lines."""
+        if head is not None and tail is not None:
+            raise ValueError("Cannot specify both head and tail parameters simultaneously")
+        if self.mock_mode:
+            return f"[MOCK CONTENT] File: {os.path.basename(path)}"
+        text = self.resolve(path).read_text(encoding="utf-8", errors="replace")
+        if head is None and tail is None:
+            return text
+        lines = text.splitlines(keepends=True)
+        selected = lines[:head] if head is not None else lines[len(lines) - tail:] if tail else []
+        return "".join(selected)
+
+    def read_range(self, path: str, start_line: int, end_line: Optional[int] = None) -> str:
+        """Read lines `start_line`..`end_line` (1-based, inclusive; to the end if `end_line` is None)."""
+        if start_line < 1 or (end_line is not None and end_line < start_line):
+            raise ValueError(f"Invalid line range {start_line}..{end_line}")
+        if self.mock_mode:
+            return f"[MOCK CONTENT] File: {os.path.basename(path)}"
+        selected = []
+        with open(self.resolve(path), "r", encoding="utf-8", errors="replace") as f:
+            for number, line in enumerate(f, start=1):
+                if end_line is not None and number > end_line:
+                    break
+                if number >= start_line:
+                    selected.append(line)
+        return "".join(selected)
+
+    def list_directory(self, path: str = ".") -> List[Tuple[str, bool]]:
+        """Return (name, is_directory) for the entries of a directory, sorted by name."""
+        directory = self.resolve(path)
+        if not directory.is_dir():
+            raise NotADirectoryError(f"Not a directory: {path}")
+        return sorted((entry.name, entry.is_dir()) for entry in directory.iterdir())
+
+    def stat(self, path: str) -> Dict[str, Any]:
+        """Size, timestamps, type and permissions of a file or directory."""
+        target = self.resolve(path)
+        info = target.stat()
+
+        def stamp(seconds: float) -> str:
+            return datetime.fromtimestamp(seconds).isoformat()
+
+        return {
+            "size": info.st_size,
+            "created": stamp(getattr(info, "st_birthtime", info.st_ctime)),
+            "modified": stamp(info.st_mtime),
+            "accessed": stamp(info.st_atime),
+            "isDirectory": target.is_dir(),
+            "isFile": target.is_file(),
+            "permissions": oct(info.st_mode & 0o777)[2:],
+        }
+
+    def glob(self, pattern: str, path: str = ".", exclude_patterns: Optional[List[str]] = None) -> List[Path]:
+        """Files and directories under `path` matching a glob pattern (`**` recurses).
+
+        Patterns without a directory part match at any depth, as in the MCP
+        server's `search_files`. Matches inside the root only.
+        """
+        base = self.resolve(path)
+        pattern = pattern if "/" in pattern or pattern.startswith("**") else f"**/{pattern}"
+        matches = []
+        for match in sorted(base.glob(pattern)):
+            # An excluded directory excludes everything below it
+            parts = match.relative_to(base).parts
+            prefixes = ["/".join(parts[:i + 1]) for i in range(len(parts))] + list(parts)
+            if any(fnmatch.fnmatch(prefix, exclude) for exclude in exclude_patterns or [] for prefix in prefixes):
+                continue
+            try:
+                matches.append(self.resolve(match))
+            except PermissionError:
+                # Symlink leading out of the root
+                continue
+        return matches
+
+    def tree(self, path: str = ".") -> List[Dict[str, Any]]:
+        """Recursive {"name", "type", "children"} listing of a directory."""
+        entries = []
+        for name, is_dir in self.list_directory(path):
+            entry: Dict[str, Any] = {"name": name, "type": "directory" if is_dir else "file"}
+            if is_dir:
+                entry["children"] = self.tree(str(Path(self.resolve(path)) / name))
+            entries.append(entry)
+        return entries
+
+    # ===== LANGCHAIN TOOLS =====
+
+    def as_langchain_tools(self) -> list:
+        """Expose the backend as LangChain tools named like the filesystem MCP server's read-only tools.
+
+        Failures raise `ToolException` with the MCP server's error wording.
+        """
+        from langchain_core.tools import StructuredTool, ToolException
+
+        def guarded(operation):
+            @functools.wraps(operation)
+            def run(**kwargs):
+                self.logger.info(f"MCPFileTool.{operation.__name__} called with {kwargs}")
+                try:
+                    return operation(**kwargs)
+                except (OSError, ValueError) as e:
+                    raise ToolException(f"Error: {e}") from e
+            return run
+
+        def read_text_file(path: str, head: Optional[int] = None, tail: Optional[int] = None,
+                           start_line: Optional[int] = None, end_line: Optional[int] = None) -> str:
+            """Read the complete contents of a file as text. Use 'head' or 'tail' to read only the first or last N lines, or 'start_line'/'end_line' (1-based, inclusive) to read a line range."""
+            if start_line is not None or end_line is not None:
+                if head is not None or tail is not None:
+                    raise ValueError("Cannot combine a line range with head or tail")
+                return self.read_range(path, start_line or 1, end_line)
+            return self.read_text(path, head=head, tail=tail)
+
+        def read_multiple_files(paths: List[str]) -> str:
+            """Read the contents of multiple files simultaneously. Failed reads for individual files won't stop the entire operation."""
+            results = []
+            for path in paths:
+                try:
+                    results.append(f"{path}:\n{self.read_text(path)}\n")
+                except (OSError, ValueError) as e:
+                    results.append(f"{path}: Error - {e}")
+            return "\n---\n".join(results)
+
+        def list_directory(path: str) -> str:
+            """Get a detailed listing of all files and directories in a specified path. Results distinguish files and directories with [FILE] and [DIR] prefixes."""
+            return "\n".join(f"{'[DIR]' if is_dir else '[FILE]'} {name}" for name, is_dir in self.list_directory(path))
+
+        def directory_tree(path: str) -> str:
+            """Get a recursive tree view of files and directories as a JSON structure."""
+            return json.dumps(self.tree(path), indent=2)
+
+        def search_files(path: str, pattern: str, excludePatterns: Optional[List[str]] = None) -> str:
+            """Recursively search for files and directories matching a glob pattern, starting from a path. Returns full paths to all matching items."""
+            matches = self.glob(pattern, path, excludePatterns)
+            return "\n".join(str(match) for match in matches) if matches else "No matches found"
+
+        def get_file_info(path: str) -> str:
+            """Retrieve detailed metadata about a file or directory: size, creation time, last modified time, permissions and type."""
+            return "\n".join(f"{key}: {value}" for key, value in self.stat(path).items())
+
+        def list_allowed_directories() -> str:
+            """Return the list of directories that this server is allowed to access."""
+            return f"Allowed directories:\n{self.root or Path.cwd().resolve()}"
+
+        def read_file(path: str, head: Optional[int] = None, tail: Optional[int] = None) -> str:
+            """Read the complete contents of a file as text. DEPRECATED: Use read_text_file instead."""
+            return self.read_text(path, head=head, tail=tail)
+
+        operations = [read_text_file, read_multiple_files, list_directory, directory_tree,
+                      search_files, get_file_info, list_allowed_directories, read_file]
+        return [StructuredTool.from_function(guarded(operation)) for operation in operations]
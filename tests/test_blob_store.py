@@ -0,0 +1,117 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from assertpy import assert_that
+from langchain_core.messages import SystemMessage
+
+from deep_research_from_scratch import blob_store
+from deep_research_from_scratch.blob_store import (
+    BlobStore,
+    blob_run_scope,
+    is_blob_ref,
+    join_notes,
+    release_run_blobs,
+    resolve_notes,
+    store_note,
+)
+from research_agent_framework.config import get_settings
+
+
+@pytest.fixture
+def shared_store(monkeypatch):
+    store = BlobStore()
+    monkeypatch.setattr(get_settings(), "blob_store_enabled", True)
+    monkeypatch.setattr(blob_store, "_blob_store", store)
+    return store
+
+
+def test_put_is_content_addressed():
+    store = BlobStore()
+    ref = store.put("hello")
+    assert_that(is_blob_ref(ref)).is_true()
+    assert_that(store.put("hello")).is_equal_to(ref)
+    assert_that(store.memory_bytes).is_equal_to(5)
+    assert_that(store.get(ref)).is_equal_to("hello")
+    assert_that(ref in store).is_true()
+    with pytest.raises(KeyError):
+        store.get("blob:" + "0" * 64)
+
+
+def test_spill_to_disk_and_read_back(tmp_path):
+    store = BlobStore(max_memory_bytes=1000, spill_dir=tmp_path)
+    refs = [store.put(str(i) * 600) for i in range(3)]
+    assert_that(store.memory_bytes).is_less_than_or_equal_to(1000)
+    assert_that(list(tmp_path.rglob("*"))).is_not_empty()
+    assert_that([store.get(ref) for ref in refs]).is_equal_to([str(i) * 600 for i in range(3)])
+
+    # A fresh store over the same directory still finds spilled and flushed blobs
+    store.flush()
+    reopened = BlobStore(spill_dir=tmp_path)
+    assert_that(reopened.get(refs[2])).is_equal_to("2" * 600)
+
+
+def test_large_notes_become_refs(shared_store):
+    big = "x" * 5_000_000
+    note = store_note(big)
+    assert_that(len(note)).is_less_than(80)
+    assert_that(store_note("small note")).is_equal_to("small note")
+    assert_that(resolve_notes([note, "inline"])).is_equal_to([big, "inline"])
+
+
+def test_join_notes_builds_compound_refs_lazily(shared_store):
+    first, second = store_note("a" * 5000), store_note("b" * 5000)
+    joined = join_notes([first, "inline", second])
+    assert_that(is_blob_ref(joined)).is_true()
+    assert_that(resolve_notes([joined])).is_equal_to(["\n".join(["a" * 5000, "inline", "b" * 5000])])
+    assert_that(join_notes(["plain", "text"])).is_equal_to("plain\ntext")
+
+
+def test_store_is_disabled_by_default():
+    assert_that(get_settings().blob_store_enabled).is_false()
+    assert_that(store_note("x" * 10_000)).is_equal_to("x" * 10_000)
+
+
+def test_memory_budget_is_enforced_without_spill_dir(monkeypatch, shared_store):
+    shared_store.max_memory_bytes = 12_000
+    first = store_note("a" * 10_000)
+    # No room left and nowhere to spill: the note stays inline
+    assert_that(store_note("b" * 10_000)).is_equal_to("b" * 10_000)
+    assert_that(shared_store.memory_bytes).is_equal_to(10_000)
+    with pytest.raises(MemoryError):
+        shared_store.put("c" * 10_000)
+    # Joining needs room for the inline note too, so it falls back to plain text
+    assert_that(join_notes([first, "d" * 5_000])).is_equal_to("a" * 10_000 + "\n" + "d" * 5_000)
+
+
+def test_run_blobs_are_released_when_no_other_run_holds_them(shared_store):
+    with blob_run_scope("run-1"):
+        only_first = store_note("a" * 5000)
+        shared = store_note("b" * 5000)
+    with blob_run_scope("run-2"):
+        assert_that(store_note("b" * 5000)).is_equal_to(shared)
+
+    assert_that(release_run_blobs("run-1")).is_equal_to(1)
+    assert_that(only_first in shared_store).is_false()
+    assert_that(resolve_notes([shared])).is_equal_to(["b" * 5000])
+    assert_that(release_run_blobs("run-2")).is_equal_to(1)
+    assert_that(shared_store.memory_bytes).is_equal_to(0)
+
+
+def test_supervisor_run_releases_its_blobs_when_it_ends(monkeypatch, shared_store):
+    import deep_research_from_scratch.multi_agent_supervisor as sup
+
+    async def researcher(payload):
+        return {"compressed_research": "done", "raw_notes": [store_note(payload["research_topic"] * 5000)]}
+
+    monkeypatch.setattr(sup, "researcher_agent", SimpleNamespace(ainvoke=researcher))
+    research = SystemMessage(content="research")
+    setattr(research, "tool_calls", [{"name": "ConductResearch", "id": "t1", "args": {"research_topic": "A"}}])
+    state = {"supervisor_messages": [research], "research_brief": "b", "research_iterations": 0, "run_id": "run-b"}
+    command = asyncio.run(sup.supervisor_tools(state))
+    assert_that(is_blob_ref(command.update["raw_notes"][0])).is_true()
+    assert_that(shared_store.memory_bytes).is_greater_than(0)
+
+    done = SystemMessage(content="done")
+    asyncio.run(sup.supervisor_tools({**state, "supervisor_messages": [research, done]}))
+    assert_that(shared_store.memory_bytes).is_equal_to(0)
@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+from assertpy import assert_that
+from langchain_core.messages import AIMessage, HumanMessage
+
+from deep_research_from_scratch import blob_store
+from deep_research_from_scratch import multi_agent_supervisor as sup
+from deep_research_from_scratch import research_agent
+from deep_research_from_scratch.checkpointing import SqliteCheckpointer, get_checkpointer, resume_run, thread_config
+from research_agent_framework.config import get_settings
+
+
+class PerTopicModel:
+    """Counts calls per research topic; the topic is the researcher's first human message."""
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.calls = {}
+
+    async def ainvoke(self, messages):
+        topic = next(m.content for m in messages if isinstance(m, HumanMessage))
+        self.calls[topic] = self.calls.get(topic, 0) + 1
+        return await self.respond(topic)
+
+
+class CompressModel:
+    """Compresses instantly, except topics listed in `blocked` which hang until cancelled."""
+
+    def __init__(self):
+        self.blocked = set()
+        self.calls = {}
+
+    async def ainvoke(self, messages):
+        human = messages[-1].content
+        topic = "topic A" if "topic A" in human else "topic B"
+        self.calls[topic] = self.calls.get(topic, 0) + 1
+        if topic in self.blocked:
+            await asyncio.sleep(3600)
+        return AIMessage(content=f"findings on {topic}")
+
+
+class SupervisorModel:
+    def __init__(self):
+        self.calls = 0
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        if self.calls == 1:
+            return AIMessage(content="", tool_calls=[
+                {"name": "ConductResearch", "args": {"research_topic": "topic A"}, "id": "call_a"},
+                {"name": "ConductResearch", "args": {"research_topic": "topic B"}, "id": "call_b"},
+            ])
+        return AIMessage(content="", tool_calls=[{"name": "ResearchComplete", "args": {}, "id": "call_done"}])
+
+
+@pytest.fixture
+def graphs(tmp_path, monkeypatch):
+    checkpointer = SqliteCheckpointer(tmp_path / "checkpoints.sqlite")
+    researcher = research_agent.agent_builder.compile(checkpointer=checkpointer)
+    supervisor = sup.supervisor_builder.compile(checkpointer=checkpointer)
+    monkeypatch.setattr(sup, "researcher_agent", researcher)
+
+    async def respond(topic):
+        return AIMessage(content=f"done researching {topic}")
+
+    researcher_model = PerTopicModel(respond)
+    compress_model = CompressModel()
+    supervisor_model = SupervisorModel()
+    monkeypatch.setattr(research_agent, "model_with_tools", researcher_model)
+    monkeypatch.setattr(research_agent, "compress_model", compress_model)
+    monkeypatch.setattr(sup, "supervisor_model_with_tools", supervisor_model)
+    return supervisor, researcher_model, compress_model, supervisor_model
+
+
+def test_resume_skips_finished_researchers(graphs):
+    supervisor, researcher_model, compress_model, supervisor_model = graphs
+    config = thread_config("run-1")
+    payload = {"supervisor_messages": [HumanMessage(content="brief")], "research_brief": "brief"}
+
+    async def crash_then_resume():
+        # Researcher B hangs in compression; the run is killed once A has finished
+        compress_model.blocked = {"topic B"}
+        run = asyncio.create_task(supervisor.ainvoke(payload, config=config))
+        while compress_model.calls.get("topic B", 0) == 0 or compress_model.calls.get("topic A", 0) == 0:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+        run.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await run
+
+        compress_model.blocked = set()
+        return await resume_run(supervisor, "run-1")
+
+    result = asyncio.run(crash_then_resume())
+
+    assert_that(result["notes"]).contains("findings on topic A", "findings on topic B")
+    # The supervisor's delegation decision is not repeated
+    assert_that(supervisor_model.calls).is_equal_to(2)
+    # A finished before the crash and is not rerun; B resumes at compression
+    assert_that(researcher_model.calls).is_equal_to({"topic A": 1, "topic B": 1})
+    assert_that(compress_model.calls).is_equal_to({"topic A": 1, "topic B": 2})
+
+
+def test_resume_of_finished_run_returns_saved_state(graphs):
+    supervisor, researcher_model, _, supervisor_model = graphs
+    payload = {"supervisor_messages": [HumanMessage(content="brief")], "research_brief": "brief"}
+
+    async def run_twice():
+        first = await supervisor.ainvoke(payload, config=thread_config("run-2"))
+        second = await resume_run(supervisor, "run-2")
+        return first, second
+
+    first, second = asyncio.run(run_twice())
+
+    assert_that(second["notes"]).is_equal_to(first["notes"])
+    assert_that(supervisor_model.calls).is_equal_to(2)
+    assert_that(researcher_model.calls).is_equal_to({"topic A": 1, "topic B": 1})
+
+
+def test_resume_of_unknown_thread_raises(graphs):
+    supervisor = graphs[0]
+    with pytest.raises(ValueError):
+        asyncio.run(resume_run(supervisor, "missing"))
+
+
+def test_checkpointing_writes_blobs_through_to_disk(tmp_path, monkeypatch):
+    monkeypatch.setattr(get_settings(), "checkpoint_enabled", True)
+    monkeypatch.setattr(get_settings(), "checkpoint_path", str(tmp_path / "ckpt" / "research.sqlite"))
+    monkeypatch.setattr(get_settings(), "blob_store_enabled", True)
+    monkeypatch.setattr(blob_store, "_blob_store", None)
+
+    ref = blob_store.store_note("x" * 10_000)
+    blob_store.get_blob_store().clear()
+
+    # Still resolvable after the in-memory tier is lost
+    assert_that(blob_store.resolve_note(ref)).is_equal_to("x" * 10_000)
+    assert_that(list((tmp_path / "ckpt" / "blobs").rglob("*"))).is_not_empty()
+
+
+def test_checkpointer_disabled_by_default():
+    assert_that(get_checkpointer()).is_none()
@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+from assertpy import assert_that
+
+from deep_research_from_scratch import utils
+from deep_research_from_scratch.chunking import count_tokens, split_into_chunks
+from deep_research_from_scratch.state_research import Summary
+
+
+def test_split_respects_budget_overlap_and_max_chunks():
+    text = " ".join(f"word{i}" for i in range(2000))
+    chunks = split_into_chunks(text, chunk_tokens=200, overlap_tokens=20)
+    assert_that(len(chunks)).is_greater_than(1)
+    for chunk in chunks:
+        assert_that(count_tokens(chunk)).is_less_than_or_equal_to(200)
+    # Consecutive chunks overlap
+    assert_that(chunks[0][-100:]).contains(chunks[1][:10])
+    assert_that(split_into_chunks(text, chunk_tokens=200, overlap_tokens=20, max_chunks=2)).is_equal_to(chunks[:2])
+
+
+def test_small_text_is_a_single_chunk():
+    assert_that(split_into_chunks("short page", chunk_tokens=100, overlap_tokens=10)).is_equal_to(["short page"])
+    assert_that(utils.split_webpage_content("short page", chunk_tokens=100)).is_equal_to(["short page"])
+
+
+def test_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        split_into_chunks("x", chunk_tokens=0)
+
+
+class MapReduceModel:
+    model_name = "map-reduce-model"
+
+    def __init__(self, fail_reduce=False, fail_marker=None):
+        self.prompts = []
+        self.fail_reduce = fail_reduce
+        self.fail_marker = fail_marker
+
+    def with_structured_output(self, schema):
+        return self
+
+    def invoke(self, messages):
+        prompt = messages[0].content
+        self.prompts.append(prompt)
+        if "<section_summaries>" in prompt:
+            if self.fail_reduce:
+                raise RuntimeError("reduce failed")
+            return Summary(summary="merged", key_excerpts="best quotes")
+        if self.fail_marker and self.fail_marker in prompt:
+            raise RuntimeError("chunk failed")
+        return Summary(summary=f"part{len(self.prompts)}", key_excerpts=f"quote{len(self.prompts)}")
+
+    def batch(self, inputs, return_exceptions=False):
+        results = []
+        for messages in inputs:
+            try:
+                results.append(self.invoke(messages))
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+        return results
+
+    async def ainvoke(self, messages):
+        return self.invoke(messages)
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    from research_agent_framework.config import get_settings
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "summary_chunk_tokens", 100)
+    monkeypatch.setattr(settings, "summary_chunk_overlap_tokens", 10)
+    monkeypatch.setattr(settings, "summary_max_chunks", 3)
+    monkeypatch.setattr(utils, "get_summary_cache", lambda: None)
+
+
+# Four 100-token (approx.) sections with distinct words
+BIG_PAGE = "aaaa " * 80 + "bbbb " * 80 + "cccc " * 80 + "dddd " * 80
+
+
+def test_large_page_is_mapped_then_reduced(monkeypatch):
+    model = MapReduceModel()
+    monkeypatch.setattr(utils, "summarization_model", model)
+    result = utils.summarize_webpage_content(BIG_PAGE)
+    assert_that(result).contains("<summary>\nmerged\n</summary>").contains("best quotes")
+    # max_chunks=3 map calls plus one reduce call
+    assert_that(model.prompts).is_length(4)
+    assert_that(model.prompts[-1]).contains("<section_3>")
+
+
+def test_async_path_and_failed_chunk_is_skipped(monkeypatch):
+    model = MapReduceModel(fail_marker="cccc")
+    monkeypatch.setattr(utils, "summarization_model", model)
+    result = asyncio.run(utils.summarize_webpage_content_async(BIG_PAGE))
+    assert_that(result).contains("merged")
+    reduce_prompt = model.prompts[-1]
+    assert_that(reduce_prompt).contains("<section_1>").does_not_contain("<section_3>")
+
+
+def test_reduce_failure_concatenates_partials(monkeypatch):
+    model = MapReduceModel(fail_reduce=True)
+    monkeypatch.setattr(utils, "summarization_model", model)
+    result = utils.summarize_webpage_content(BIG_PAGE)
+    assert_that(result).contains("part1\n\npart2\n\npart3").contains("quote1, quote2, quote3")
+
+
+def test_filtered_search_pages_fit_one_call_with_default_settings():
+    from research_agent_framework.config import Settings
+    from deep_research_from_scratch.relevance import filter_relevant_passages
+
+    defaults = Settings()
+    page = "\n\n".join(f"Paragraph {i} about coffee roasting and unrelated filler text." * 20 for i in range(400))
+    assert_that(len(utils.split_webpage_content(page, chunk_tokens=defaults.summary_chunk_tokens))).is_greater_than(1)
+    filtered = filter_relevant_passages(page, "coffee roasting", defaults.relevance_filter_max_chars)
+    assert_that(count_tokens(filtered)).is_less_than(defaults.summary_chunk_tokens)
@@ -0,0 +1,89 @@
+import os
+
+import pytest
+from assertpy import assert_that
+
+from deep_research_from_scratch import document_index, prompts
+from deep_research_from_scratch.document_index import DocumentIndex, format_hits, to_match_query
+from research_agent_framework.config import get_settings
+
+
+@pytest.fixture
+def files(tmp_path):
+    root = tmp_path / "files"
+    (root / "cities").mkdir(parents=True)
+    (root / "coffee.md").write_text(
+        "# Coffee shops\n\nSightglass roasts on site.\n\n" + "filler line\n" * 50 + "Ritual Coffee opened in the Mission in 2005.\n",
+        encoding="utf-8",
+    )
+    (root / "cities" / "tea.txt").write_text("Tea houses in Chinatown.\nSome serve coffee too.\n", encoding="utf-8")
+    (root / "image.png").write_bytes(b"\x89PNG coffee")
+    return root
+
+
+def test_search_ranks_passages_with_line_offsets(files, tmp_path):
+    index = DocumentIndex(files, path=tmp_path / "index.sqlite", chunk_lines=20)
+    assert_that(index.update()).is_equal_to({"added": 2, "updated": 0, "removed": 0, "unchanged": 0})
+
+    hits = index.search("when did Ritual coffee open in the mission")
+    root = files.resolve()
+    assert_that(hits[0].path).is_equal_to(str(root / "coffee.md"))
+    assert_that(hits[0].start_line).is_equal_to(41)
+    assert_that(hits[0].line).is_equal_to(55)
+    assert_that(hits[0].snippet).contains("**Ritual**")
+    assert_that({hit.path for hit in hits}).is_equal_to({str(root / "coffee.md"), str(root / "cities" / "tea.txt")})
+    assert_that(format_hits(hits)).contains(f"{root / 'coffee.md'}:41-55 (best match at line 55")
+
+
+def test_update_is_incremental(files, tmp_path):
+    index = DocumentIndex(files, path=tmp_path / "index.sqlite")
+    index.update()
+    assert_that(index.update()).is_equal_to({"added": 0, "updated": 0, "removed": 0, "unchanged": 2})
+
+    tea = files / "cities" / "tea.txt"
+    tea.write_text("Matcha bars replaced the tea houses.\n", encoding="utf-8")
+    os.utime(tea, ns=(tea.stat().st_atime_ns, tea.stat().st_mtime_ns + 1_000_000))
+    (files / "coffee.md").unlink()
+    (files / "bakeries.md").write_text("Tartine bakes bread.\n", encoding="utf-8")
+
+    assert_that(index.update()).is_equal_to({"added": 1, "updated": 1, "removed": 1, "unchanged": 0})
+    assert_that(index.search("Ritual")).is_empty()
+    assert_that([hit.path for hit in index.search("matcha")]).is_equal_to([str(files.resolve() / "cities" / "tea.txt")])
+    assert_that(index.stats()).is_equal_to({"files": 2, "passages": 2})
+
+    # The on-disk index survives a restart
+    index.close()
+    reopened = DocumentIndex(files, path=tmp_path / "index.sqlite")
+    assert_that(reopened.update()["unchanged"]).is_equal_to(2)
+
+
+def test_queries_with_fts_syntax_are_escaped():
+    assert_that(to_match_query('coffee -tea "AND" NEAR(x)')).is_equal_to('"coffee" OR "tea" OR "and" OR "near" OR "x"')
+    assert_that(to_match_query("?!")).is_none()
+
+
+def test_search_local_documents_tool(files, monkeypatch):
+    monkeypatch.setattr(document_index, "_document_index", DocumentIndex(files))
+    monkeypatch.setattr(get_settings(), "local_index_refresh_interval_s", 0.0)
+
+    output = document_index.search_local_documents.invoke({"query": "Sightglass", "max_results": 3})
+    assert_that(output).starts_with(f"1. {files.resolve() / 'coffee.md'}:1-").contains("**Sightglass**")
+    (files / "new.md").write_text("Sightglass opened a second cafe.\n", encoding="utf-8")
+    assert_that(document_index.search_local_documents.invoke({"query": "second cafe"})).contains(str(files.resolve() / "new.md"))
+    assert_that(document_index.search_local_documents.invoke({"query": "zzz"})).is_equal_to("No matching passages found.")
+
+
+def test_mcp_prompt_mentions_local_search_only_when_bound():
+    from deep_research_from_scratch import research_agent_mcp
+
+    with_index = research_agent_mcp.research_prompt({"search_local_documents": document_index.search_local_documents})
+    without_index = research_agent_mcp.research_prompt({})
+
+    assert_that(with_index).contains("**search_local_documents**").contains("3. **Identify relevant passages**")
+    assert_that(without_index).does_not_contain("search_local_documents").contains("3. **Identify relevant files**")
+    assert_that(without_index).contains("- **search_files**: Find files by name pattern\n- **think_tool**")
+    assert_that(with_index).contains("by name pattern\n- **search_local_documents**: Full-text search")
+    # The template itself only takes the date, as notebooks/3_research_agent_mcp.ipynb formats it
+    assert_that(prompts.research_agent_prompt_with_mcp.format(date="today")).is_equal_to(
+        without_index.replace(research_agent_mcp.get_today_str(), "today")
+    )
@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+from assertpy import assert_that
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.tools import tool
+
+from deep_research_from_scratch import research_agent
+from deep_research_from_scratch.blob_store import resolve_notes
+from deep_research_from_scratch.compaction import COMPACTED_PLACEHOLDER, compaction_candidates, message_tokens
+
+
+@tool
+async def search(query: str) -> str:
+    """Search."""
+    return f"FINDING-{query} " + "verbose page text " * 200
+
+
+class Researcher:
+    """Calls `search` for `rounds` turns, recording the prompt size of every turn."""
+
+    def __init__(self, rounds):
+        self.rounds = rounds
+        self.prompt_tokens = []
+        self.system_prompts = []
+
+    async def ainvoke(self, messages):
+        self.prompt_tokens.append(message_tokens(messages))
+        self.system_prompts.append(messages[0].content)
+        turn = len(self.prompt_tokens)
+        if turn > self.rounds:
+            return AIMessage(content="done")
+        return AIMessage(content="", tool_calls=[{"name": "search", "args": {"query": str(turn)}, "id": f"call_{turn}"}])
+
+
+class DigestModel:
+    def __init__(self, fail=False):
+        self.calls = 0
+        self.fail = fail
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("digest model down")
+        findings = [word for word in messages[0].content.split() if word.startswith("FINDING-")]
+        return AIMessage(content=f"digest v{self.calls}: " + " ".join(findings))
+
+
+class CompressModel:
+    async def ainvoke(self, messages):
+        self.messages = messages
+        return AIMessage(content="compressed")
+
+
+@pytest.fixture
+def setup(monkeypatch):
+    from research_agent_framework.config import get_settings
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "history_compaction_enabled", True)
+    monkeypatch.setattr(settings, "history_compaction_threshold_tokens", 1500)
+    monkeypatch.setattr(settings, "history_compaction_keep_recent_rounds", 1)
+    monkeypatch.setattr(settings, "researcher_max_tool_call_iterations", None)
+    researcher, digest, compress = Researcher(rounds=6), DigestModel(), CompressModel()
+    monkeypatch.setattr(research_agent, "model_with_tools", researcher)
+    monkeypatch.setattr(research_agent, "summarization_model", digest)
+    monkeypatch.setattr(research_agent, "compress_model", compress)
+    monkeypatch.setattr(research_agent, "tools_by_name", {"search": search})
+    return settings, researcher, digest, compress
+
+
+def _run():
+    return asyncio.run(research_agent.researcher_agent.ainvoke(
+        {"researcher_messages": [HumanMessage(content="topic")], "research_topic": "topic"}
+    ))
+
+
+def test_prompt_size_stays_bounded(setup):
+    _, researcher, digest, compress = setup
+    result = _run()
+
+    # Without compaction every turn adds ~800 tokens; with it the prompt stops growing
+    assert_that(max(researcher.prompt_tokens[2:])).is_less_than(2 * researcher.prompt_tokens[1] + 200)
+    assert_that(digest.calls).is_greater_than(0)
+    assert_that(researcher.system_prompts[-1]).contains("<research_digest>", "FINDING-1")
+
+    # The final compression sees the digest and only the recent verbatim outputs
+    assert_that(compress.messages[0].content).contains("<research_digest>")
+    tool_messages = [m for m in compress.messages if isinstance(m, ToolMessage)]
+    assert_that(tool_messages).is_length(6)
+    assert_that([m.content for m in tool_messages[:-1]]).contains_only(COMPACTED_PLACEHOLDER)
+
+    # No raw output is lost
+    raw = "\n".join(resolve_notes(result["raw_notes"]))
+    for turn in range(1, 7):
+        assert_that(raw).contains(f"FINDING-{turn} ")
+    assert_that(raw).does_not_contain(COMPACTED_PLACEHOLDER)
+
+
+def test_disabled_or_failing_digest_keeps_history(setup, monkeypatch):
+    settings, researcher, _, compress = setup
+    monkeypatch.setattr(research_agent, "summarization_model", DigestModel(fail=True))
+    _run()
+    assert_that([m.content for m in compress.messages if isinstance(m, ToolMessage)]).does_not_contain(COMPACTED_PLACEHOLDER)
+
+    monkeypatch.setattr(settings, "history_compaction_enabled", False)
+    researcher.prompt_tokens.clear()
+    _run()
+    assert_that(researcher.prompt_tokens).is_sorted()
+
+
+def test_candidates_skip_recent_rounds():
+    messages = [HumanMessage(content="topic")]
+    for turn in range(3):
+        messages.append(AIMessage(content="", tool_calls=[{"name": "search", "args": {}, "id": f"c{turn}"}]))
+        messages.append(ToolMessage(content=f"out {turn}", tool_call_id=f"c{turn}", name="search"))
+    assert_that([m.content for m in compaction_candidates(messages, 2)]).is_equal_to(["out 0"])
+    assert_that(compaction_candidates(messages, 3)).is_empty()
@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+from assertpy import assert_that
+from langchain_core.language_models.fake_chat_models import FakeMessagesListChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.tools import tool
+
+from deep_research_from_scratch import research_agent
+from deep_research_from_scratch.instrumentation import (
+    InstrumentationHandler,
+    estimate_cost,
+    percentile,
+    read_jsonl,
+    summarize_spans,
+)
+from research_agent_framework.config import get_settings
+
+
+@tool
+async def fake_search(query: str) -> str:
+    """Search."""
+    await asyncio.sleep(0.05)
+    return f"results for {query}"
+
+
+def ai(content="", tool_calls=None, model="gpt-4.1", tokens=(1000, 100)):
+    return AIMessage(
+        content=content,
+        tool_calls=tool_calls or [],
+        usage_metadata={"input_tokens": tokens[0], "output_tokens": tokens[1], "total_tokens": sum(tokens)},
+        response_metadata={"model_name": model},
+    )
+
+
+@pytest.fixture
+def instrumented_run(monkeypatch):
+    calls = [{"name": "fake_search", "args": {"query": "q"}, "id": "call_1"}]
+    monkeypatch.setattr(research_agent, "model_with_tools", FakeMessagesListChatModel(
+        responses=[ai(tool_calls=calls), ai("done")]
+    ))
+    monkeypatch.setattr(research_agent, "compress_model", FakeMessagesListChatModel(
+        responses=[ai("compressed", model="gpt-4.1-mini", tokens=(2000, 500))]
+    ))
+    monkeypatch.setattr(research_agent, "tools_by_name", {"fake_search": fake_search})
+
+    handler = InstrumentationHandler()
+    asyncio.run(research_agent.researcher_agent.ainvoke(
+        {"researcher_messages": [HumanMessage(content="topic")]}, config={"callbacks": [handler]}
+    ))
+    return handler
+
+
+def test_records_nodes_models_and_tools(instrumented_run):
+    spans = instrumented_run.records()
+    nodes = [s["name"] for s in spans if s["kind"] == "node"]
+    assert_that(nodes).contains("llm_call", "tool_node", "compress_research")
+    assert_that(nodes.count("llm_call")).is_equal_to(2)
+
+    tool_span = next(s for s in spans if s["kind"] == "tool")
+    assert_that(tool_span["name"]).is_equal_to("fake_search")
+    assert_that(tool_span["node"]).is_equal_to("tool_node")
+    assert_that(tool_span["wall_s"]).is_greater_than_or_equal_to(0.04)
+
+    llm_spans = [s for s in spans if s["kind"] == "llm"]
+    assert_that(llm_spans).is_length(3)
+    compress = next(s for s in llm_spans if s["node"] == "compress_research")
+    assert_that(compress["model"]).is_equal_to("gpt-4.1-mini")
+    assert_that(compress["input_tokens"]).is_equal_to(2000)
+    assert_that(compress["cost_usd"]).is_close_to(2000 * 0.4e-6 + 500 * 1.6e-6, 1e-12)
+
+    # One top-level run
+    assert_that({s["trace_id"] for s in spans}).is_length(1)
+
+
+def test_jsonl_export_and_summary(instrumented_run, tmp_path):
+    path = tmp_path / "spans.jsonl"
+    written = instrumented_run.to_jsonl(path)
+    records = read_jsonl(path)
+    assert_that(records).is_length(written)
+
+    summary = summarize_spans(records)
+    assert_that(summary["node:llm_call"]["count"]).is_equal_to(2)
+    assert_that(summary["tool:fake_search"]).contains_key("wall_s_p50", "wall_s_p90", "wall_s_p99", "queue_s_p50")
+    assert_that(summary).is_equal_to(instrumented_run.summary())
+
+
+def test_cost_and_percentiles(monkeypatch):
+    assert_that(estimate_cost("openai:gpt-4.1", 1_000_000, 0)).is_equal_to(2.0)
+    assert_that(estimate_cost("unknown-model", 1000, 1000)).is_equal_to(0.0)
+    monkeypatch.setattr(get_settings(), "model_prices", {"unknown-model": {"input": 1.0, "output": 1.0}})
+    assert_that(estimate_cost("unknown-model", 500_000, 500_000)).is_equal_to(1.0)
+
+    values = list(range(1, 101))
+    assert_that(percentile(values, 50)).is_equal_to(50)
+    assert_that(percentile(values, 99)).is_equal_to(99)
+    assert_that(percentile([], 90)).is_equal_to(0.0)
@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+from assertpy import assert_that
+from langchain_core.messages import AIMessage
+from langchain_core.tools import ToolException, tool
+
+from deep_research_from_scratch import research_agent_mcp
+from deep_research_from_scratch.mcp_catalog import ToolCatalog
+from research_agent_framework.config import get_settings
+
+in_flight = {"now": 0, "max": 0}
+
+
+@tool
+async def read_file(path: str) -> str:
+    """Read a file."""
+    in_flight["now"] += 1
+    in_flight["max"] = max(in_flight["max"], in_flight["now"])
+    try:
+        await asyncio.sleep(0.05 if path != "slow.md" else 5)
+        if path == "broken.md":
+            raise ToolException("ENOENT: no such file")
+        return f"contents of {path}"
+    finally:
+        in_flight["now"] -= 1
+
+
+@pytest.fixture(autouse=True)
+def catalog(monkeypatch):
+    async def load(server):
+        return [read_file]
+
+    in_flight.update(now=0, max=0)
+    catalog = ToolCatalog(["filesystem"], load, extra_tools=[research_agent_mcp.think_tool])
+    monkeypatch.setattr(research_agent_mcp, "_catalog", catalog)
+    monkeypatch.setattr(get_settings(), "mcp_tool_max_concurrency_per_server", 3)
+    monkeypatch.setattr(get_settings(), "mcp_tool_call_timeout_s", 1.0)
+    return catalog
+
+
+def state_with(calls):
+    tool_calls = [{"name": name, "args": args, "id": f"call_{i}"} for i, (name, args) in enumerate(calls)]
+    return {"researcher_messages": [AIMessage(content="", tool_calls=tool_calls)]}
+
+
+def test_calls_run_concurrently_under_the_server_cap_in_order():
+    calls = [("read_file", {"path": f"doc{i}.md"}) for i in range(8)] + [("think_tool", {"reflection": "next"})]
+
+    messages = asyncio.run(research_agent_mcp.tool_node(state_with(calls)))["researcher_messages"]
+
+    assert_that([m.tool_call_id for m in messages]).is_equal_to([f"call_{i}" for i in range(9)])
+    assert_that(messages[3].content).is_equal_to("contents of doc3.md")
+    assert_that(messages[8].content).contains("next")
+    assert_that(in_flight["max"]).is_equal_to(3)
+
+
+def test_failures_and_timeouts_become_error_messages():
+    calls = [
+        ("read_file", {"path": "a.md"}),
+        ("read_file", {"path": "broken.md"}),
+        ("read_file", {"path": "slow.md"}),
+        ("delete_everything", {}),
+        ("read_file", {"path": "b.md"}),
+    ]
+
+    messages = asyncio.run(research_agent_mcp.tool_node(state_with(calls)))["researcher_messages"]
+
+    assert_that([m.status for m in messages]).is_equal_to(["success", "error", "error", "error", "success"])
+    assert_that(messages[1].content).contains("ENOENT")
+    assert_that(messages[2].content).contains("timed out after 1.0s")
+    assert_that(messages[3].content).contains("unknown tool")
+    assert_that(messages[4].content).is_equal_to("contents of b.md")
@@ -27,3 +27,94 @@ def test_read_file_mock_mode():
     assert_that(result, description="Mock mode should return non-None content").is_not_none()
     assert_that(result, description="Mock mode should return content starting with '[MOCK CONTENT]'").starts_with("[MOCK CONTENT]")
     assert_that(result, description="Mock mode content should contain filename").contains("file.txt")
+
+
+@pytest.fixture
+def docs(tmp_path):
+    root = tmp_path / "files"
+    (root / "notes").mkdir(parents=True)
+    (root / "a.md").write_text("line 1\nline 2\nline 3\nline 4\n", encoding="utf-8")
+    (root / "notes" / "b.md").write_text("beta\n", encoding="utf-8")
+    (root / "notes" / "c.txt").write_text("gamma\n", encoding="utf-8")
+    (tmp_path / "secret.txt").write_text("outside", encoding="utf-8")
+    return root
+
+
+def test_backend_list_read_range_stat_glob(docs):
+    from assertpy import assert_that
+    tool = MCPFileTool(get_logger(), root=docs)
+    assert_that(tool.list_directory(".")).is_equal_to([("a.md", False), ("notes", True)])
+    assert_that(tool.read_text("a.md", head=2)).is_equal_to("line 1\nline 2\n")
+    assert_that(tool.read_text("a.md", tail=1)).is_equal_to("line 4\n")
+    assert_that(tool.read_range("a.md", 2, 3)).is_equal_to("line 2\nline 3\n")
+    assert_that(tool.stat("notes/b.md")).contains_entry({"size": 5}, {"isFile": True}, {"isDirectory": False})
+    assert_that([p.name for p in tool.glob("*.md")]).is_equal_to(["a.md", "b.md"])
+    assert_that([p.name for p in tool.glob("*", exclude_patterns=["notes"])]).is_equal_to(["a.md"])
+
+
+def test_backend_confines_paths_to_root(docs):
+    tool = MCPFileTool(get_logger(), root=docs)
+    with pytest.raises(PermissionError):
+        tool.read_text("../secret.txt")
+    with pytest.raises(PermissionError):
+        tool.stat(str(docs.parent / "secret.txt"))
+    # read_file keeps its None-on-failure contract
+    assert tool.read_file("../secret.txt") is None
+
+
+def test_langchain_tools_mirror_the_mcp_server(docs):
+    from assertpy import assert_that
+    from langchain_core.tools import ToolException
+    tools = {t.name: t for t in MCPFileTool(get_logger(), root=docs).as_langchain_tools()}
+    assert_that(tools).contains_key("read_text_file", "read_multiple_files", "list_directory", "directory_tree",
+                                    "search_files", "get_file_info", "list_allowed_directories", "read_file")
+    assert_that(tools["list_directory"].invoke({"path": "."})).is_equal_to("[FILE] a.md\n[DIR] notes")
+    assert_that(tools["read_text_file"].invoke({"path": "a.md", "start_line": 3})).is_equal_to("line 3\nline 4\n")
+    assert_that(tools["search_files"].invoke({"path": ".", "pattern": "*.txt"})).is_equal_to(str(docs / "notes" / "c.txt"))
+    assert_that(tools["search_files"].invoke({"path": ".", "pattern": "*.pdf"})).is_equal_to("No matches found")
+    assert_that(tools["read_multiple_files"].invoke({"paths": ["notes/b.md", "missing.md"]})).contains("notes/b.md:\nbeta", "missing.md: Error -")
+    assert_that(tools["get_file_info"].invoke({"path": "notes"})).contains("isDirectory: True")
+    with pytest.raises(ToolException, match="Access denied"):
+        tools["read_text_file"].invoke({"path": "../secret.txt"})
+
+
+def test_mcp_agent_uses_native_backend_without_a_server(monkeypatch):
+    import asyncio
+    from assertpy import assert_that
+    from langchain_core.messages import AIMessage, HumanMessage
+    from deep_research_from_scratch import research_agent_mcp
+    from research_agent_framework.config import get_settings
+
+    class ScriptedModel:
+        def __init__(self):
+            self.responses = [
+                AIMessage(content="", tool_calls=[
+                    {"name": "list_directory", "args": {"path": "."}, "id": "c1"},
+                    {"name": "read_text_file", "args": {"path": "coffee_shops_sf.md", "head": 1}, "id": "c2"},
+                ]),
+                AIMessage(content="done"),
+            ]
+
+        def bind_tools(self, tools):
+            return self
+
+        async def ainvoke(self, messages):
+            return self.responses.pop(0)
+
+    class Compressor:
+        async def ainvoke(self, messages):
+            return AIMessage(content="compressed")
+
+    async def no_pool():
+        raise AssertionError("no MCP session expected")
+
+    monkeypatch.setattr(get_settings(), "mcp_file_backend", "native")
+    monkeypatch.setattr(research_agent_mcp, "_catalog", None)
+    monkeypatch.setattr(research_agent_mcp, "get_session_pool", no_pool)
+    monkeypatch.setattr(research_agent_mcp, "model", ScriptedModel())
+    monkeypatch.setattr(research_agent_mcp, "compress_model", Compressor())
+
+    result = asyncio.run(research_agent_mcp.agent_mcp.ainvoke({"researcher_messages": [HumanMessage(content="coffee")]}))
+
+    assert_that(result["compressed_research"]).is_equal_to("compressed")
+    assert_that(research_agent_mcp.get_tool_catalog().server_of("read_text_file")).is_equal_to("filesystem")
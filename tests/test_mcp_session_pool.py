@@ -0,0 +1,260 @@
+import asyncio
+import sys
+import textwrap
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+from assertpy import assert_that
+from mcp.types import CallToolResult, ListToolsResult, TextContent, Tool
+
+from deep_research_from_scratch.mcp_pool import MCPSessionPool
+
+ECHO_TOOL = Tool(name="echo", description="Echo the text.", inputSchema={"type": "object", "properties": {"text": {"type": "string"}}, "required": ["text"]})
+
+
+class FakeSession:
+    def __init__(self, number):
+        self.number = number
+        self.dead = False
+        self.closed = False
+        self.calls = 0
+
+    async def initialize(self):
+        pass
+
+    async def send_ping(self):
+        if self.dead:
+            raise ConnectionError("server gone")
+
+    async def list_tools(self, cursor=None):
+        return ListToolsResult(tools=[ECHO_TOOL])
+
+    async def call_tool(self, name, arguments=None, **kwargs):
+        if self.dead:
+            raise ConnectionError("server gone")
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return CallToolResult(content=[TextContent(type="text", text=f"{arguments['text']} from {self.number}")])
+
+
+class FakeServer:
+    def __init__(self):
+        self.sessions = []
+
+    @asynccontextmanager
+    async def __call__(self, connection):
+        session = FakeSession(len(self.sessions))
+        self.sessions.append(session)
+        try:
+            yield session
+        finally:
+            session.closed = True
+
+
+def make_pool(server, **kwargs):
+    return MCPSessionPool({"fs": {"transport": "stdio"}}, session_factory=server, health_check_interval_s=None, **kwargs)
+
+
+def test_start_warms_min_sessions_and_calls_reuse_them():
+    server = FakeServer()
+
+    async def run():
+        pool = make_pool(server, min_sessions=2, max_sessions=4)
+        await pool.start()
+        assert_that(server.sessions).is_length(2)
+        tools = await pool.load_tools("fs")
+        results = [await tools[0].ainvoke({"text": f"t{i}"}) for i in range(5)]
+        stats = pool.stats()
+        await pool.close()
+        return results, stats
+
+    results, stats = asyncio.run(run())
+    assert_that(results[0]).starts_with("t0 from")
+    assert_that(server.sessions).is_length(2)
+    assert_that(stats).is_equal_to({"fs": {"open": 2, "idle": 2}})
+    assert_that([s.closed for s in server.sessions]).is_equal_to([True, True])
+
+
+def test_concurrency_is_capped_at_max_sessions():
+    server = FakeServer()
+
+    async def run():
+        pool = make_pool(server, min_sessions=1, max_sessions=3)
+        await pool.start()
+        proxy = pool.proxy("fs")
+        await asyncio.gather(*(proxy.call_tool("echo", {"text": str(i)}) for i in range(12)))
+        await pool.close()
+
+    asyncio.run(run())
+    assert_that(server.sessions).is_length(3)
+    assert_that(sum(s.calls for s in server.sessions)).is_equal_to(12)
+
+
+def test_call_on_dead_session_is_retried_on_a_fresh_one():
+    server = FakeServer()
+
+    async def run():
+        pool = make_pool(server, min_sessions=1, max_sessions=1)
+        await pool.start()
+        server.sessions[0].dead = True
+        result = await pool.proxy("fs").call_tool("echo", {"text": "hi"})
+        await pool.close()
+        return result, pool.replaced
+
+    result, replaced = asyncio.run(run())
+    assert_that(result.content[0].text).is_equal_to("hi from 1")
+    assert_that(replaced).is_equal_to(1)
+    assert_that(server.sessions[0].closed).is_true()
+
+
+def test_cancelled_call_returns_its_session():
+    server = FakeServer()
+
+    async def run():
+        pool = make_pool(server, min_sessions=1, max_sessions=1)
+        await pool.start()
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(pool.proxy("fs").call_tool("echo", {"text": "slow"}), 0.001)
+        result = await pool.proxy("fs").call_tool("echo", {"text": "next"})
+        await pool.close()
+        return result
+
+    result = asyncio.run(asyncio.wait_for(run(), 5))
+    assert_that(result.content[0].text).is_equal_to("next from 0")
+
+
+def test_health_check_replaces_dead_idle_sessions():
+    server = FakeServer()
+
+    async def run():
+        pool = make_pool(server, min_sessions=2, max_sessions=2)
+        await pool.start()
+        server.sessions[1].dead = True
+        await pool.check_health()
+        stats = pool.stats()
+        await pool.close()
+        return stats
+
+    stats = asyncio.run(run())
+    assert_that(server.sessions).is_length(3)
+    assert_that(stats["fs"]["open"]).is_equal_to(2)
+    assert_that(server.sessions[1].closed).is_true()
+
+
+def test_closed_pool_rejects_calls_and_bad_sizes_are_rejected():
+    server = FakeServer()
+
+    async def run():
+        with pytest.raises(ValueError):
+            make_pool(server, min_sessions=3, max_sessions=2)
+        pool = make_pool(server)
+        await pool.start()
+        await pool.close()
+        with pytest.raises(RuntimeError):
+            await pool.proxy("fs").call_tool("echo", {"text": "x"})
+
+    asyncio.run(run())
+
+
+def test_real_stdio_server_session_is_reused(tmp_path):
+    script = tmp_path / "server.py"
+    script.write_text(textwrap.dedent("""
+        import os
+        from mcp.server.fastmcp import FastMCP
+
+        server = FastMCP("pid")
+
+        @server.tool()
+        def pid() -> str:
+            \"\"\"Return the server process id.\"\"\"
+            return str(os.getpid())
+
+        server.run()
+    """))
+
+    async def run():
+        pool = MCPSessionPool({"pid": {"command": sys.executable, "args": [str(script)], "transport": "stdio"}}, health_check_interval_s=None)
+        await pool.start()
+        tools = await pool.load_tools("pid")
+        pids = [await tools[0].ainvoke({}) for _ in range(3)]
+        await pool.check_health()
+        await pool.close()
+        return pids, pool.created
+
+    pids, created = asyncio.run(asyncio.wait_for(run(), 60))
+    assert_that(set(pids)).is_length(1)
+    assert_that(created).is_equal_to(1)
+
+
+@pytest.fixture
+def agent_pool(monkeypatch):
+    import functools
+
+    from deep_research_from_scratch import research_agent_mcp
+    from deep_research_from_scratch.mcp_catalog import ToolCatalog
+
+    async def no_tools(server):
+        return []
+
+    server = FakeServer()
+    monkeypatch.setattr(research_agent_mcp, "MCPSessionPool", functools.partial(MCPSessionPool, session_factory=server))
+    monkeypatch.setattr(research_agent_mcp, "mcp_config", {"fs": {"transport": "stdio"}})
+    monkeypatch.setattr(research_agent_mcp, "_catalog", ToolCatalog(["fs"], no_tools))
+    monkeypatch.setattr(research_agent_mcp, "_pool", None)
+    return research_agent_mcp, server
+
+
+def test_pool_of_another_event_loop_is_closed_when_replaced(agent_pool):
+    import threading
+    import time
+
+    research_agent_mcp, server = agent_pool
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        first = asyncio.run_coroutine_threadsafe(research_agent_mcp.get_session_pool(), loop).result(timeout=5)
+
+        async def replace():
+            second = await research_agent_mcp.get_session_pool()
+            await research_agent_mcp.close_session_pool()
+            return second
+
+        second = asyncio.run(replace())
+        deadline = time.monotonic() + 5
+        while not server.sessions[0].closed and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    assert_that(second).is_not_same_as(first)
+    assert_that([s.closed for s in server.sessions]).is_equal_to([True, True])
+
+
+def test_pool_stays_warm_across_runs_until_shut_down(agent_pool, monkeypatch):
+    research_agent_mcp, server = agent_pool
+    state = {"researcher_messages": [], "compressed_research": "", "raw_notes": []}
+
+    class Compressor:
+        async def ainvoke(self, messages):
+            return SimpleNamespace(content="compressed")
+
+    monkeypatch.setattr(research_agent_mcp, "compress_model", Compressor())
+
+    async def run():
+        first = await research_agent_mcp.get_session_pool()
+        # One researcher finishing must not close sessions other researchers (or later runs) use
+        await research_agent_mcp.compress_research(state)
+        second = await research_agent_mcp.get_session_pool()
+        warm = [s.closed for s in server.sessions]
+        await research_agent_mcp.close_session_pool()
+        return first, second, warm
+
+    first, second, warm = asyncio.run(run())
+    assert_that(second).is_same_as(first)
+    assert_that(warm).is_equal_to([False])
+    assert_that(research_agent_mcp._pool).is_none()
+    assert_that(server.sessions[0].closed).is_true()
@@ -0,0 +1,173 @@
+import asyncio
+
+from assertpy import assert_that
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.tools import tool
+from mcp.types import ServerNotification, ToolListChangedNotification
+
+from deep_research_from_scratch import research_agent_mcp
+from deep_research_from_scratch.mcp_catalog import ToolCatalog, with_message_handler
+from research_agent_framework.config import get_settings
+
+
+@tool
+def read_file(path: str) -> str:
+    """Read a file."""
+    return f"contents of {path}"
+
+
+@tool
+def list_directory(path: str) -> str:
+    """List a directory."""
+    return "a.md"
+
+
+class Loader:
+    def __init__(self, tools):
+        self.tools = tools
+        self.calls = []
+
+    async def __call__(self, server):
+        self.calls.append(server)
+        return self.tools
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class BindingModel:
+    def __init__(self, responses=()):
+        self.binds = 0
+        self.responses = list(responses)
+
+    def bind_tools(self, tools):
+        self.binds += 1
+        self.bound_names = [t.name for t in tools]
+        return self
+
+    async def ainvoke(self, messages):
+        return self.responses.pop(0)
+
+
+def test_tools_load_once_and_are_tagged_with_their_server():
+    loader = Loader([read_file])
+    catalog = ToolCatalog(["filesystem"], loader, extra_tools=[list_directory])
+
+    async def run():
+        for _ in range(5):
+            tools = await catalog.tools()
+        return tools
+
+    tools = asyncio.run(run())
+    assert_that([t.name for t in tools]).is_equal_to(["read_file", "list_directory"])
+    assert_that(loader.calls).is_equal_to(["filesystem"])
+    assert_that(catalog.hits).is_equal_to(4)
+    assert_that(catalog.server_of("read_file")).is_equal_to("filesystem")
+    assert_that(catalog.server_of("list_directory")).is_none()
+
+
+def test_concurrent_callers_share_one_load():
+    loader = Loader([read_file])
+    catalog = ToolCatalog(["filesystem"], loader)
+
+    async def run():
+        await asyncio.gather(*(catalog.tools() for _ in range(10)))
+
+    asyncio.run(run())
+    assert_that(loader.calls).is_length(1)
+
+
+def test_catalog_is_usable_from_successive_event_loops():
+    class SlowLoader(Loader):
+        async def __call__(self, server):
+            await asyncio.sleep(0.01)
+            return await super().__call__(server)
+
+    loader = SlowLoader([read_file])
+    catalog = ToolCatalog(["filesystem"], loader)
+
+    async def contended_reload():
+        catalog.invalidate()
+        await asyncio.gather(*(catalog.tools() for _ in range(5)))
+
+    # Each run contends on the reload lock in its own loop
+    asyncio.run(contended_reload())
+    asyncio.run(contended_reload())
+    assert_that(loader.calls).is_length(2)
+
+
+def test_ttl_expiry_reloads():
+    loader = Loader([read_file])
+    clock = Clock()
+    catalog = ToolCatalog(["filesystem"], loader, ttl_s=60, clock=clock)
+
+    asyncio.run(catalog.tools())
+    clock.now = 59
+    asyncio.run(catalog.tools())
+    assert_that(loader.calls).is_length(1)
+    clock.now = 61
+    asyncio.run(catalog.tools())
+    assert_that(loader.calls).is_length(2)
+
+
+def test_tool_list_changed_notification_invalidates_and_rebinds():
+    loader = Loader([read_file])
+    catalog = ToolCatalog(["filesystem"], loader)
+    model = BindingModel()
+
+    async def run():
+        await catalog.bound_model(model)
+        await catalog.bound_model(model)
+        assert_that(model.binds).is_equal_to(1)
+        # Unrelated messages keep the cache
+        await catalog.handle_message(RuntimeError("transport hiccup"))
+        await catalog.bound_model(model)
+        assert_that(model.binds).is_equal_to(1)
+        loader.tools = [read_file, list_directory]
+        await catalog.handle_message(ServerNotification(ToolListChangedNotification(method="notifications/tools/list_changed")))
+        await catalog.bound_model(model)
+
+    asyncio.run(run())
+    assert_that(loader.calls).is_length(2)
+    assert_that(model.binds).is_equal_to(2)
+    assert_that(model.bound_names).is_equal_to(["read_file", "list_directory"])
+
+
+def test_with_message_handler_keeps_connection_settings():
+    async def handler(message):
+        pass
+
+    config = {"fs": {"command": "npx", "args": ["x"], "transport": "stdio", "session_kwargs": {"read_timeout_seconds": None}}}
+    updated = with_message_handler(config, handler)
+    assert_that(updated["fs"]["session_kwargs"]).is_equal_to({"read_timeout_seconds": None, "message_handler": handler})
+    assert_that(config["fs"]["session_kwargs"]).does_not_contain_key("message_handler")
+
+
+def test_mcp_agent_lists_and_binds_tools_once_per_run(monkeypatch):
+    loader = Loader([read_file])
+    catalog = ToolCatalog(["filesystem"], loader, extra_tools=[research_agent_mcp.think_tool])
+    model = BindingModel([
+        AIMessage(content="", tool_calls=[{"name": "read_file", "args": {"path": "a.md"}, "id": "c1"}]),
+        AIMessage(content="", tool_calls=[{"name": "read_file", "args": {"path": "b.md"}, "id": "c2"}]),
+        AIMessage(content="done"),
+    ])
+
+    class Compressor:
+        async def ainvoke(self, messages):
+            return AIMessage(content="compressed")
+
+    monkeypatch.setattr(get_settings(), "mcp_session_pool_enabled", False)
+    monkeypatch.setattr(research_agent_mcp, "_catalog", catalog)
+    monkeypatch.setattr(research_agent_mcp, "model", model)
+    monkeypatch.setattr(research_agent_mcp, "compress_model", Compressor())
+
+    result = asyncio.run(research_agent_mcp.agent_mcp.ainvoke({"researcher_messages": [HumanMessage(content="docs")]}))
+
+    assert_that(result["compressed_research"]).is_equal_to("compressed")
+    assert_that(loader.calls).is_length(1)
+    assert_that(model.binds).is_equal_to(1)
@@ -0,0 +1,183 @@
+import asyncio
+
+import pytest
+from assertpy import assert_that
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from deep_research_from_scratch import model_router, research_agent
+from deep_research_from_scratch.model_router import (
+    RoutingContext,
+    last_turn_think_only,
+    merge_tier_usage,
+    select_tier,
+)
+from research_agent_framework.config import get_settings
+
+
+class ScriptedModel:
+    def __init__(self, name, responses):
+        self.name = name
+        self.responses = list(responses)
+        self.calls = 0
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        response = self.responses.pop(0)
+        response.usage_metadata = {"input_tokens": 100, "output_tokens": 10, "total_tokens": 110}
+        return response
+
+
+def test_first_matching_rule_wins():
+    rules = [
+        {"node": "llm_call", "after_think_only": True, "tier": "small"},
+        {"node": ["llm_call", "compact_history"], "max_prompt_tokens": 1000, "tier": "small"},
+        {"node": "compress_research", "min_prompt_tokens": 50_000, "tier": "large"},
+    ]
+    assert_that(select_tier(RoutingContext("llm_call", 5000, after_think_only=True), rules)).is_equal_to("small")
+    assert_that(select_tier(RoutingContext("compact_history", 800), rules)).is_equal_to("small")
+    assert_that(select_tier(RoutingContext("llm_call", 5000), rules)).is_equal_to("default")
+    assert_that(select_tier(RoutingContext("compress_research", 60_000), rules)).is_equal_to("large")
+    assert_that(select_tier(RoutingContext("compress_research", 10_000), rules)).is_equal_to("default")
+
+
+def test_invalid_rule_is_rejected():
+    with pytest.raises(ValueError):
+        select_tier(RoutingContext("llm_call", 10), [{"nodes": "llm_call", "tier": "small"}])
+    with pytest.raises(ValueError):
+        select_tier(RoutingContext("llm_call", 10), [{"node": "llm_call"}])
+
+
+def test_think_only_detection():
+    think = AIMessage(content="", tool_calls=[{"name": "think_tool", "args": {"reflection": "x"}, "id": "t1"}])
+    search = AIMessage(content="", tool_calls=[
+        {"name": "think_tool", "args": {"reflection": "x"}, "id": "t1"},
+        {"name": "tavily_search", "args": {"query": "q"}, "id": "s1"},
+    ])
+    result = ToolMessage(content="ok", tool_call_id="t1")
+    assert_that(last_turn_think_only([HumanMessage(content="q"), think, result])).is_true()
+    assert_that(last_turn_think_only([HumanMessage(content="q"), search, result])).is_false()
+    assert_that(last_turn_think_only([HumanMessage(content="q")])).is_false()
+
+
+def test_researcher_routes_post_reflection_turn_and_records_tiers(monkeypatch):
+    think = AIMessage(content="", tool_calls=[{"name": "think_tool", "args": {"reflection": "enough"}, "id": "t1"}])
+    default_model = ScriptedModel("default", [think])
+    small_model = ScriptedModel("small", [AIMessage(content="done")])
+    compress = ScriptedModel("compress", [AIMessage(content="compressed")])
+    monkeypatch.setattr(research_agent, "model_with_tools", default_model)
+    monkeypatch.setattr(research_agent, "compress_model", compress)
+    monkeypatch.setattr(model_router, "tier_model", lambda tier, tools=None: {"small": small_model}[tier])
+    monkeypatch.setattr(get_settings(), "model_routing_enabled", True)
+    monkeypatch.setattr(get_settings(), "model_routing_rules", [
+        {"node": "llm_call", "after_think_only": True, "tier": "small"},
+    ])
+
+    result = asyncio.run(research_agent.researcher_agent.ainvoke(
+        {"researcher_messages": [HumanMessage(content="topic")]}
+    ))
+
+    assert_that(result["compressed_research"]).is_equal_to("compressed")
+    assert_that([default_model.calls, small_model.calls, compress.calls]).is_equal_to([1, 1, 1])
+    usage = result["model_tier_usage"]
+    assert_that(usage["default"]["calls"]).is_equal_to(2)
+    assert_that(usage["small"]).contains_entry({"calls": 1}, {"input_tokens": 100}, {"output_tokens": 10})
+    assert_that(usage["small"]["elapsed_s"]).is_greater_than_or_equal_to(0.0)
+
+
+def test_routing_disabled_keeps_node_models(monkeypatch):
+    monkeypatch.setattr(get_settings(), "model_routing_rules", [{"tier": "small"}])
+    default_model = object()
+    tier, model = model_router.route_model("llm_call", [HumanMessage(content="q")], default_model)
+    assert_that(tier).is_equal_to("default")
+    assert_that(model).is_same_as(default_model)
+
+
+def test_merge_tier_usage():
+    a = {"small": {"calls": 1, "input_tokens": 10, "output_tokens": 1, "elapsed_s": 0.5}}
+    b = {"small": {"calls": 2, "input_tokens": 20, "output_tokens": 2, "elapsed_s": 1.0},
+         "default": {"calls": 1, "input_tokens": 5, "output_tokens": 5, "elapsed_s": 2.0}}
+    merged = merge_tier_usage(a, b)
+    assert_that(merged["small"]).is_equal_to({"calls": 3, "input_tokens": 30, "output_tokens": 3, "elapsed_s": 1.5})
+    assert_that(merged["default"]["calls"]).is_equal_to(1)
+
+
+def test_tier_specs_carry_model_kwargs(monkeypatch):
+    import langchain.chat_models
+
+    created = []
+
+    class FakeModel:
+        def __init__(self, **kwargs):
+            created.append(kwargs)
+
+        def bind_tools(self, tools):
+            return self
+
+    monkeypatch.setattr(langchain.chat_models, "init_chat_model", lambda **kwargs: FakeModel(**kwargs))
+    monkeypatch.setattr(model_router, "_tier_models", {})
+    monkeypatch.setattr(get_settings(), "model_tiers", {
+        "small": "openai:gpt-4.1-mini",
+        "large": {"model": "anthropic:claude-sonnet-4-20250514", "max_tokens": 64000},
+        "broken": {"max_tokens": 10},
+    })
+
+    large = model_router.tier_model("large")
+    assert_that(model_router.tier_model("large")).is_same_as(large)
+    model_router.tier_model("small", tools=[research_agent.think_tool])
+    assert_that(created).is_equal_to([
+        {"model": "anthropic:claude-sonnet-4-20250514", "max_tokens": 64000},
+        {"model": "openai:gpt-4.1-mini"},
+    ])
+    for tier in ("broken", "missing"):
+        with pytest.raises(ValueError):
+            model_router.tier_model(tier)
+
+
+class SummaryModel:
+    def __init__(self, model_name):
+        self.model_name = model_name
+        self.calls = 0
+
+    def with_structured_output(self, schema):
+        return self
+
+    async def ainvoke(self, messages):
+        from deep_research_from_scratch.state_research import Summary
+
+        self.calls += 1
+        return Summary(summary=f"by {self.model_name}", key_excerpts="k")
+
+
+def test_webpage_summaries_are_routed_and_recorded_by_tool_node(monkeypatch):
+    from langchain_core.tools import tool
+
+    from deep_research_from_scratch import utils
+
+    default_model, small_model = SummaryModel("default-summarizer"), SummaryModel("small-summarizer")
+    monkeypatch.setattr(utils, "summarization_model", default_model)
+    monkeypatch.setattr(utils, "get_summary_cache", lambda: None)
+    monkeypatch.setattr(model_router, "tier_model", lambda tier, tools=None: {"small": small_model}[tier])
+    monkeypatch.setattr(get_settings(), "model_routing_enabled", True)
+    monkeypatch.setattr(get_settings(), "model_routing_rules", [
+        {"node": "summarize_webpage", "max_prompt_tokens": 2000, "tier": "small"},
+    ])
+
+    @tool
+    async def fetch_page(url: str) -> str:
+        """Fetch and summarize a page."""
+        return await utils.summarize_webpage_content_async("word " * (100 if url == "short" else 5000))
+
+    monkeypatch.setattr(research_agent, "tools_by_name", {"fetch_page": fetch_page})
+    calls = [{"name": "fetch_page", "args": {"url": url}, "id": f"c{i}"} for i, url in enumerate(["short", "short", "long"])]
+    state = {"researcher_messages": [AIMessage(content="", tool_calls=calls)], "model_tier_usage": {"default": {
+        "calls": 1, "input_tokens": 100, "output_tokens": 10, "elapsed_s": 1.0,
+    }}}
+
+    update = asyncio.run(research_agent.tool_node(state))
+
+    assert_that([m.content for m in update["researcher_messages"]][0]).contains("by small-summarizer")
+    assert_that(update["researcher_messages"][2].content).contains("by default-summarizer")
+    assert_that([small_model.calls, default_model.calls]).is_equal_to([2, 1])
+    usage = update["model_tier_usage"]
+    assert_that(usage["small"]["calls"]).is_equal_to(2)
+    assert_that(usage["default"]).contains_entry({"calls": 2}, {"input_tokens": 100})
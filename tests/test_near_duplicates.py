@@ -0,0 +1,124 @@
+import random
+import time
+
+import pytest
+from assertpy import assert_that
+
+from deep_research_from_scratch import utils
+from deep_research_from_scratch.fingerprint import (
+    DEFAULT_MAX_DISTANCE,
+    MAX_DISTANCE,
+    group_near_duplicates,
+    hamming_distance,
+    simhash,
+)
+
+WORDS = "coffee roast bean espresso latte mission soma district shop open price owner blend origin".split()
+
+
+def _article(seed, sentences=60):
+    rng = random.Random(seed)
+    return " ".join(
+        " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 16))).capitalize() + "."
+        for _ in range(sentences)
+    )
+
+
+ARTICLE = _article(1)
+OTHER = _article(2)
+SEEDS = range(1, 101)
+
+
+def _mirror(article):
+    return "Home | News | Sports\n" + article + "\nRead more on our AMP site."
+
+
+def _with_extra_sentence(article, seed):
+    rng = random.Random(seed)
+    sentences = article.split(". ")
+    extra = " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 16))).capitalize()
+    sentences.insert(rng.randint(0, len(sentences)), extra)
+    return ". ".join(sentences)
+
+
+MIRROR = _mirror(ARTICLE)
+
+
+def test_simhash_is_stable_and_close_for_mirrors():
+    fingerprint, count = simhash(ARTICLE)
+    assert_that(simhash(ARTICLE)).is_equal_to((fingerprint, count))
+    assert_that(count).is_equal_to(len(ARTICLE.split()) - 3)
+    assert_that(hamming_distance(fingerprint, simhash(MIRROR)[0])).is_less_than_or_equal_to(DEFAULT_MAX_DISTANCE)
+    assert_that(hamming_distance(fingerprint, simhash(OTHER)[0])).is_greater_than(DEFAULT_MAX_DISTANCE)
+
+
+def test_mirrors_and_small_edits_are_grouped_across_seeds():
+    for seed in SEEDS:
+        article = _article(seed)
+        groups = group_near_duplicates({
+            "https://a.example": article,
+            "https://amp.example": _mirror(article),
+            "https://b.example": _with_extra_sentence(article, seed + 1000),
+        })
+        assert_that(groups).described_as(f"seed {seed}").is_equal_to(
+            {"https://a.example": ["https://amp.example", "https://b.example"]}
+        )
+
+
+def test_unrelated_pages_are_not_grouped_across_seeds():
+    for seed in SEEDS:
+        groups = group_near_duplicates({"https://a.example": _article(seed), "https://b.example": _article(seed + 5000)})
+        assert_that(groups).described_as(f"seed {seed}").is_length(2)
+
+
+def test_grouping_keeps_first_as_representative():
+    groups = group_near_duplicates({
+        "https://news.example/story": ARTICLE,
+        "https://other.example/a": OTHER,
+        "https://amp.example/story": MIRROR,
+        "https://tiny.example": "Short.",
+        "https://tiny2.example": "Short.",
+    })
+    assert_that(groups).is_equal_to({
+        "https://news.example/story": ["https://amp.example/story"],
+        "https://other.example/a": [],
+        # Too few features to fingerprint reliably: never grouped
+        "https://tiny.example": [],
+        "https://tiny2.example": [],
+    })
+
+
+def test_invalid_distance():
+    with pytest.raises(ValueError):
+        group_near_duplicates({}, max_distance=MAX_DISTANCE + 1)
+    with pytest.raises(ValueError):
+        group_near_duplicates({}, max_distance=-1)
+
+
+def test_fingerprint_is_fast_for_typical_pages():
+    page = _article(3, sentences=120)  # roughly 10 KB
+    simhash(page)
+    start = time.perf_counter()
+    for _ in range(20):
+        simhash(page)
+    per_page_ms = (time.perf_counter() - start) / 20 * 1000
+    # Generous bound to stay robust on slow CI machines
+    assert_that(per_page_ms).is_less_than(10)
+
+
+def test_pipeline_summarizes_one_representative(monkeypatch):
+    summarized = []
+    monkeypatch.setattr(utils, "get_summary_cache", lambda: None)
+    monkeypatch.setattr(utils, "summarize_webpage_content", lambda content: summarized.append(content) or "summary")
+    unique_results = {
+        "https://news.example/story": {"title": "Story", "content": "c", "raw_content": ARTICLE},
+        "https://amp.example/story": {"title": "Story (AMP)", "content": "c", "raw_content": MIRROR},
+        "https://other.example/a": {"title": "Other", "content": "c", "raw_content": OTHER},
+    }
+    collapsed = utils.collapse_near_duplicates(unique_results)
+    assert_that(list(collapsed)).is_equal_to(["https://news.example/story", "https://other.example/a"])
+
+    output = utils.format_search_output(utils.process_search_results(collapsed))
+    assert_that(summarized).is_length(2)
+    assert_that(output).contains("URL: https://news.example/story\nALSO AT: https://amp.example/story\n")
+    assert_that(output).contains("--- SOURCE 2: Other ---")
@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+from assertpy import assert_that
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.tools import tool
+
+from deep_research_from_scratch import research_agent
+from deep_research_from_scratch.novelty import has_converged, parse_search_output, update_novelty
+from deep_research_from_scratch.utils import format_search_output
+from research_agent_framework.config import get_settings
+
+FACTS = {
+    "https://a.example/solar": "Solar capacity grew by a third last year. Panel prices fell again in most markets.",
+    "https://b.example/wind": "Offshore wind auctions were undersubscribed. Turbine makers reported rising costs.",
+}
+
+
+def output_for(urls, aliases=None):
+    return format_search_output({
+        url: {"title": url, "content": FACTS.get(url, f"Fresh reporting about {url} with several new findings."),
+              **({"aliases": aliases[url]} if aliases and url in aliases else {})}
+        for url in urls
+    })
+
+
+class Compressor:
+    async def ainvoke(self, messages):
+        return AIMessage(content="compressed")
+
+
+@pytest.fixture(autouse=True)
+def novelty_settings(monkeypatch):
+    monkeypatch.setattr(get_settings(), "novelty_stop_enabled", True)
+    monkeypatch.setattr(get_settings(), "novelty_threshold", 0.2)
+    monkeypatch.setattr(get_settings(), "novelty_patience", 2)
+
+
+def test_parse_search_output_reads_urls_aliases_and_summaries():
+    output = output_for(list(FACTS), aliases={"https://a.example/solar": ["https://amp.a.example/solar"]})
+    sources = parse_search_output(output)
+    assert_that([urls for urls, _ in sources]).is_equal_to([
+        ["https://a.example/solar", "https://amp.a.example/solar"],
+        ["https://b.example/wind"],
+    ])
+    assert_that(sources[1][1]).is_equal_to(FACTS["https://b.example/wind"])
+
+
+def test_repeated_results_score_zero_and_new_results_reset():
+    tracker = update_novelty(None, [output_for(list(FACTS))])
+    assert_that(tracker["scores"]).is_equal_to([1.0])
+
+    tracker = update_novelty(tracker, [output_for(list(FACTS))])
+    tracker = update_novelty(tracker, [output_for(["https://a.example/solar"])])
+    assert_that(tracker["scores"][1:]).is_equal_to([0.0, 0.0])
+    assert_that(tracker["low_rounds"]).is_equal_to(2)
+    assert_that(has_converged(tracker)).is_true()
+
+    tracker = update_novelty(tracker, [output_for(["https://c.example/grid"])])
+    assert_that(tracker["scores"][-1]).is_equal_to(1.0)
+    assert_that(tracker["low_rounds"]).is_equal_to(0)
+
+
+def test_same_content_under_new_url_is_partly_novel():
+    tracker = update_novelty(None, [output_for(["https://a.example/solar"])])
+    mirror = output_for(["https://a.example/solar"]).replace("https://a.example/solar", "https://mirror.example/solar")
+    tracker = update_novelty(tracker, [mirror])
+    # New URL, no new content
+    assert_that(tracker["scores"][-1]).is_equal_to(0.5)
+
+
+def test_researcher_stops_when_searches_converge(monkeypatch):
+    searches = []
+
+    @tool
+    async def tavily_search(query: str) -> str:
+        """Search the web."""
+        searches.append(query)
+        return output_for(list(FACTS))
+
+    class AlwaysSearching:
+        def __init__(self):
+            self.calls = 0
+
+        async def ainvoke(self, messages):
+            self.calls += 1
+            return AIMessage(content="", tool_calls=[
+                {"name": "tavily_search", "args": {"query": f"q{self.calls}"}, "id": f"call_{self.calls}"}
+            ])
+
+    model = AlwaysSearching()
+    monkeypatch.setattr(research_agent, "model_with_tools", model)
+    monkeypatch.setattr(research_agent, "compress_model", Compressor())
+    monkeypatch.setattr(research_agent, "tools_by_name", {"tavily_search": tavily_search})
+
+    result = asyncio.run(research_agent.researcher_agent.ainvoke(
+        {"researcher_messages": [HumanMessage(content="energy")]}
+    ))
+
+    # One novel round, then two repeats reach the patience of 2
+    assert_that(searches).is_length(3)
+    assert_that(model.calls).is_equal_to(3)
+    assert_that(result["compressed_research"]).is_equal_to("compressed")
+    assert_that(result["budget_report"]["stopped_by"]).is_equal_to("novelty")
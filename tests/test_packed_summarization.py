@@ -0,0 +1,158 @@
+import asyncio
+import re
+
+import pytest
+from assertpy import assert_that
+
+from deep_research_from_scratch import model_router, utils
+from deep_research_from_scratch.packing import pack_documents
+from deep_research_from_scratch.state_research import DocumentSummary, MultiDocumentSummary, Summary
+from deep_research_from_scratch.summary_cache import SummaryCache
+
+
+class FakeStructuredModel:
+    def __init__(self, owner, schema):
+        self.owner = owner
+        self.schema = schema
+
+    def _respond(self, messages):
+        prompt = messages[0].content
+        self.owner.requests.append(self.schema.__name__)
+        if self.schema is Summary:
+            return Summary(summary="single", key_excerpts="quote")
+        if "FAIL_PACK" in prompt:
+            raise RuntimeError("provider error")
+        ids = [int(i) for i in re.findall(r'<document id="(\d+)">', prompt)]
+        # The model "forgets" documents containing SKIP
+        documents = re.findall(r'<document id="\d+">\n(.*?)\n</document>', prompt, re.S)
+        return MultiDocumentSummary(summaries=[
+            DocumentSummary(document_id=i, summary=f"packed {doc.split()[0]}", key_excerpts="quote")
+            for i, doc in zip(ids, documents) if "SKIP" not in doc
+        ])
+
+    def invoke(self, messages):
+        return self._respond(messages)
+
+    async def ainvoke(self, messages):
+        await asyncio.sleep(0.01)
+        return self._respond(messages)
+
+
+class FakeSummarizationModel:
+    def __init__(self, model_name="fake-summarizer"):
+        self.model_name = model_name
+        self.requests = []
+
+    def with_structured_output(self, schema):
+        return FakeStructuredModel(self, schema)
+
+
+@pytest.fixture(autouse=True)
+def packing_settings(monkeypatch):
+    from research_agent_framework.config import get_settings
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "summary_packing_enabled", True)
+    monkeypatch.setattr(settings, "summary_pack_max_tokens", 300)
+    monkeypatch.setattr(settings, "summary_pack_max_documents", 3)
+    monkeypatch.setattr(settings, "summary_pack_max_document_tokens", 200)
+    monkeypatch.setattr(utils, "get_summary_cache", lambda: None)
+    model = FakeSummarizationModel()
+    monkeypatch.setattr(utils, "summarization_model", model)
+    return model
+
+
+def test_pack_documents_respects_budget_and_order():
+    plan = pack_documents(
+        {"a": 100, "b": 150, "huge": 500, "c": 100, "d": 120, "e": 40},
+        max_pack_tokens=300, max_documents=3, max_document_tokens=200,
+    )
+    assert_that(plan.packs).is_equal_to([["a", "b", "e"], ["c", "d"]])
+    assert_that(plan.singles).is_equal_to(["huge"])
+
+
+def test_lone_document_is_not_packed():
+    plan = pack_documents({"a": 10}, max_pack_tokens=300, max_documents=3, max_document_tokens=200)
+    assert_that(plan.packs).is_empty()
+    assert_that(plan.singles).is_equal_to(["a"])
+
+
+def test_packed_requests_and_report(packing_settings):
+    pages = {f"https://{i}.example": f"page{i} " + "word " * 40 for i in range(5)}
+    pages["https://big.example"] = "big " * 2000
+    summaries, report = utils.summarize_webpages_packed(pages)
+
+    assert_that(list(summaries)).is_equal_to(list(pages))
+    assert_that(summaries["https://0.example"]).contains("<summary>\npacked page0\n</summary>")
+    assert_that(summaries["https://4.example"]).contains("packed page4")
+    assert_that(summaries["https://big.example"]).contains("single")
+    assert_that(report.packed_requests).is_equal_to(2)
+    assert_that(report.single_requests).is_equal_to(1)
+    assert_that(report.unpacked_requests).is_equal_to(6)
+    assert_that(report.requests_saved).is_equal_to(3)
+    assert_that(report.as_dict()).contains_key("elapsed_s", "requests_saved")
+
+
+def test_failed_pack_and_skipped_documents_fall_back_per_page(packing_settings):
+    pages = {
+        "https://a.example": "FAIL_PACK alpha",
+        "https://b.example": "beta",
+        "https://c.example": "gamma",
+        "https://d.example": "delta SKIP",
+        "https://e.example": "epsilon",
+    }
+    summaries, report = asyncio.run(utils.summarize_webpages_packed_async(pages))
+
+    assert_that(summaries["https://a.example"]).contains("single")
+    assert_that(summaries["https://b.example"]).contains("single")
+    assert_that(summaries["https://d.example"]).contains("single")
+    assert_that(summaries["https://e.example"]).contains("packed epsilon")
+    assert_that(report.packed_requests).is_equal_to(2)
+    assert_that(report.single_requests).is_equal_to(4)
+
+
+def test_process_search_results_uses_packing(packing_settings):
+    results = {
+        "https://a.example": {"title": "A", "content": "snippet a", "raw_content": "alpha page"},
+        "https://b.example": {"title": "B", "content": "snippet b", "raw_content": None},
+        "https://c.example": {"title": "C", "content": "snippet c", "raw_content": "gamma page", "aliases": ["https://m.example"]},
+    }
+    processed = asyncio.run(utils.process_search_results_async(results))
+    assert_that(list(processed)).is_equal_to(list(results))
+    assert_that(processed["https://a.example"]["content"]).contains("packed alpha")
+    assert_that(processed["https://b.example"]["content"]).is_equal_to("snippet b")
+    assert_that(processed["https://c.example"]["aliases"]).is_equal_to(["https://m.example"])
+    assert_that(processed["https://a.example"]["timing"]).contains_key("wait_s", "summarize_s")
+    assert_that(packing_settings.requests).is_equal_to(["MultiDocumentSummary"])
+
+    sync_processed = utils.process_search_results(results)
+    assert_that(sync_processed["https://c.example"]["content"]).contains("packed gamma")
+
+
+def test_packed_requests_are_routed_and_cached_under_the_routed_model(monkeypatch, packing_settings):
+    from research_agent_framework.config import get_settings
+
+    small_model = FakeSummarizationModel("small-summarizer")
+    cache = SummaryCache()
+    monkeypatch.setattr(utils, "get_summary_cache", lambda: cache)
+    monkeypatch.setattr(model_router, "tier_model", lambda tier, tools=None: {"small": small_model}[tier])
+    monkeypatch.setattr(get_settings(), "model_routing_enabled", True)
+    monkeypatch.setattr(get_settings(), "model_routing_rules", [
+        {"node": "summarize_webpage", "max_prompt_tokens": 2000, "tier": "small"},
+    ])
+    pages = {f"https://{i}.example": f"page{i} " + "word " * 40 for i in range(3)}
+
+    with model_router.collect_tier_usage() as collector:
+        summaries, report = utils.summarize_webpages_packed(pages)
+
+    assert_that(small_model.requests).is_equal_to(["MultiDocumentSummary"])
+    assert_that(packing_settings.requests).is_empty()
+    assert_that(collector.usage["small"]["calls"]).is_equal_to(1)
+    key = utils._summary_cache_key(pages["https://0.example"], small_model)
+    assert_that(cache.get(key)).is_equal_to(summaries["https://0.example"])
+    assert_that(cache.get(utils._summary_cache_key(pages["https://0.example"], packing_settings))).is_none()
+
+    # Planning looks pages up under the routed model, so a second pass is served from the cache
+    _, second = asyncio.run(utils.summarize_webpages_packed_async(pages))
+    assert_that(second.cached).is_equal_to(3)
+    assert_that(small_model.requests).is_length(1)
@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+from assertpy import assert_that
+
+from deep_research_from_scratch import utils
+from deep_research_from_scratch.state_research import Summary
+
+
+class FakeStructuredModel:
+    def __init__(self, owner):
+        self.owner = owner
+
+    async def ainvoke(self, messages):
+        owner = self.owner
+        owner.in_flight += 1
+        owner.max_in_flight = max(owner.max_in_flight, owner.in_flight)
+        try:
+            await asyncio.sleep(owner.latency)
+            prompt = messages[0].content
+            if "BROKEN" in prompt:
+                raise RuntimeError("provider error")
+            return Summary(summary="short", key_excerpts="quote")
+        finally:
+            owner.in_flight -= 1
+
+
+class FakeSummarizationModel:
+    def __init__(self, latency=0.01):
+        self.latency = latency
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def with_structured_output(self, schema):
+        return FakeStructuredModel(self)
+
+
+@pytest.fixture(autouse=True)
+def no_summary_cache(monkeypatch):
+    monkeypatch.setattr(utils, "get_summary_cache", lambda: None)
+    monkeypatch.setattr(utils, "get_search_cache", lambda: None)
+
+
+def _results():
+    return {
+        "https://a.example": {"title": "A", "content": "snippet a", "raw_content": "page a"},
+        "https://b.example": {"title": "B", "content": "snippet b", "raw_content": "BROKEN " + "x" * 2000},
+        "https://c.example": {"title": "C", "content": "snippet c", "raw_content": None},
+        "https://d.example": {"title": "D", "content": "snippet d", "raw_content": "page d"},
+    }
+
+
+def test_concurrent_summaries_keep_order_and_cap(monkeypatch):
+    model = FakeSummarizationModel()
+    monkeypatch.setattr(utils, "summarization_model", model)
+    processed = asyncio.run(utils.process_search_results_async(_results(), max_concurrency=2))
+
+    assert_that(list(processed)).is_equal_to(list(_results()))
+    assert_that(model.max_in_flight, description="semaphore should bound summarization calls").is_equal_to(2)
+    assert_that(processed["https://a.example"]["content"]).contains("<summary>\nshort\n</summary>")
+    # No raw content: the search snippet is passed through untouched
+    assert_that(processed["https://c.example"]["content"]).is_equal_to("snippet c")
+
+
+def test_failed_page_uses_truncation_fallback(monkeypatch):
+    monkeypatch.setattr(utils, "summarization_model", FakeSummarizationModel())
+    processed = asyncio.run(utils.process_search_results_async(_results()))
+    content = processed["https://b.example"]["content"]
+    assert_that(content).starts_with("BROKEN ").ends_with("...")
+    assert_that(len(content)).is_equal_to(1003)
+    assert_that(processed["https://d.example"]["content"]).contains("<key_excerpts>")
+
+
+def test_timing_breakdown_per_url(monkeypatch):
+    monkeypatch.setattr(utils, "summarization_model", FakeSummarizationModel(latency=0.02))
+    processed = asyncio.run(utils.process_search_results_async(_results(), max_concurrency=1))
+    for entry in processed.values():
+        assert_that(entry["timing"]).contains_key("wait_s", "summarize_s")
+    assert_that(processed["https://a.example"]["timing"]["summarize_s"]).is_greater_than(0.0)
+    # With a single slot, later pages wait for earlier ones
+    assert_that(processed["https://d.example"]["timing"]["wait_s"]).is_greater_than(0.0)
+    assert_that(processed["https://c.example"]["timing"]["summarize_s"]).is_equal_to(0.0)
+
+
+def test_tavily_search_tool_ainvoke_uses_async_pipeline(monkeypatch):
+    from research_agent_framework.adapters.search.mock_tavily_client import MockAsyncTavilyClient
+
+    client = MockAsyncTavilyClient()
+    monkeypatch.setattr(utils, "async_tavily_client", client)
+    monkeypatch.setattr(utils, "summarization_model", FakeSummarizationModel())
+    output = asyncio.run(utils.tavily_search.ainvoke({"query": "coffee"}))
+    assert_that(client.calls).is_equal_to(["coffee"])
+    assert_that(output).contains("--- SOURCE 3:").contains("<summary>\nshort\n</summary>")
@@ -0,0 +1,120 @@
+import asyncio
+from typing import Any, List, Optional
+
+import pytest
+from assertpy import assert_that
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.tools import tool
+
+from deep_research_from_scratch import multi_agent_supervisor as sup
+from deep_research_from_scratch import research_agent
+from deep_research_from_scratch.chunking import count_tokens
+from deep_research_from_scratch.prompt_cache import cached_system_message, split_static_prefix
+from deep_research_from_scratch.prompts import research_agent_prompt
+from deep_research_from_scratch.utils import get_today_str
+
+
+class FakeCachingChatModel(BaseChatModel):
+    """Chat model emulating Anthropic prompt caching of `cache_control` blocks.
+
+    A marked block is a cache hit when the exact same text was marked before.
+    """
+
+    script: List[AIMessage] = []
+    seen_prefixes: set = set()
+    system_prompts: list = []
+
+    @property
+    def _llm_type(self) -> str:
+        return "anthropic-chat"
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        system = messages[0].content
+        self.system_prompts.append(system)
+        read = write = 0
+        for block in system if isinstance(system, list) else []:
+            if block.get("cache_control"):
+                tokens = count_tokens(block["text"])
+                if block["text"] in self.seen_prefixes:
+                    read += tokens
+                else:
+                    self.seen_prefixes.add(block["text"])
+                    write += tokens
+        reply = self.script.pop(0) if self.script else AIMessage(content="done")
+        reply = reply.model_copy(update={"usage_metadata": {
+            "input_tokens": 100 + read + write, "output_tokens": 5, "total_tokens": 105 + read + write,
+            "input_token_details": {"cache_read": read, "cache_creation": write},
+        }})
+        return ChatResult(generations=[ChatGeneration(message=reply)])
+
+
+@tool
+async def search(query: str) -> str:
+    """Search."""
+    return f"results for {query}"
+
+
+@pytest.fixture
+def caching_model(monkeypatch):
+    model = FakeCachingChatModel(
+        script=[
+            AIMessage(content="", tool_calls=[{"name": "search", "args": {"query": str(i)}, "id": f"call_{i}"}])
+            for i in range(2)
+        ],
+        seen_prefixes=set(),
+        system_prompts=[],
+    )
+    monkeypatch.setattr(research_agent, "model_with_tools", model)
+    monkeypatch.setattr(research_agent, "compress_model", FakeCachingChatModel(script=[AIMessage(content="compressed")], seen_prefixes=set(), system_prompts=[]))
+    monkeypatch.setattr(research_agent, "tools_by_name", {"search": search})
+    return model
+
+
+def test_split_static_prefix_moves_the_date_out():
+    static, date_template = split_static_prefix(research_agent_prompt)
+    assert_that(static).does_not_contain("{date}")
+    assert_that(static).starts_with("You are a research assistant conducting research on the user's input topic.\n")
+    assert_that(date_template).contains("{date}")
+
+
+def test_researcher_prefix_is_cached_across_turns(caching_model):
+    result = asyncio.run(research_agent.researcher_agent.ainvoke(
+        {"researcher_messages": [HumanMessage(content="topic")], "research_topic": "topic"}
+    ))
+
+    prompts = caching_model.system_prompts
+    assert_that(prompts).is_length(3)
+    static_blocks = [prompt[0] for prompt in prompts]
+    assert_that([block["text"] for block in static_blocks]).contains_only(static_blocks[0]["text"])
+    assert_that(static_blocks[0]).contains_entry({"cache_control": {"type": "ephemeral"}})
+    assert_that(static_blocks[0]["text"]).does_not_contain(get_today_str())
+    assert_that(prompts[0][1]["text"]).contains(get_today_str())
+
+    usage = result["prompt_cache_usage"]
+    prefix_tokens = count_tokens(static_blocks[0]["text"])
+    # Turn 1 writes the researcher prefix, turns 2-3 read it; compression writes its own prefix
+    assert_that(usage["cache_read_tokens"]).is_equal_to(2 * prefix_tokens)
+    assert_that(usage["cache_write_tokens"]).is_greater_than(prefix_tokens)
+
+
+def test_non_anthropic_models_get_static_prefix_first():
+    message = cached_system_message(research_agent_prompt, object(), dynamic="digest text")
+    assert_that(message.content).is_instance_of(str)
+    assert_that(message.content).starts_with(split_static_prefix(research_agent_prompt)[0])
+    assert_that(message.content).ends_with(f"today's date is {get_today_str()}.\n\ndigest text")
+
+
+def test_supervisor_reports_cache_usage(monkeypatch):
+    model = FakeCachingChatModel(script=[], seen_prefixes=set(), system_prompts=[])
+    monkeypatch.setattr(sup, "supervisor_model_with_tools", model)
+    state = {"supervisor_messages": [HumanMessage(content="brief")], "research_brief": "brief"}
+
+    first = asyncio.run(sup.supervisor(state))
+    second = asyncio.run(sup.supervisor({**state, **first.update}))
+
+    assert_that(model.system_prompts[0][0]["text"]).is_equal_to(model.system_prompts[1][0]["text"])
+    assert_that(model.system_prompts[0][0]["text"]).contains(f"at most {sup.max_concurrent_researchers} parallel agents")
+    usage = second.update["prompt_cache_usage"]
+    assert_that(usage["cache_write_tokens"]).is_equal_to(usage["cache_read_tokens"]).is_greater_than(0)
@@ -0,0 +1,52 @@
+from assertpy import assert_that
+
+from deep_research_from_scratch import utils
+from deep_research_from_scratch.relevance import bm25_scores, filter_relevant_passages, split_passages
+
+PAGE = "\n\n".join([
+    "Home | About | Careers | Contact",
+    "Sightglass Coffee roasts beans in a large SOMA roastery with viewing windows.",
+    "We use cookies to improve your experience.",
+    "Philz Coffee serves custom blended coffee in the Mission.",
+    "Subscribe to our newsletter for weekly deals.",
+])
+
+
+def test_bm25_prefers_matching_passages():
+    passages = split_passages(PAGE)
+    scores = bm25_scores("coffee roastery SOMA", passages)
+    assert_that(scores.index(max(scores))).is_equal_to(1)
+    assert_that(scores[0]).is_equal_to(0.0)
+    assert_that(scores[3]).is_greater_than(0.0)
+
+
+def test_filter_keeps_relevant_passages_in_page_order():
+    filtered = filter_relevant_passages(PAGE, "coffee roastery SOMA", max_chars=200)
+    assert_that(filtered).is_equal_to(
+        "Sightglass Coffee roasts beans in a large SOMA roastery with viewing windows.\n\n"
+        "Philz Coffee serves custom blended coffee in the Mission."
+    )
+
+
+def test_filter_respects_budget():
+    filtered = filter_relevant_passages(PAGE, "coffee roastery SOMA", max_chars=90)
+    assert_that(filtered).contains("Sightglass").does_not_contain("Philz")
+    assert_that(len(filtered)).is_less_than_or_equal_to(90)
+    assert_that(len(filter_relevant_passages(PAGE, "coffee", max_chars=20))).is_equal_to(20)
+
+
+def test_short_text_and_unmatched_query_fall_back_to_leading_passages():
+    assert_that(filter_relevant_passages("tiny", "anything", max_chars=100)).is_equal_to("tiny")
+    filtered = filter_relevant_passages(PAGE, "zebra", max_chars=80)
+    assert_that(filtered).starts_with("Home | About")
+
+
+def test_prefilter_honours_settings(monkeypatch):
+    from research_agent_framework.config import get_settings
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "relevance_filter_max_chars", 200)
+    assert_that(utils.prefilter_raw_content(PAGE, "coffee roastery SOMA")).does_not_contain("cookies")
+    assert_that(utils.prefilter_raw_content(PAGE, None)).is_equal_to(PAGE)
+    monkeypatch.setattr(settings, "relevance_filter_enabled", False)
+    assert_that(utils.prefilter_raw_content(PAGE, "coffee roastery SOMA")).is_equal_to(PAGE)
@@ -0,0 +1,100 @@
+import asyncio
+import time
+
+import pytest
+from assertpy import assert_that
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.tools import tool
+
+from deep_research_from_scratch import research_agent
+
+
+class ScriptedModel:
+    """Returns the scripted AI messages in turn from `ainvoke`."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def invoke(self, messages):
+        raise AssertionError("researcher nodes must not block on invoke")
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+@tool
+async def slow_search(query: str) -> str:
+    """Search slowly."""
+    await asyncio.sleep(0.2)
+    return f"results for {query}"
+
+
+@tool
+async def fast_search(query: str) -> str:
+    """Search quickly."""
+    await asyncio.sleep(0.01)
+    return f"quick results for {query}"
+
+
+@pytest.fixture
+def scripted(monkeypatch):
+    tool_calls = [
+        {"name": "slow_search", "args": {"query": "a"}, "id": "call_1"},
+        {"name": "fast_search", "args": {"query": "b"}, "id": "call_2"},
+        {"name": "slow_search", "args": {"query": "c"}, "id": "call_3"},
+    ]
+    model = ScriptedModel([AIMessage(content="", tool_calls=tool_calls), AIMessage(content="done")])
+    monkeypatch.setattr(research_agent, "model_with_tools", model)
+    monkeypatch.setattr(research_agent, "compress_model", ScriptedModel([AIMessage(content="compressed")]))
+    monkeypatch.setattr(research_agent, "tools_by_name", {"slow_search": slow_search, "fast_search": fast_search})
+    return model
+
+
+def test_tool_calls_run_concurrently_in_order(scripted):
+    start = time.perf_counter()
+    result = asyncio.run(research_agent.researcher_agent.ainvoke(
+        {"researcher_messages": [HumanMessage(content="topic")]}
+    ))
+    elapsed = time.perf_counter() - start
+
+    tool_messages = [m for m in result["researcher_messages"] if m.type == "tool"]
+    assert_that([m.tool_call_id for m in tool_messages]).is_equal_to(["call_1", "call_2", "call_3"])
+    assert_that([m.content for m in tool_messages]).is_equal_to(
+        ["results for a", "quick results for b", "results for c"]
+    )
+    # Two 0.2s calls in parallel, not in series
+    assert_that(elapsed).is_less_than(0.38)
+    assert_that(result["compressed_research"]).is_equal_to("compressed")
+    assert_that(scripted.calls).is_equal_to(2)
+
+
+def test_researchers_share_the_event_loop(scripted, monkeypatch):
+    # Two researchers gathered together overlap instead of serializing
+    def fresh_model():
+        tool_calls = [{"name": "slow_search", "args": {"query": "x"}, "id": "call_1"}]
+        return ScriptedModel([AIMessage(content="", tool_calls=tool_calls), AIMessage(content="done")])
+
+    class PerTaskModel:
+        def __init__(self):
+            self.models = {}
+
+        async def ainvoke(self, messages):
+            key = messages[1].content
+            model = self.models.setdefault(key, fresh_model())
+            return await model.ainvoke(messages)
+
+    monkeypatch.setattr(research_agent, "model_with_tools", PerTaskModel())
+    monkeypatch.setattr(research_agent, "compress_model", ScriptedModel([AIMessage(content="c1"), AIMessage(content="c2")]))
+
+    async def run_two():
+        return await asyncio.gather(*(
+            research_agent.researcher_agent.ainvoke({"researcher_messages": [HumanMessage(content=topic)]})
+            for topic in ("one", "two")
+        ))
+
+    start = time.perf_counter()
+    results = asyncio.run(run_two())
+    assert_that(time.perf_counter() - start).is_less_than(0.38)
+    assert_that(sorted(r["compressed_research"] for r in results)).is_equal_to(["c1", "c2"])
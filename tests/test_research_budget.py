@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+from assertpy import assert_that
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.tools import tool
+
+from deep_research_from_scratch import research_agent
+from deep_research_from_scratch.budget import ResearchBudget
+
+
+@tool
+async def search(query: str) -> str:
+    """Search."""
+    return f"results for {query}"
+
+
+class EndlessToolCaller:
+    """Calls a tool on every turn, reporting fixed token usage."""
+
+    def __init__(self, input_tokens=100, output_tokens=10):
+        self.usage = {"input_tokens": input_tokens, "output_tokens": output_tokens, "total_tokens": input_tokens + output_tokens}
+        self.calls = 0
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        return AIMessage(
+            content="",
+            tool_calls=[{"name": "search", "args": {"query": str(self.calls)}, "id": f"call_{self.calls}"}],
+            usage_metadata=self.usage,
+        )
+
+
+class RecordingCompressModel:
+    def __init__(self):
+        self.messages = None
+
+    async def ainvoke(self, messages):
+        self.messages = messages
+        return AIMessage(content="compressed")
+
+
+@pytest.fixture
+def endless(monkeypatch):
+    model = EndlessToolCaller()
+    compress = RecordingCompressModel()
+    monkeypatch.setattr(research_agent, "model_with_tools", model)
+    monkeypatch.setattr(research_agent, "compress_model", compress)
+    monkeypatch.setattr(research_agent, "tools_by_name", {"search": search})
+    return model, compress
+
+
+def _run(budget=None):
+    config = {"configurable": {"research_budget": budget}} if budget is not None else None
+    return asyncio.run(research_agent.researcher_agent.ainvoke(
+        {"researcher_messages": [HumanMessage(content="topic")], "tool_call_iterations": 0},
+        config=config,
+    ))
+
+
+def test_iteration_limit_routes_to_compression(endless):
+    model, compress = endless
+    result = _run({"max_tool_call_iterations": 3})
+
+    assert_that(model.calls).is_equal_to(4)
+    report = result["budget_report"]
+    assert_that(report["stopped_by"]).is_equal_to("tool_call_iterations")
+    assert_that(report["usage"]["tool_call_iterations"]).is_equal_to(3)
+    assert_that(report["limits"]["max_tool_call_iterations"]).is_equal_to(3)
+    # The unanswered tool calls of the last turn are not sent for compression
+    assert_that(getattr(compress.messages[-2], "tool_calls", [])).is_empty()
+
+
+def test_token_limits(endless):
+    model, _ = endless
+    result = _run({"max_input_tokens": 250, "max_tool_call_iterations": None})
+    assert_that(model.calls).is_equal_to(3)
+    assert_that(result["budget_report"]["stopped_by"]).is_equal_to("input_tokens")
+    assert_that(result["budget_report"]["usage"]["input_tokens"]).is_equal_to(300)
+
+    result = _run({"max_output_tokens": 10, "max_tool_call_iterations": None})
+    assert_that(result["budget_report"]["stopped_by"]).is_equal_to("output_tokens")
+
+
+def test_elapsed_time_limit(endless):
+    result = _run({"max_elapsed_s": 0, "max_tool_call_iterations": None})
+    assert_that(result["budget_report"]["stopped_by"]).is_equal_to("elapsed_s")
+
+
+def test_settings_default_and_validation(endless, monkeypatch):
+    from research_agent_framework.config import get_settings
+
+    monkeypatch.setattr(get_settings(), "researcher_max_tool_call_iterations", 2)
+    assert_that(ResearchBudget.from_config(None).max_tool_call_iterations).is_equal_to(2)
+    assert_that(_run()["budget_report"]["usage"]["tool_call_iterations"]).is_equal_to(2)
+
+    with pytest.raises(ValueError):
+        ResearchBudget.from_config({"configurable": {"research_budget": {"max_tools": 1}}})
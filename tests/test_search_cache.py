@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+from assertpy import assert_that
+
+from deep_research_from_scratch import utils
+from deep_research_from_scratch.search_cache import SearchResultCache, normalize_query
+from deep_research_from_scratch.url_registry import UrlRegistry, use_url_registry
+from research_agent_framework.adapters.search.mock_tavily_client import MockAsyncTavilyClient, MockTavilyClient
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_normalize_query():
+    assert_that(normalize_query("  Best Coffee,  SF? ")).is_equal_to("best coffee sf")
+
+
+def test_ttl_is_per_topic():
+    clock = FakeClock()
+    cache = SearchResultCache(clock=clock)
+    cache.put("q", 3, "news", True, {}, "news out")
+    cache.put("q", 3, "general", True, {}, "general out")
+    clock.now += 60 * 60  # an hour later: news is stale, general is not
+    assert_that(cache.get("q", 3, "news", True)).is_none()
+    assert_that(cache.get("q", 3, "general", True).formatted_output).is_equal_to("general out")
+    assert_that(cache.stats.as_dict()).contains_entry({"hits": 1}, {"misses": 1}, {"expired": 1}, {"hit_rate": 0.5})
+
+
+def test_key_includes_parameters():
+    cache = SearchResultCache()
+    cache.put("Coffee SF", 3, "general", True, {}, "out")
+    assert_that(cache.get("coffee sf!", 3, "general", True)).is_not_none()
+    assert_that(cache.get("coffee sf", 5, "general", True)).is_none()
+    assert_that(cache.get("coffee sf", 3, "general", False)).is_none()
+
+
+def test_entries_persist_across_instances(tmp_path):
+    path = tmp_path / "search.sqlite"
+    SearchResultCache(path=path).put("q", 3, "general", True, {"https://a": {"title": "A"}}, "out")
+    entry = SearchResultCache(path=path).get("q", 3, "general", True)
+    assert_that(entry.unique_results).is_equal_to({"https://a": {"title": "A"}})
+    assert_that(entry.formatted_output).is_equal_to("out")
+
+
+@pytest.fixture
+def search_cache(monkeypatch):
+    cache = SearchResultCache()
+    monkeypatch.setattr(utils, "_search_cache", cache)
+    monkeypatch.setattr(utils, "get_summary_cache", lambda: None)
+    monkeypatch.setattr(utils, "summarize_webpage_content", lambda content: "summary")
+    return cache
+
+
+def test_tool_reuses_cached_output(monkeypatch, search_cache):
+    client = MockTavilyClient()
+    monkeypatch.setattr(utils, "tavily_client", client)
+    first = utils.tavily_search.invoke({"query": "Coffee in SF"})
+    second = utils.tavily_search.invoke({"query": "coffee in sf"})
+    assert_that(second).is_equal_to(first)
+    assert_that(client.calls).is_length(1)
+    assert_that(search_cache.stats.hits).is_equal_to(1)
+
+
+def test_failed_searches_are_not_cached(monkeypatch, search_cache):
+    client = MockAsyncTavilyClient(fail_on=["flaky"])
+    monkeypatch.setattr(utils, "async_tavily_client", client)
+    asyncio.run(utils.tavily_search.ainvoke({"query": "flaky"}))
+    asyncio.run(utils.tavily_search.ainvoke({"query": "flaky"}))
+    assert_that(client.calls).is_length(2)
+    assert_that(search_cache.stats.writes).is_equal_to(0)
+
+
+def _failing_summarizer(monkeypatch):
+    def fail(content):
+        return utils._summary_fallback(content, RuntimeError("summarizer down"))
+
+    async def afail(content):
+        return fail(content)
+
+    monkeypatch.setattr(utils, "summarize_webpage_content", fail)
+    monkeypatch.setattr(utils, "summarize_webpage_content_async", afail)
+
+
+def test_outcomes_with_summary_fallbacks_are_not_cached(monkeypatch, search_cache):
+    _failing_summarizer(monkeypatch)
+    monkeypatch.setattr(utils, "tavily_client", MockTavilyClient())
+    monkeypatch.setattr(utils, "async_tavily_client", MockAsyncTavilyClient())
+    utils.tavily_search.invoke({"query": "coffee in sf"})
+    asyncio.run(utils.tavily_search.ainvoke({"query": "coffee in sf"}))
+    assert_that(search_cache.stats.writes).is_equal_to(0)
+
+
+def test_fallbacks_reused_through_the_url_registry_are_not_cached(monkeypatch, search_cache):
+    _failing_summarizer(monkeypatch)
+    monkeypatch.setattr(utils, "tavily_client", MockTavilyClient())
+    with use_url_registry(UrlRegistry()) as registry:
+        utils.tavily_search.invoke({"query": "coffee in sf"})
+        # Another researcher (with a cold search cache) reuses the fallbacks from the registry
+        monkeypatch.setattr(utils, "_search_cache", SearchResultCache())
+        utils.tavily_search.invoke({"query": "coffee in sf"})
+    assert_that(registry.stats.reused).is_greater_than(0)
+    assert_that(utils._search_cache.stats.writes).is_equal_to(0)
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+from assertpy import assert_that
+
+from deep_research_from_scratch import utils
+from deep_research_from_scratch.state_research import Summary
+
+
+def _summarized(count, size=400):
+    return {
+        f"https://{i}.example": {"title": f"T{i}", "content": f"summary {i} " + "x" * size}
+        for i in range(1, count + 1)
+    }
+
+
+def test_unbudgeted_output_keeps_layout():
+    output = utils.format_search_output(_summarized(2, size=10), max_tokens=10**6)
+    assert_that(output).starts_with("Search results: \n\n\n\n--- SOURCE 1: T1 ---\nURL: https://1.example\n\nSUMMARY:\nsummary 1 ")
+    assert_that(output).ends_with("-" * 80 + "\n")
+    assert_that(output).does_not_contain("omitted")
+
+
+def test_lowest_ranked_sources_trimmed_first():
+    output = utils.format_search_output(_summarized(5), max_chars=1400)
+    assert_that(len(output)).is_less_than_or_equal_to(1400)
+    assert_that(output).contains("SOURCE 1: T1", "SOURCE 2: T2")
+    assert_that(output).does_not_contain("SOURCE 4", "SOURCE 5")
+    assert_that(output).contains("lower-ranked source(s) omitted")
+
+
+def test_token_budget_and_truncated_top_source():
+    output = utils.format_search_output(_summarized(3, size=20000), max_tokens=500)
+    assert_that(utils.count_tokens(output)).is_less_than_or_equal_to(500)
+    assert_that(output).contains("SOURCE 1: T1", "[truncated to fit the output budget]", "[2 lower-ranked")
+
+
+def test_settings_budget_is_default(monkeypatch):
+    from research_agent_framework.config import get_settings
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "search_output_max_tokens", None)
+    monkeypatch.setattr(settings, "search_output_max_chars", 600)
+    assert_that(len(utils.format_search_output(_summarized(4)))).is_less_than_or_equal_to(600)
+
+
+class SlowFirstModel:
+    """Summarizes the first page slowly so later sources are ready first."""
+
+    def with_structured_output(self, schema):
+        return self
+
+    async def ainvoke(self, messages):
+        await asyncio.sleep(0.05 if "page 1" in messages[0].content else 0.0)
+        return Summary(summary="s", key_excerpts="q")
+
+
+@pytest.fixture
+def slow_first(monkeypatch):
+    monkeypatch.setattr(utils, "get_summary_cache", lambda: None)
+    monkeypatch.setattr(utils, "summarization_model", SlowFirstModel())
+
+
+def _unique(count):
+    return {
+        f"https://{i}.example": {"title": f"T{i}", "content": "snippet", "raw_content": f"page {i}"}
+        for i in range(1, count + 1)
+    }
+
+
+def test_stream_yields_sources_as_ready(slow_first):
+    async def collect():
+        return [chunk async for chunk in utils.stream_search_output(_unique(3), max_tokens=10**6)]
+
+    chunks = asyncio.run(collect())
+    assert_that(chunks[0]).is_equal_to(utils.SEARCH_OUTPUT_HEADER)
+    assert_that(chunks).is_length(4)
+    # The slow top-ranked source arrives last but keeps its rank number
+    assert_that(chunks[-1]).contains("--- SOURCE 1: T1 ---")
+
+
+def test_stream_enforces_budget(slow_first):
+    async def collect():
+        return "".join([chunk async for chunk in utils.stream_search_output(_unique(6), max_chars=700)])
+
+    output = asyncio.run(collect())
+    assert_that(len(output)).is_less_than_or_equal_to(700)
+    assert_that(output).contains("source(s) omitted to fit the output budget").does_not_contain("lower-ranked")
@@ -0,0 +1,213 @@
+import asyncio
+import json
+import time
+
+import pytest
+from assertpy import assert_that
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage
+from langchain_core.tools import tool
+
+from deep_research_from_scratch import research_agent, speculative
+from research_agent_framework.config import get_settings
+
+started = {}
+
+
+@tool
+async def slow_search(query: str) -> str:
+    """Search slowly."""
+    started[query] = time.perf_counter()
+    await asyncio.sleep(0.2)
+    return f"results for {query}"
+
+
+def tool_call_chunks(call_id, index, query, pieces=3):
+    args = json.dumps({"query": query})
+    step = len(args) // pieces + 1
+    parts = [args[i:i + step] for i in range(0, len(args), step)]
+    chunks = [AIMessageChunk(content="", tool_call_chunks=[
+        {"name": "slow_search", "args": parts[0], "id": call_id, "index": index}
+    ])]
+    chunks += [AIMessageChunk(content="", tool_call_chunks=[
+        {"name": None, "args": part, "id": None, "index": index}
+    ]) for part in parts[1:]]
+    return chunks
+
+
+class StreamingModel:
+    """Streams two tool calls, then keeps generating text for a while."""
+
+    def __init__(self, delay=0.02, tail_chunks=10):
+        self.delay = delay
+        self.tail_chunks = tail_chunks
+        self.stream_ended = None
+
+    async def ainvoke(self, messages):
+        raise AssertionError("streaming mode must not call ainvoke")
+
+    async def astream(self, messages):
+        chunks = tool_call_chunks("call_1", 0, "a") + tool_call_chunks("call_2", 1, "b")
+        chunks += [AIMessageChunk(content=" thinking") for _ in range(self.tail_chunks)]
+        for chunk in chunks:
+            await asyncio.sleep(self.delay)
+            yield chunk
+        self.stream_ended = time.perf_counter()
+
+
+@pytest.fixture(autouse=True)
+def speculation(monkeypatch):
+    monkeypatch.setattr(get_settings(), "speculative_tool_execution_enabled", True)
+    monkeypatch.setattr(research_agent, "tools_by_name", {"slow_search": slow_search})
+    started.clear()
+    yield
+    speculative._pending.clear()
+
+
+def test_tool_calls_start_before_the_stream_ends():
+    model = StreamingModel()
+
+    async def run():
+        response = await speculative.astream_with_speculation(model, [HumanMessage(content="q")], research_agent.tools_by_name)
+        state = {"researcher_messages": [response], "tool_call_iterations": 0}
+        return response, await research_agent.tool_node(state)
+
+    response, update = asyncio.run(run())
+
+    assert_that(started["a"]).is_less_than(model.stream_ended)
+    assert_that(started["b"]).is_less_than(model.stream_ended)
+    assert_that(isinstance(response, AIMessage)).is_true()
+    assert_that([tc["args"] for tc in response.tool_calls]).is_equal_to([{"query": "a"}, {"query": "b"}])
+    # Same shape as a non-speculative tool_node update
+    messages = update["researcher_messages"]
+    assert_that([m.tool_call_id for m in messages]).is_equal_to(["call_1", "call_2"])
+    assert_that([m.content for m in messages]).is_equal_to(["results for a", "results for b"])
+    assert_that(update["tool_call_iterations"]).is_equal_to(1)
+    assert_that(speculative._pending).is_empty()
+
+
+def test_search_overlaps_generation(monkeypatch):
+    # 0.5s of streaming after the calls; the 0.2s searches finish within it
+    model = StreamingModel(delay=0.02, tail_chunks=25)
+    monkeypatch.setattr(research_agent, "model_with_tools", model)
+
+    async def run():
+        state = {"researcher_messages": [HumanMessage(content="q")]}
+        update = await research_agent.llm_call(state, {})
+        before_tools = time.perf_counter()
+        await research_agent.tool_node({**state, "researcher_messages": update["researcher_messages"]})
+        return time.perf_counter() - before_tools
+
+    tool_wait = asyncio.run(run())
+    assert_that(tool_wait).is_less_than(0.1)
+
+
+def test_changed_arguments_are_rerun():
+    async def run():
+        speculator = speculative.ToolCallSpeculator(research_agent.tools_by_name)
+        speculator._start("call_1", "slow_search", {"query": "draft"})
+        return await speculative.run_tool_call(
+            {"name": "slow_search", "args": {"query": "final"}, "id": "call_1"}, research_agent.tools_by_name
+        )
+
+    assert_that(asyncio.run(run())).is_equal_to("results for final")
+
+
+def test_unexecuted_calls_are_cancelled():
+    async def run():
+        speculator = speculative.ToolCallSpeculator(research_agent.tools_by_name)
+        speculator._start("call_1", "slow_search", {"query": "a"})
+        task = speculative._pending["call_1"][1]
+        message = AIMessage(content="", tool_calls=[{"name": "slow_search", "args": {"query": "a"}, "id": "call_1"}])
+        research_agent._drop_unanswered_tool_calls([message])
+        await asyncio.sleep(0)
+        return task
+
+    task = asyncio.run(run())
+    assert_that(task.cancelled()).is_true()
+    assert_that(speculative._pending).is_empty()
+
+
+def test_runs_have_separate_tables_and_orphans_are_cancelled():
+    tasks = {}
+
+    async def researcher(name, fail):
+        speculator = speculative.ToolCallSpeculator(research_agent.tools_by_name)
+        speculator._start("call_1", "slow_search", {"query": name})
+        tasks[name] = speculative._pending_calls()["call_1"][1]
+        await asyncio.sleep(0.01)
+        if fail:
+            raise RuntimeError("graph failed between llm_call and tool_node")
+        return await speculative.run_tool_call(
+            {"name": "slow_search", "args": {"query": name}, "id": "call_1"}, research_agent.tools_by_name
+        )
+
+    async def scoped(name, fail):
+        with speculative.speculation_scope():
+            return await researcher(name, fail)
+
+    async def run():
+        results = await asyncio.gather(scoped("a", False), scoped("b", True), return_exceptions=True)
+        await asyncio.sleep(0)
+        return results
+
+    results = asyncio.run(run())
+    assert_that(results[0]).is_equal_to("results for a")
+    assert_that(results[1]).is_instance_of(RuntimeError)
+    assert_that(tasks["b"].cancelled()).is_true()
+    assert_that(speculative._pending).is_empty()
+
+
+def test_supervisor_scopes_each_researcher(monkeypatch):
+    from types import SimpleNamespace
+
+    from langchain_core.messages import SystemMessage
+
+    import deep_research_from_scratch.multi_agent_supervisor as sup
+
+    tasks = []
+
+    async def failing_researcher(payload):
+        speculator = speculative.ToolCallSpeculator(research_agent.tools_by_name)
+        speculator._start("call_1", "slow_search", {"query": payload["research_topic"]})
+        tasks.append(speculative._pending_calls()["call_1"][1])
+        raise RuntimeError("researcher crashed")
+
+    monkeypatch.setattr(sup, "researcher_agent", SimpleNamespace(ainvoke=failing_researcher))
+    msg = SystemMessage(content="test")
+    setattr(msg, "tool_calls", [
+        {"name": "ConductResearch", "id": "t1", "args": {"research_topic": "A"}},
+        {"name": "ConductResearch", "id": "t2", "args": {"research_topic": "B"}},
+    ])
+    state = {"supervisor_messages": [msg], "research_brief": "b", "research_iterations": 0}
+
+    async def run():
+        await sup.supervisor_tools(state)
+        await asyncio.sleep(0)
+
+    asyncio.run(run())
+    assert_that(tasks).is_length(2)
+    assert_that([task.cancelled() for task in tasks]).is_equal_to([True, True])
+    assert_that(speculative._pending).is_empty()
+
+
+def test_tier_usage_of_speculative_runs_reaches_tool_node(monkeypatch):
+    from deep_research_from_scratch.model_router import record_tier_usage
+
+    @tool
+    async def summarizing_search(query: str) -> str:
+        """Search and summarize."""
+        record_tier_usage("small", elapsed_s=0.5)
+        return f"summary of {query}"
+
+    monkeypatch.setattr(research_agent, "tools_by_name", {"summarizing_search": summarizing_search})
+    call = {"name": "summarizing_search", "args": {"query": "a"}, "id": "call_1"}
+
+    async def run():
+        speculator = speculative.ToolCallSpeculator(research_agent.tools_by_name)
+        speculator._start("call_1", "summarizing_search", {"query": "a"})
+        await asyncio.sleep(0.01)
+        return await research_agent.tool_node({"researcher_messages": [AIMessage(content="", tool_calls=[call])]})
+
+    update = asyncio.run(run())
+    assert_that(update["researcher_messages"][0].content).is_equal_to("summary of a")
+    assert_that(update["model_tier_usage"]["small"]).contains_entry({"calls": 1}, {"elapsed_s": 0.5})
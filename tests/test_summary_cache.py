@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+from assertpy import assert_that
+
+from deep_research_from_scratch import utils
+from deep_research_from_scratch.state_research import Summary
+from deep_research_from_scratch.summary_cache import SummaryCache, make_cache_key
+
+
+def test_key_depends_on_content_prompt_and_model():
+    base = make_cache_key("page", "prompt", "gpt-4.1-mini")
+    assert_that(make_cache_key("page", "prompt", "gpt-4.1-mini")).is_equal_to(base)
+    assert_that(make_cache_key("page2", "prompt", "gpt-4.1-mini")).is_not_equal_to(base)
+    assert_that(make_cache_key("page", "prompt v2", "gpt-4.1-mini")).is_not_equal_to(base)
+    assert_that(make_cache_key("page", "prompt", "gpt-4.1")).is_not_equal_to(base)
+
+
+def test_memory_lru_eviction_and_counters():
+    cache = SummaryCache(max_memory_entries=2)
+    cache.put("a", "A", "p")
+    cache.put("b", "B", "p")
+    assert_that(cache.get("a")).is_equal_to("A")  # a becomes most recent
+    cache.put("c", "C", "p")  # evicts b
+    assert_that(cache.get("b")).is_none()
+    assert_that(cache.get("c")).is_equal_to("C")
+    assert_that(cache.stats.as_dict()).contains_entry({"memory_hits": 2}, {"misses": 1}, {"evictions": 1})
+
+
+def test_disk_tier_persists_and_evicts_by_size(tmp_path):
+    db = tmp_path / "summaries.sqlite"
+    cache = SummaryCache(path=db, max_memory_entries=1, max_disk_bytes=10)
+    cache.put("a", "12345", "p")
+    cache.put("b", "67890", "p")
+    cache.put("c", "abcde", "p")  # 15 bytes > 10: least recently used row (a) goes
+    cache.close()
+
+    reopened = SummaryCache(path=db)
+    assert_that(reopened.get("a")).is_none()
+    assert_that(reopened.get("b")).is_equal_to("67890")
+    assert_that(reopened.get("b")).is_equal_to("67890")
+    assert_that(reopened.stats.disk_hits).is_equal_to(1)
+    assert_that(reopened.stats.memory_hits).is_equal_to(1)
+
+
+def test_invalidate_prompt_drops_stale_rows(tmp_path):
+    cache = SummaryCache(path=tmp_path / "s.sqlite")
+    cache.put("old", "x", "prompt v1")
+    cache.put("new", "y", "prompt v2")
+    assert_that(cache.invalidate_prompt("prompt v2")).is_equal_to(1)
+    assert_that(cache.get("old")).is_none()
+    assert_that(cache.get("new")).is_equal_to("y")
+
+
+class CountingModel:
+    model_name = "counting-model"
+
+    def __init__(self, fail=False):
+        self.calls = 0
+        self.fail = fail
+
+    def with_structured_output(self, schema):
+        return self
+
+    def invoke(self, messages):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("boom")
+        return Summary(summary="s", key_excerpts="k")
+
+    async def ainvoke(self, messages):
+        return self.invoke(messages)
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = SummaryCache()
+    monkeypatch.setattr(utils, "_summary_cache", cache)
+    return cache
+
+
+def test_summarize_hits_cache_across_sync_and_async(monkeypatch, cache):
+    model = CountingModel()
+    monkeypatch.setattr(utils, "summarization_model", model)
+    first = utils.summarize_webpage_content("same page")
+    second = asyncio.run(utils.summarize_webpage_content_async("same page"))
+    assert_that(second).is_equal_to(first)
+    assert_that(model.calls).is_equal_to(1)
+    assert_that(cache.stats.hits).is_equal_to(1)
+
+
+def test_fallbacks_are_not_cached(monkeypatch, cache):
+    model = CountingModel(fail=True)
+    monkeypatch.setattr(utils, "summarization_model", model)
+    utils.summarize_webpage_content("flaky page")
+    utils.summarize_webpage_content("flaky page")
+    assert_that(model.calls).is_equal_to(2)
+    assert_that(cache.stats.writes).is_equal_to(0)
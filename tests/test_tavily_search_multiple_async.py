@@ -0,0 +1,40 @@
+import asyncio
+
+import pytest
+from assertpy import assert_that
+
+from deep_research_from_scratch import utils
+from research_agent_framework.adapters.search.mock_tavily_client import MockAsyncTavilyClient, MockTavilyClient
+
+
+def test_results_keep_input_order_and_respect_cap():
+    client = MockAsyncTavilyClient(latency=0.01)
+    queries = [f"q{i}" for i in range(6)]
+    results = asyncio.run(utils.tavily_search_multiple_async(queries, max_concurrency=2, client=client))
+    assert_that([r["query"] for r in results]).is_equal_to(queries)
+    assert_that(client.max_in_flight, description="semaphore should cap in-flight searches").is_equal_to(2)
+
+
+def test_errors_are_captured_per_query():
+    client = MockAsyncTavilyClient(fail_on=["bad"])
+    results = asyncio.run(utils.tavily_search_multiple_async(["good", "bad", "also good"], client=client))
+    assert_that(results[1]["results"]).is_empty()
+    assert_that(results[1]["error"]).contains("mock search failure")
+    assert_that(results[0]["results"]).is_not_empty()
+    assert_that(results[2]["results"]).is_not_empty()
+    # Failed slots stay compatible with the downstream helpers
+    assert_that(utils.deduplicate_search_results(results)).is_length(6)
+
+
+def test_blocking_client_runs_in_threads():
+    client = MockTavilyClient()
+    results = asyncio.run(utils.tavily_search_multiple_async(["a", "b"], max_results=1, client=client))
+    assert_that([r["query"] for r in results]).is_equal_to(["a", "b"])
+    assert_that(results[0]["results"]).is_length(1)
+
+
+def test_missing_client_raises(monkeypatch):
+    monkeypatch.setattr(utils, "tavily_client", None)
+    monkeypatch.setattr(utils, "async_tavily_client", None)
+    with pytest.raises(NotImplementedError):
+        asyncio.run(utils.tavily_search_multiple_async(["a"]))
@@ -0,0 +1,208 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from assertpy import assert_that
+from langchain_core.messages import SystemMessage
+
+from deep_research_from_scratch import utils
+from deep_research_from_scratch.state_research import Summary
+from deep_research_from_scratch.url_registry import (
+    UrlRegistry,
+    get_current_url_registry,
+    get_url_registry,
+    release_url_registry,
+    use_url_registry,
+)
+
+
+class SlowCountingModel:
+    model_name = "slow-counting-model"
+
+    def __init__(self):
+        self.calls = 0
+
+    def with_structured_output(self, schema):
+        return self
+
+    def invoke(self, messages):
+        self.calls += 1
+        return Summary(summary="s", key_excerpts="k")
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        await asyncio.sleep(0.02)
+        return Summary(summary="s", key_excerpts="k")
+
+
+@pytest.fixture(autouse=True)
+def no_summary_cache(monkeypatch):
+    monkeypatch.setattr(utils, "get_summary_cache", lambda: None)
+
+
+def _results(*urls):
+    return {url: {"title": url, "content": "snippet", "raw_content": f"page {url}"} for url in urls}
+
+
+def test_claim_and_reuse():
+    registry = UrlRegistry()
+    value, reused = registry.get_or_process("u", lambda: "first")
+    assert_that((value, reused)).is_equal_to(("first", False))
+    value, reused = registry.get_or_process("u", lambda: "second")
+    assert_that((value, reused)).is_equal_to(("first", True))
+    assert_that(registry.stats.processed).is_equal_to(1)
+    assert_that(registry.stats.reused).is_equal_to(1)
+
+
+def test_failed_owner_releases_url():
+    registry = UrlRegistry()
+
+    def boom():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        registry.get_or_process("u", boom)
+    assert_that("u" in registry).is_false()
+    assert_that(registry.get_or_process("u", lambda: "retry")).is_equal_to(("retry", False))
+
+
+def test_parallel_researchers_share_in_flight_summaries(monkeypatch):
+    model = SlowCountingModel()
+    monkeypatch.setattr(utils, "summarization_model", model)
+
+    async def run():
+        with use_url_registry(UrlRegistry()) as registry:
+            first, second = await asyncio.gather(
+                utils.process_search_results_async(_results("https://a", "https://b")),
+                utils.process_search_results_async(_results("https://b", "https://c")),
+            )
+        return registry, first, second
+
+    registry, first, second = asyncio.run(run())
+    assert_that(model.calls, description="https://b should be summarized once").is_equal_to(3)
+    assert_that(registry.stats.awaited_in_flight).is_equal_to(1)
+    assert_that(second["https://b"]["content"]).is_equal_to(first["https://b"]["content"])
+    assert_that(second["https://b"]).contains_entry({"reused": True})
+
+
+def test_sync_pipeline_consults_registry(monkeypatch):
+    model = SlowCountingModel()
+    monkeypatch.setattr(utils, "summarization_model", model)
+    with use_url_registry(UrlRegistry()):
+        utils.process_search_results(_results("https://a"))
+        utils.process_search_results(_results("https://a"))
+    assert_that(model.calls).is_equal_to(1)
+    assert_that(get_current_url_registry()).is_none()
+
+
+def test_sync_and_async_pipelines_share_one_payload_shape(monkeypatch):
+    model = SlowCountingModel()
+    monkeypatch.setattr(utils, "summarization_model", model)
+
+    async def run():
+        with use_url_registry(UrlRegistry()):
+            first = utils.process_search_results(_results("https://a"))
+            second = await utils.process_search_results_async(_results("https://a", "https://b"))
+            third = utils.process_search_results(_results("https://b"))
+        return first, second, third
+
+    first, second, third = asyncio.run(run())
+    assert_that(model.calls).is_equal_to(2)
+    assert_that(second["https://a"]["content"]).is_equal_to(first["https://a"]["content"])
+    assert_that(second["https://a"]).contains_entry({"reused": True})
+    assert_that(third["https://b"]["content"]).is_equal_to(second["https://b"]["content"])
+
+
+@pytest.mark.parametrize("packing", [False, True])
+def test_summaries_are_shared_only_for_the_same_filtered_text(monkeypatch, packing):
+    from research_agent_framework.config import get_settings
+
+    model = SlowCountingModel()
+    monkeypatch.setattr(utils, "summarization_model", model)
+    monkeypatch.setattr(get_settings(), "relevance_filter_max_chars", 60)
+    monkeypatch.setattr(get_settings(), "summary_packing_enabled", packing)
+    page = {"https://a": {
+        "title": "a",
+        "content": "snippet",
+        "raw_content": "Sightglass roasts coffee in SOMA.\n\nTartine bakes bread in the Mission.\n\nFooter links.",
+    }}
+
+    async def run():
+        with use_url_registry(UrlRegistry()) as registry:
+            await asyncio.gather(
+                utils.process_search_results_async(page, query="coffee roasting"),
+                utils.process_search_results_async(page, query="bread bakery"),
+            )
+            utils.process_search_results(page, query="coffee roasting")
+        return registry
+
+    registry = asyncio.run(run())
+    assert_that(model.calls, description="each query filters the page differently").is_equal_to(2)
+    assert_that(registry.stats.processed).is_equal_to(2)
+
+
+def test_run_registries_are_keyed_and_released():
+    registry = get_url_registry("run-1")
+    assert_that(get_url_registry("run-1")).is_same_as(registry)
+    assert_that(get_url_registry("run-2")).is_not_same_as(registry)
+    assert_that(release_url_registry("run-1")).is_same_as(registry)
+    assert_that(get_url_registry("run-1")).is_not_same_as(registry)
+    release_url_registry("run-1")
+    release_url_registry("run-2")
+
+
+def test_supervisor_researchers_see_run_registry(monkeypatch):
+    import deep_research_from_scratch.multi_agent_supervisor as sup
+
+    seen = []
+
+    async def stub_ainvoke(payload):
+        seen.append(get_current_url_registry())
+        return {"compressed_research": "done", "raw_notes": []}
+
+    monkeypatch.setattr(sup, "researcher_agent", SimpleNamespace(ainvoke=stub_ainvoke))
+    msg = SystemMessage(content="test")
+    setattr(msg, "tool_calls", [
+        {"name": "ConductResearch", "id": "t1", "args": {"research_topic": "A"}},
+        {"name": "ConductResearch", "id": "t2", "args": {"research_topic": "B"}},
+    ])
+    state = {"supervisor_messages": [msg], "research_brief": "b", "research_iterations": 0, "run_id": "run-x"}
+    asyncio.run(sup.supervisor_tools(state))
+    assert_that(seen).is_length(2)
+    assert_that(seen[0]).is_same_as(seen[1]).is_same_as(get_url_registry("run-x"))
+    release_url_registry("run-x")
+
+
+def test_aborted_supervisor_steps_release_run_registry(monkeypatch):
+    import deep_research_from_scratch.multi_agent_supervisor as sup
+    from deep_research_from_scratch.url_registry import _run_registries
+
+    async def hang(payload):
+        get_current_url_registry().claim("https://a")
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(sup, "researcher_agent", SimpleNamespace(ainvoke=hang))
+    msg = SystemMessage(content="test")
+    setattr(msg, "tool_calls", [{"name": "ConductResearch", "id": "t1", "args": {"research_topic": "A"}}])
+    state = {"supervisor_messages": [msg], "research_brief": "b", "research_iterations": 0, "run_id": "run-cancelled"}
+
+    async def cancel_mid_research():
+        task = asyncio.create_task(sup.supervisor_tools(state))
+        await asyncio.sleep(0.05)
+        assert_that(_run_registries).contains_key("run-cancelled")
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_mid_research())
+    assert_that(_run_registries).does_not_contain_key("run-cancelled")
+
+    class FailingModel:
+        async def ainvoke(self, messages):
+            raise RuntimeError("provider down")
+
+    get_url_registry("run-failed")
+    monkeypatch.setattr(sup, "supervisor_model_with_tools", FailingModel())
+    with pytest.raises(RuntimeError):
+        asyncio.run(sup.supervisor({"supervisor_messages": [], "run_id": "run-failed"}))
+    assert_that(_run_registries).does_not_contain_key("run-failed")